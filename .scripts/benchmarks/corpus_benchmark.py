@@ -0,0 +1,205 @@
+"""
+Synthetic Corpus Benchmark
+--------------------------
+Measures how yaml-manager.py and tags-manager.py scale: a synthetic blog of
+each requested size is generated (see synthetic_corpus.py), then every
+subcommand is run against it as a separate process and measured:
+
+- wall time;
+- peak RSS (maximum resident set size of the command's process);
+- throughput (files per second).
+
+Read-only yaml-manager actions run twice: 'cold' (no front matter index in
+.cache/) then 'warm' (index filled by the previous run). Mutating actions
+(add-key, reorder, apply-plan, rename...) run last, in a fixed order, each one on the
+result of the previous one.
+
+Usage (from the root of the repository):
+
+    python .scripts/benchmarks/corpus_benchmark.py --sizes 1000,10000
+    python .scripts/benchmarks/corpus_benchmark.py --sizes 100000 --output results.json
+    python .scripts/benchmarks/corpus_benchmark.py --only yaml-manager:check-all --json
+
+Works on Linux and macOS (peak RSS comes from os.wait4()).
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from synthetic_corpus import generate_corpus
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+YAML_MANAGER: str = str(SCRIPTS_DIR / 'yaml-manager.py')
+TAGS_MANAGER: str = str(SCRIPTS_DIR / 'tags-manager.py')
+
+DEFAULT_SIZES: List[int] = [1000, 10000, 100000]
+
+# Plan of the apply-plan command, written at the root of each corpus (outside blog/)
+PLAN_FILE: str = 'benchmark-plan.yaml'
+PLAN: str = (
+    "- rename: {from: Title, to: title}\n"
+    "- default: {key: language, value: en}\n"
+    "- lowercase: tags\n"
+)
+
+
+class Command(NamedTuple):
+    """One benchmarked command line (run from the root of the synthetic corpus)."""
+    tool: str
+    name: str
+    argv: List[str]
+    mutates: bool = False
+
+
+# Read-only commands first, then the mutating ones, in the order they are applied
+COMMANDS: List[Command] = [
+    Command('yaml-manager', 'list-keys', [YAML_MANAGER, 'list-keys']),
+    Command('yaml-manager', 'list-values', [YAML_MANAGER, 'list-values', 'tags']),
+    Command('yaml-manager', 'find-missing', [YAML_MANAGER, 'find-missing', 'language']),
+    Command('yaml-manager', 'find-present', [YAML_MANAGER, 'find-present', 'updated']),
+    Command('yaml-manager', 'check-mandatory', [YAML_MANAGER, 'check-mandatory']),
+    Command('yaml-manager', 'check-seo', [YAML_MANAGER, 'check-seo']),
+    Command('yaml-manager', 'check-duplicates', [YAML_MANAGER, 'check-duplicates']),
+    Command('yaml-manager', 'check-all', [YAML_MANAGER, 'check-all']),
+    Command('yaml-manager', 'check-unique', [YAML_MANAGER, 'check-unique']),
+    Command('yaml-manager', 'check-order', [YAML_MANAGER, 'check-order']),
+    Command('yaml-manager', 'query', [YAML_MANAGER, 'query', 'tags contains docker and date >= 2024-01-01 and not image']),
+    Command('yaml-manager', 'export', [YAML_MANAGER, 'export', '--format', 'sqlite']),
+    Command('tags-manager', 'list', [TAGS_MANAGER, 'list']),
+    Command('yaml-manager', 'add-key', [YAML_MANAGER, 'add-key', 'language,en'], mutates=True),
+    Command('yaml-manager', 'cleanup-variants', [YAML_MANAGER, 'cleanup-variants', 'canonicalUrl', 'canonical_url'], mutates=True),
+    Command('yaml-manager', 'remove-key', [YAML_MANAGER, 'remove-key', 'updated'], mutates=True),
+    Command('yaml-manager', 'reorder', [YAML_MANAGER, 'reorder'], mutates=True),
+    Command('yaml-manager', 'apply-plan', [YAML_MANAGER, 'apply-plan', PLAN_FILE], mutates=True),
+    Command('yaml-manager', 'sync-dates', [YAML_MANAGER, 'sync-dates', '--overwrite'], mutates=True),
+    Command('tags-manager', 'rename', [TAGS_MANAGER, 'rename', 'tips,tip'], mutates=True),
+    Command('tags-manager', 'delete', [TAGS_MANAGER, 'delete', 'tutorial'], mutates=True),
+]
+
+
+def _run(argv: List[str], cwd: str) -> Dict[str, Any]:
+    """Runs one command and returns its exit code, wall time and peak RSS."""
+    start: float = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable] + argv,
+        cwd=cwd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    _, status, usage = os.wait4(process.pid, 0)
+    wall: float = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+
+    # ru_maxrss is in kilobytes on Linux, in bytes on macOS
+    rss_bytes: int = usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+    return {
+        'exit_code': process.returncode,
+        'wall_seconds': wall,
+        'peak_rss_mb': rss_bytes / (1024 * 1024),
+    }
+
+
+def _clear_cache(corpus_root: str) -> None:
+    """Removes the front matter index (and the SQLite export) of the corpus."""
+    shutil.rmtree(os.path.join(corpus_root, '.cache'), ignore_errors=True)
+
+
+def benchmark_size(size: int, commands: List[Command], workdir: str, seed: int) -> List[Dict[str, Any]]:
+    """Generates a corpus of `size` posts and runs every command on it."""
+    corpus_root: str = os.path.join(workdir, f'corpus-{size}')
+    print(f"Generating {size} posts in {corpus_root}...", file=sys.stderr)
+    generate_corpus(corpus_root, size, seed=seed)
+    with open(os.path.join(corpus_root, PLAN_FILE), 'w', encoding='utf-8') as f:
+        f.write(PLAN)
+
+    results: List[Dict[str, Any]] = []
+    for command in commands:
+        # Read-only yaml-manager actions: once without index, once with it
+        runs: List[Optional[str]] = ['cold', 'warm'] if command.tool == 'yaml-manager' and not command.mutates else [None]
+        for cache in runs:
+            if cache == 'cold':
+                _clear_cache(corpus_root)
+            measure: Dict[str, Any] = _run(command.argv, corpus_root)
+            result: Dict[str, Any] = {
+                'size': size,
+                'tool': command.tool,
+                'command': command.name,
+                'cache': cache,
+                **measure,
+                'files_per_second': size / measure['wall_seconds'] if measure['wall_seconds'] > 0 else None,
+            }
+            results.append(result)
+            label: str = f"{command.tool} {command.name}" + (f" ({cache})" if cache else '')
+            print(
+                f"  {label:<40} {measure['wall_seconds']:>8.2f} s "
+                f"{measure['peak_rss_mb']:>8.1f} MB {result['files_per_second']:>10.0f} files/s",
+                file=sys.stderr
+            )
+
+    shutil.rmtree(corpus_root, ignore_errors=True)
+    return results
+
+
+def main() -> None:
+    """Main execution function for the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark yaml-manager.py and tags-manager.py on synthetic corpora.")
+    parser.add_argument("--sizes", default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help="Comma-separated corpus sizes, in posts (default: 1000,10000,100000).")
+    parser.add_argument("--only", default="",
+                        help="Comma-separated 'tool:command' filters (e.g. 'yaml-manager:check-all,tags-manager:list').")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed of the generated corpora (default: 42).")
+    parser.add_argument("--workdir", default=None, help="Where the corpora are generated (default: a temporary directory).")
+    parser.add_argument("--output", default=None, help="Also write the JSON report to this file.")
+    parser.add_argument("--json", action="store_true", help="Print the JSON report on stdout.")
+    args = parser.parse_args()
+
+    sizes: List[int] = [int(size) for size in args.sizes.split(',') if size.strip()]
+    filters: List[str] = [item.strip() for item in args.only.split(',') if item.strip()]
+    commands: List[Command] = [
+        command for command in COMMANDS
+        if not filters or f"{command.tool}:{command.name}" in filters
+    ]
+    if not commands:
+        print(f"ERROR: No command matches '{args.only}'.")
+        sys.exit(1)
+
+    workdir: str = args.workdir or tempfile.mkdtemp(prefix='blog-benchmark-')
+    os.makedirs(workdir, exist_ok=True)
+
+    results: List[Dict[str, Any]] = []
+    try:
+        for size in sizes:
+            results.extend(benchmark_size(size, commands, workdir, args.seed))
+    finally:
+        if args.workdir is None:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report: Dict[str, Any] = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'seed': args.seed,
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}", file=sys.stderr)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Git Changes Check
+-----------------
+Regression check of the posts selected by `--since` / `--staged`
+(blog_corpus.git_changes.changed_posts()), run in a throwaway git repository:
+
+1. a new post not added to git yet is selected by `--since HEAD`;
+2. a staged post with a non-ASCII path ('café/index.md') is selected by
+   `--staged` and `--since HEAD` (git quotes such paths unless -z is used);
+3. an untracked post ignored by .gitignore is never selected.
+
+Prints one line per case and exits with 1 when a case fails.
+
+Usage (from the root of the repository):
+
+    python .scripts/benchmarks/git_changes_check.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Tuple
+
+# --- PATH PATCH ---
+# Ensures the shared 'blog_corpus' package (in .scripts/) is found regardless of execution context
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+# ------------------
+
+from blog_corpus.git_changes import changed_posts
+
+DOCS_DIR: str = 'blog'
+COMMITTED: str = os.path.join(DOCS_DIR, '2024', '01', '01', 'committed', 'index.md')
+UNTRACKED: str = os.path.join(DOCS_DIR, '2099', '01', '01', 'new', 'index.md')
+STAGED: str = os.path.join(DOCS_DIR, '2099', '01', '02', 'café', 'index.md')
+IGNORED: str = os.path.join(DOCS_DIR, '2099', '01', '03', 'ignored', 'index.md')
+
+
+def _git(*args: str) -> None:
+    subprocess.run(['git', *args], check=True, capture_output=True)
+
+
+def _write_post(path: str, title: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"---\ntitle: {title}\n---\n\nBody.\n")
+
+
+def run() -> List[Tuple[str, bool]]:
+    """Builds the repository in the current directory and returns the (case, passed) results."""
+    _git('init', '-q')
+    _git('config', 'user.email', 'check@example.com')
+    _git('config', 'user.name', 'check')
+    _write_post(COMMITTED, 'Committed')
+    with open('.gitignore', 'w', encoding='utf-8') as f:
+        f.write(f"{os.path.dirname(IGNORED)}/\n")
+    _git('add', '.')
+    _git('commit', '-q', '-m', 'initial')
+
+    _write_post(UNTRACKED, 'New')
+    _write_post(STAGED, 'Café')
+    _write_post(IGNORED, 'Ignored')
+    _git('add', STAGED)
+
+    since: List[str] = changed_posts(DOCS_DIR, since='HEAD')
+    staged: List[str] = changed_posts(DOCS_DIR, staged=True)
+    return [
+        ("--since HEAD selects the untracked new post", UNTRACKED in since),
+        ("--since HEAD selects the staged non-ASCII post", STAGED in since),
+        ("--staged selects the staged non-ASCII post", staged == [STAGED]),
+        ("the ignored post is never selected", IGNORED not in since + staged),
+        ("the unchanged post is never selected", COMMITTED not in since + staged),
+    ]
+
+
+def main() -> None:
+    previous: str = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='git-changes-check-') as workdir:
+        os.chdir(workdir)
+        try:
+            results: List[Tuple[str, bool]] = run()
+        finally:
+            os.chdir(previous)
+
+    for name, passed in results:
+        print(f"{'ok  ' if passed else 'FAIL'} {name}")
+
+    if not all(passed for _, passed in results):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
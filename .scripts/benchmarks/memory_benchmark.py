@@ -0,0 +1,160 @@
+"""
+Memory Benchmark
+----------------
+Measures the memory held by the parsed front matter of a large blog (100k
+posts by default), for the representations used by the scripts:
+
+1. records: one PostRecord per post with a plain metadata dict (the front
+   matter index before the strings were interned);
+2. interned: the PostRecord of the front matter index, keys and list items
+   (tags, authors...) interned (blog_corpus.frontmatter_index);
+3. compact: the CompactPost records of a PostTable, keys, tags and authors
+   as ids in arrays (blog_corpus.compact; list-keys, find-*, tags list).
+
+The headers come from synthetic_corpus.py (same generator and seed, so the
+numbers are comparable between runs) and are kept in memory: no file is
+written. Retained memory is measured with tracemalloc, build time in a
+separate, untraced run.
+
+Usage (from the root of the repository):
+
+    python .scripts/benchmarks/memory_benchmark.py
+    python .scripts/benchmarks/memory_benchmark.py --posts 10000 --json
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+# --- PATH PATCH ---
+# Ensures the shared 'blog_corpus' package (in .scripts/) is found regardless of execution context
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+# ------------------
+
+from blog_corpus import split_header
+from blog_corpus.compact import PostTable
+from blog_corpus.frontmatter_index import PostRecord, extract_raw_keys, parse_post_header
+from blog_corpus.yaml_backend import DEFAULT_BACKEND
+from synthetic_corpus import _front_matter
+
+DOCS_DIR: str = 'blog'
+
+
+def _generate_headers(posts: int, seed: int) -> List[Tuple[str, str]]:
+    """(path, '---' block) of `posts` synthetic posts, dated like synthetic_corpus.generate_corpus()."""
+    rng: random.Random = random.Random(seed)
+    start: datetime.date = datetime.date(2018, 1, 1)
+    days: int = (datetime.date(2026, 12, 31) - start).days
+
+    headers: List[Tuple[str, str]] = []
+    for index in range(posts):
+        date: datetime.date = start + datetime.timedelta(days=rng.randint(0, days))
+        lines: List[str] = _front_matter(rng, index, date)
+        slug: str = lines[0].split(': ', 1)[1]
+        path: str = os.path.join(DOCS_DIR, f'{date:%Y}', f'{date:%m}', f'{date:%d}', slug, 'index.md')
+        headers.append((path, '---\n' + '\n'.join(lines) + '\n---\n'))
+    return headers
+
+
+def _build_records(headers: List[Tuple[str, str]]) -> Any:
+    records: Dict[str, PostRecord] = {}
+    for path, header in headers:
+        metadata: Any = DEFAULT_BACKEND.load(split_header(header))
+        records[path] = PostRecord(dict(metadata), extract_raw_keys(header))
+    return records
+
+
+def _build_interned(headers: List[Tuple[str, str]]) -> Any:
+    return {path: parse_post_header(header) for path, header in headers}
+
+
+def _build_compact(headers: List[Tuple[str, str]]) -> Any:
+    table: PostTable = PostTable()
+    for path, header in headers:
+        table.add(path, DEFAULT_BACKEND.load(split_header(header)))
+    return table
+
+
+# Representation name -> function building it from the headers
+BUILDERS: Dict[str, Callable[[List[Tuple[str, str]]], Any]] = {
+    'records': _build_records,
+    'interned': _build_interned,
+    'compact': _build_compact,
+}
+
+
+def _measure(build: Callable[[List[Tuple[str, str]]], Any], headers: List[Tuple[str, str]]) -> Dict[str, float]:
+    """Build time (untraced run), then retained and peak memory of the result (traced run), in bytes."""
+    gc.collect()
+    start: float = time.perf_counter()
+    result: Any = build(headers)
+    seconds: float = time.perf_counter() - start
+    del result
+    gc.collect()
+
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    result = build(headers)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return {'seconds': seconds, 'retained_bytes': retained - before, 'peak_bytes': peak - before}
+
+
+def run(posts: int, seed: int) -> Dict[str, Any]:
+    headers: List[Tuple[str, str]] = _generate_headers(posts, seed)
+    results: Dict[str, Dict[str, float]] = {name: _measure(build, headers) for name, build in BUILDERS.items()}
+
+    baseline: float = results['records']['retained_bytes']
+    for result in results.values():
+        result['bytes_per_post'] = result['retained_bytes'] / posts
+        result['ratio'] = result['retained_bytes'] / baseline if baseline else 0.0
+
+    return {'posts': posts, 'seed': seed, 'backend': DEFAULT_BACKEND.name, 'results': results}
+
+
+def _print_report(report: Dict[str, Any]) -> None:
+    print(f"{report['posts']} posts (seed {report['seed']}, YAML backend: {report['backend']})\n")
+    print(f"{'representation':<16}{'retained':>12}{'per post':>12}{'peak':>12}{'ratio':>8}{'build':>10}")
+    for name, result in report['results'].items():
+        print(
+            f"{name:<16}"
+            f"{result['retained_bytes'] / 1_048_576:>9.1f} MB"
+            f"{result['bytes_per_post']:>10.0f} B"
+            f"{result['peak_bytes'] / 1_048_576:>9.1f} MB"
+            f"{result['ratio']:>8.2f}"
+            f"{result['seconds']:>9.2f}s"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Memory held by the parsed front matter of a synthetic blog.")
+    parser.add_argument('--posts', type=int, default=100000, help="Number of posts (default: 100000).")
+    parser.add_argument('--seed', type=int, default=42, help="Random seed of the generated headers (default: 42).")
+    parser.add_argument('--json', action='store_true', help="Print the results as JSON.")
+    args = parser.parse_args()
+
+    if args.posts < 1:
+        parser.error("--posts must be at least 1.")
+
+    report: Dict[str, Any] = run(args.posts, args.seed)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+"""
+Synthetic Docusaurus Corpus
+---------------------------
+Generates a fake but realistic blog (`blog/YYYY/MM/DD/<slug>/index.md`) to
+measure how the scripts of .scripts/ scale beyond the size of the real blog.
+
+The generation is deterministic (seeded): the same size and seed always give
+the same files, so two benchmark runs are comparable.
+
+The front matter mimics the real posts (slug, title, date, description,
+authors, image, mainTag, tags, language) with the kind of defects the
+scripts look for, in small proportions: missing keys, descriptions too short
+or too long, uppercase tags, literal (`Title`) and conceptual
+(`canonicalUrl` + `canonical_url`) duplicate keys, block-style tag lists.
+Bodies are a few paragraphs, with headings and code blocks.
+
+Usage as a script (from the root of the repository):
+
+    python .scripts/benchmarks/synthetic_corpus.py /tmp/corpus --posts 10000
+"""
+
+import argparse
+import datetime
+import os
+import random
+from typing import List
+
+# Shared vocabulary, so that tags and titles overlap like in a real blog
+TOPICS: List[str] = [
+    'docker', 'php', 'python', 'linux', 'git', 'vscode', 'bash', 'wsl', 'mysql', 'ai',
+    'ollama', 'laravel', 'symfony', 'composer', 'javascript', 'typescript', 'node', 'nginx',
+    'apache', 'ssh', 'security', 'testing', 'ci', 'github', 'gitlab', 'markdown', 'docusaurus',
+    'yaml', 'json', 'regex', 'excel', 'vba', 'powershell', 'windows', 'kubernetes', 'traefik',
+    'postgresql', 'redis', 'code-quality', 'rector', 'phpunit', 'phpstan', 'makefile', 'tips',
+    'tutorial', 'self-hosted', 'backup', 'networking', 'performance', 'database',
+]
+
+WORDS: List[str] = (
+    'the a to of and in how with for using your from on container image build run script '
+    'configure install update fix debug deploy write read fast simple better tool file '
+    'project command line server local remote setup quickly easily properly without'
+).split()
+
+CODE_LANGUAGES: List[str] = ['bash', 'php', 'python', 'yaml', 'json', 'dockerfile', 'javascript']
+
+AUTHORS: List[str] = ['christophe', 'guest']
+
+
+def _sentence(rng: random.Random, min_words: int, max_words: int) -> str:
+    words: List[str] = [rng.choice(WORDS + TOPICS) for _ in range(rng.randint(min_words, max_words))]
+    return ' '.join(words).capitalize()
+
+
+def _tags(rng: random.Random) -> List[str]:
+    """2 to 6 tags; popular topics are more likely (roughly Zipf-like)."""
+    count: int = rng.randint(2, 6)
+    tags: List[str] = []
+    while len(tags) < count:
+        tag: str = TOPICS[min(int(rng.paretovariate(1.2)) - 1, len(TOPICS) - 1)]
+        tag = tag if rng.random() > 0.1 else rng.choice(TOPICS)
+        if tag not in tags:
+            tags.append(tag)
+    if rng.random() < 0.02:
+        tags[0] = tags[0].capitalize()  # Case variant, flagged by check-seo and tags list
+    return tags
+
+
+def _front_matter(rng: random.Random, index: int, date: datetime.date) -> List[str]:
+    """Front matter lines (without the '---' boundaries) of one post."""
+    title: str = _sentence(rng, 3, 10)
+    slug: str = f"{'-'.join(title.lower().split()[:6])}-{index}"
+    tags: List[str] = _tags(rng)
+
+    description_words: int = rng.choice([4, 15, 20, 25, 30, 45])  # Some too short, some too long
+    description: str = _sentence(rng, description_words, description_words)
+
+    lines: List[str] = [
+        f'slug: {slug}',
+        f'title: {title}',
+        f'date: {date.isoformat()}',
+        f'description: {description}',
+        f'authors: [{rng.choice(AUTHORS)}]',
+        f'image: /img/v2/{tags[0].lower()}.webp',
+        f'mainTag: {tags[0].lower()}',
+    ]
+
+    if rng.random() < 0.05:
+        # Block-style list, rewritten in flow style by reorder
+        lines.append('tags:')
+        lines.extend(f'  - {tag}' for tag in tags)
+    else:
+        lines.append(f"tags: [{', '.join(tags)}]")
+
+    if rng.random() < 0.9:
+        lines.append('language: en')
+    if rng.random() < 0.2:
+        lines.append(f'updated: {(date + datetime.timedelta(days=rng.randint(1, 400))).isoformat()}')
+    if rng.random() < 0.01:
+        lines.append(f'Title: {title}')  # Literal duplicate
+    if rng.random() < 0.01:
+        lines.append(f'canonicalUrl: https://example.com/{slug}')
+        lines.append(f'canonical_url: https://example.com/{slug}')  # Conceptual duplicate
+    if rng.random() < 0.03:
+        # Missing mandatory key
+        lines = [line for line in lines if not line.startswith('image:')]
+
+    if rng.random() < 0.3:
+        # Not always in the standard order (reorder has work to do)
+        lines[1], lines[3] = lines[3], lines[1]
+    return lines
+
+
+def _body(rng: random.Random, paragraphs: int) -> str:
+    """Markdown body: paragraphs, a truncate marker, headings and code blocks."""
+    parts: List[str] = [_sentence(rng, 20, 60) + '.', '<!-- truncate -->']
+    for i in range(paragraphs):
+        if i % 3 == 0:
+            parts.append(f'## {_sentence(rng, 2, 6)}')
+        parts.append(' '.join(_sentence(rng, 8, 25) + '.' for _ in range(rng.randint(2, 6))))
+        if rng.random() < 0.4:
+            language: str = rng.choice(CODE_LANGUAGES)
+            code: str = '\n'.join(_sentence(rng, 2, 8).lower() for _ in range(rng.randint(3, 15)))
+            parts.append(f'```{language}\n{code}\n```')
+    return '\n\n'.join(parts) + '\n'
+
+
+def generate_corpus(root: str, posts: int, seed: int = 42, docs_dir: str = 'blog') -> List[str]:
+    """
+    Writes `posts` posts under `root/docs_dir` and returns their paths.
+    Dates are spread over the last years, several posts can share a day.
+    """
+    rng: random.Random = random.Random(seed)
+    start: datetime.date = datetime.date(2018, 1, 1)
+    days: int = (datetime.date(2026, 12, 31) - start).days
+
+    paths: List[str] = []
+    for index in range(posts):
+        date: datetime.date = start + datetime.timedelta(days=rng.randint(0, days))
+        lines: List[str] = _front_matter(rng, index, date)
+        slug: str = lines[0].split(': ', 1)[1]
+
+        directory: str = os.path.join(root, docs_dir, f'{date:%Y}', f'{date:%m}', f'{date:%d}', slug)
+        os.makedirs(directory, exist_ok=True)
+        path: str = os.path.join(directory, 'index.md')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('---\n' + '\n'.join(lines) + '\n---\n\n' + _body(rng, rng.randint(3, 12)))
+        paths.append(path)
+
+    return paths
+
+
+def main() -> None:
+    """Generates a corpus from the command line."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic Docusaurus blog for benchmarks.")
+    parser.add_argument("root", help="Target directory (the posts are written in <root>/blog).")
+    parser.add_argument("--posts", type=int, default=1000, help="Number of posts (default: 1000).")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42).")
+    args = parser.parse_args()
+
+    paths: List[str] = generate_corpus(args.root, args.posts, seed=args.seed)
+    print(f"{len(paths)} post(s) written in {os.path.join(args.root, 'blog')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+Tag Merge Benchmark
+-------------------
+Times the merge candidates of `tags list` (tags that look like the same tag:
+singular/plural, small prefix/suffix) on a large synthetic tag vocabulary
+(50k distinct tags by default):
+
+1. pairwise: the previous implementation, every pair of tags compared (O(n²));
+2. indexed: blog_corpus.tag_similarity.merge_candidates(), each tag looking up
+   its own shorter substrings in a dict.
+
+Comparing 50k tags pairwise takes more than a billion comparisons, so the
+pairwise version only runs on a sample (--sample, the first tags of the
+vocabulary): both versions must return the same pairs on it, and the time of
+the pairwise version on the whole vocabulary is extrapolated (n² / 2 pairs).
+
+The typos of `tags list --fuzzy` (fuzzy_candidates(), SymSpell deletion index)
+are timed the same way, against the edit distance of every pair of a smaller
+sample (--fuzzy-sample), and on a quarter, half and all of the tags to show
+how the time grows with the vocabulary.
+
+Usage (from the root of the repository):
+
+    python .scripts/benchmarks/tag_merge_benchmark.py
+    python .scripts/benchmarks/tag_merge_benchmark.py --tags 100000 --sample 5000 --fuzzy-distance 2 --json
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Set, Tuple
+
+# --- PATH PATCH ---
+# Ensures the shared 'blog_corpus' package (in .scripts/) is found regardless of execution context
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+# ------------------
+
+from blog_corpus.tag_similarity import FUZZY_MIN_LENGTH, edit_distance, fuzzy_candidates, merge_candidates, normalize_exceptions
+from synthetic_corpus import TOPICS, WORDS
+
+# Same settings as tags-manager.py and tags_manager/config.py
+MAX_LENGTH_DIFFERENCE: int = 3
+MERGE_EXCEPTIONS: Set[Tuple[str, str]] = {
+    ('ftp', 'sftp'), ('git', 'github'), ('git', 'gitlab'), ('mysql', 'sql'), ('php', 'phpcbf'),
+    ('php', 'phpcs'), ('php', 'phpdoc'), ('scp', 'winscp'), ('ssh', 'sshpass'), ('xml', 'xmlstarlet'),
+}
+
+# Small changes that turn a tag into a likely duplicate of itself
+VARIANTS: List[Callable[[str], str]] = [
+    lambda tag: tag + 's',
+    lambda tag: tag.capitalize(),
+    lambda tag: tag + '-js',
+    lambda tag: 'go' + tag,
+    lambda tag: tag[:-1],
+]
+
+
+def generate_tags(count: int, seed: int) -> List[str]:
+    """`count` distinct tags: topics, compound tags ('docker-build-fast') and variants of them."""
+    rng: random.Random = random.Random(seed)
+    vocabulary: List[str] = TOPICS + WORDS
+    tags: Dict[str, None] = dict.fromkeys(TOPICS)
+
+    while len(tags) < count:
+        if tags and rng.random() < 0.2:
+            tag: str = rng.choice(VARIANTS)(rng.choice(list(tags)[-1000:]))
+        else:
+            tag = f"{rng.choice(vocabulary)}-{rng.choice(vocabulary)}"
+            if rng.random() < 0.7:
+                tag += f"-{rng.choice(vocabulary)}"
+        if tag:
+            tags[tag] = None
+
+    return list(tags)[:count]
+
+
+def pairwise_candidates(tags: List[str], max_length_difference: int, exceptions: Set[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+    """The previous implementation of `tags list`: every pair of distinct tags compared."""
+    merge_suggestions: Set[Tuple[str, str]] = set()
+    sorted_unique_tags: List[str] = sorted(set(tags))
+
+    for i, t1 in enumerate(sorted_unique_tags):
+        t1_lower = t1.lower()
+        for j in range(i + 1, len(sorted_unique_tags)):
+            t2 = sorted_unique_tags[j]
+            t2_lower = t2.lower()
+
+            if t1_lower == t2_lower or tuple(sorted((t1_lower, t2_lower))) in exceptions:
+                continue
+
+            pair = tuple(sorted((t1, t2)))
+
+            if t1_lower + 's' == t2_lower or t2_lower + 's' == t1_lower:
+                merge_suggestions.add(pair)
+                continue
+
+            len_diff = abs(len(t1_lower) - len(t2_lower))
+            if 0 < len_diff <= max_length_difference:
+                shorter_tag, longer_tag = (t1_lower, t2_lower) if len(t1_lower) < len(t2_lower) else (t2_lower, t1_lower)
+                if shorter_tag in longer_tag:
+                    merge_suggestions.add(pair)
+
+    return merge_suggestions
+
+
+def pairwise_fuzzy_candidates(tags: List[str], max_distance: int, exceptions: FrozenSet[Tuple[str, str]]) -> Dict[Tuple[str, str], int]:
+    """The typos of fuzzy_candidates(), found by computing the edit distance of every pair of tags."""
+    pairs: Dict[Tuple[str, str], int] = {}
+    sorted_unique_tags: List[str] = sorted(tag for tag in set(tags) if len(tag) >= FUZZY_MIN_LENGTH)
+
+    for i, t1 in enumerate(sorted_unique_tags):
+        t1_lower = t1.lower()
+        for t2 in sorted_unique_tags[i + 1:]:
+            t2_lower = t2.lower()
+            if t1_lower == t2_lower or (t1_lower, t2_lower) in exceptions:
+                continue
+            distance: int = edit_distance(t1_lower, t2_lower, max_distance)
+            if distance <= max_distance:
+                pairs[(t1, t2)] = distance
+
+    return pairs
+
+
+def _timed(function: Callable[[], Any]) -> Tuple[float, Any]:
+    start: float = time.perf_counter()
+    result: Any = function()
+    return time.perf_counter() - start, result
+
+
+def run(tag_count: int, sample: int, fuzzy_sample: int, fuzzy_distance: int, seed: int) -> Dict[str, Any]:
+    tags: List[str] = generate_tags(tag_count, seed)
+    sample_tags: List[str] = tags[:sample]
+    fuzzy_sample_tags: List[str] = tags[:fuzzy_sample]
+    exceptions: FrozenSet[Tuple[str, str]] = normalize_exceptions(MERGE_EXCEPTIONS)
+
+    pairwise_seconds, pairwise_pairs = _timed(lambda: pairwise_candidates(sample_tags, MAX_LENGTH_DIFFERENCE, MERGE_EXCEPTIONS))
+    sample_seconds, sample_pairs = _timed(lambda: merge_candidates(sample_tags, MAX_LENGTH_DIFFERENCE, exceptions))
+    indexed_seconds, indexed_pairs = _timed(lambda: merge_candidates(tags, MAX_LENGTH_DIFFERENCE, exceptions))
+
+    fuzzy_pairwise_seconds, fuzzy_pairwise_pairs = _timed(lambda: pairwise_fuzzy_candidates(fuzzy_sample_tags, fuzzy_distance, exceptions))
+    fuzzy_sample_seconds, fuzzy_sample_pairs = _timed(lambda: fuzzy_candidates(fuzzy_sample_tags, fuzzy_distance, exceptions))
+    scaling: List[Dict[str, Any]] = []
+    for count in (len(tags) // 4, len(tags) // 2, len(tags)):
+        seconds, pairs = _timed(lambda: fuzzy_candidates(tags[:count], fuzzy_distance, exceptions))
+        scaling.append({'tags': count, 'seconds': seconds, 'pairs': len(pairs)})
+
+    return {
+        'tags': len(tags),
+        'sample': len(sample_tags),
+        'seed': seed,
+        'same_pairs_on_sample': pairwise_pairs == sample_pairs,
+        'sample_pairs': len(sample_pairs),
+        'pairs': len(indexed_pairs),
+        'results': {
+            'pairwise': {
+                'sample_seconds': pairwise_seconds,
+                'estimated_seconds': pairwise_seconds * (len(tags) / len(sample_tags)) ** 2,
+            },
+            'indexed': {'sample_seconds': sample_seconds, 'seconds': indexed_seconds},
+        },
+        'fuzzy': {
+            'distance': fuzzy_distance,
+            'sample': len(fuzzy_sample_tags),
+            'same_pairs_on_sample': fuzzy_pairwise_pairs == fuzzy_sample_pairs,
+            'sample_pairs': len(fuzzy_sample_pairs),
+            'pairwise_sample_seconds': fuzzy_pairwise_seconds,
+            'estimated_pairwise_seconds': fuzzy_pairwise_seconds * (len(tags) / len(fuzzy_sample_tags)) ** 2,
+            'indexed_sample_seconds': fuzzy_sample_seconds,
+            'scaling': scaling,
+        },
+    }
+
+
+def _print_report(report: Dict[str, Any]) -> None:
+    results: Dict[str, Dict[str, float]] = report['results']
+    print(f"{report['tags']} tags (seed {report['seed']}), pairwise version on the first {report['sample']}\n")
+    print(f"{'version':<12}{'sample':>12}{'all tags':>14}")
+    print(f"{'pairwise':<12}{results['pairwise']['sample_seconds']:>11.2f}s{results['pairwise']['estimated_seconds']:>12.1f}s (estimated)")
+    print(f"{'indexed':<12}{results['indexed']['sample_seconds']:>11.2f}s{results['indexed']['seconds']:>12.1f}s")
+    print(f"\nMerge candidates: {report['sample_pairs']} on the sample, {report['pairs']} on all tags")
+    print(f"Same pairs on the sample: {'yes' if report['same_pairs_on_sample'] else 'NO'}")
+
+    fuzzy: Dict[str, Any] = report['fuzzy']
+    print(f"\nTypos (--fuzzy {fuzzy['distance']}), pairwise version on the first {fuzzy['sample']}\n")
+    print(f"{'version':<12}{'sample':>12}{'all tags':>14}")
+    print(f"{'pairwise':<12}{fuzzy['pairwise_sample_seconds']:>11.2f}s{fuzzy['estimated_pairwise_seconds']:>12.1f}s (estimated)")
+    print(f"{'indexed':<12}{fuzzy['indexed_sample_seconds']:>11.2f}s{fuzzy['scaling'][-1]['seconds']:>12.1f}s")
+    print(f"\n{'tags':>8}{'time':>10}{'pairs':>10}")
+    for step in fuzzy['scaling']:
+        print(f"{step['tags']:>8}{step['seconds']:>9.2f}s{step['pairs']:>10}")
+    print(f"\nSame pairs on the sample: {'yes' if fuzzy['same_pairs_on_sample'] else 'NO'}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time of the tag merge candidates on a synthetic tag vocabulary.")
+    parser.add_argument('--tags', type=int, default=50000, help="Number of distinct tags (default: 50000).")
+    parser.add_argument('--sample', type=int, default=3000, help="Tags compared by the pairwise version (default: 3000).")
+    parser.add_argument('--fuzzy-sample', type=int, default=1000, help="Tags compared by the pairwise --fuzzy version (default: 1000).")
+    parser.add_argument('--fuzzy-distance', type=int, default=1, help="Edit distance of the typos (default: 1).")
+    parser.add_argument('--seed', type=int, default=42, help="Random seed of the generated tags (default: 42).")
+    parser.add_argument('--json', action='store_true', help="Print the results as JSON.")
+    args = parser.parse_args()
+
+    if min(args.tags, args.sample, args.fuzzy_sample, args.fuzzy_distance) < 1:
+        parser.error("--tags, --sample, --fuzzy-sample and --fuzzy-distance must be at least 1.")
+
+    report: Dict[str, Any] = run(args.tags, min(args.sample, args.tags), min(args.fuzzy_sample, args.tags), args.fuzzy_distance, args.seed)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+
+    if not report['same_pairs_on_sample'] or not report['fuzzy']['same_pairs_on_sample']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+"""
+YAML Backend Benchmark
+----------------------
+Compares the 'libyaml' (CSafeLoader/CSafeDumper) and 'python' (pure-Python)
+backends of .scripts/blog_corpus/yaml_backend.py on the real blog corpus:
+
+1. Correctness: every front matter block is loaded by both backends and the
+   results must be equal; every block is then dumped by both backends and the
+   output must be byte-for-byte identical.
+2. Speed: total parse and dump time per backend (best of N rounds), and the
+   resulting speedup.
+
+Usage (from the root of the repository):
+
+    python .scripts/benchmarks/yaml_backend_benchmark.py
+    python .scripts/benchmarks/yaml_backend_benchmark.py --rounds 10 --json
+
+Exits with 1 when the two backends don't produce identical output.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+# --- PATH PATCH ---
+# Ensures the shared 'blog_corpus' package (in .scripts/) is found regardless of execution context
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+# ------------------
+
+from blog_corpus import read_header, split_header
+from blog_corpus.discovery import find_posts
+from blog_corpus.yaml_backend import BACKENDS, YamlBackend
+
+DOCS_DIR: str = 'blog'
+
+
+def _collect_headers(docs_dir: str) -> List[Tuple[str, str]]:
+    """Returns (filepath, yaml_text) for every post with a YAML front matter block."""
+    files: List[str] = find_posts(docs_dir)
+    headers: List[Tuple[str, str]] = []
+    for filepath in files:
+        header = read_header(filepath)
+        if header is not None:
+            headers.append((filepath, split_header(header)))
+    return headers
+
+
+def _best_of(rounds: int, func: Callable[[], Any]) -> float:
+    """Runs `func` several times and returns the fastest wall time, in seconds."""
+    best: float = float('inf')
+    for _ in range(rounds):
+        start: float = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _check_identical(headers: List[Tuple[str, str]], reference: YamlBackend, candidate: YamlBackend) -> List[str]:
+    """Returns the files for which both backends don't load or dump identically."""
+    mismatches: List[str] = []
+    for filepath, yaml_text in headers:
+        expected: Any = reference.load(yaml_text)
+        if candidate.load(yaml_text) != expected:
+            mismatches.append(f"{filepath} (load)")
+            continue
+        if not isinstance(expected, dict):
+            continue
+        if reference.dump(expected).encode('utf-8') != candidate.dump(expected).encode('utf-8'):
+            mismatches.append(f"{filepath} (dump)")
+    return mismatches
+
+
+def main() -> None:
+    """Main execution function for the benchmark."""
+    parser = argparse.ArgumentParser(description="Compare the libyaml and pure-Python YAML backends on the blog corpus.")
+    parser.add_argument("--docs-dir", default=DOCS_DIR, help=f"Content directory (default: {DOCS_DIR}).")
+    parser.add_argument("--rounds", type=int, default=5, help="Number of timed rounds; the best one is kept (default: 5).")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+    args = parser.parse_args()
+
+    if 'libyaml' not in BACKENDS:
+        print("ERROR: PyYAML was built without libyaml; only the 'python' backend is available.")
+        sys.exit(1)
+
+    headers: List[Tuple[str, str]] = _collect_headers(args.docs_dir)
+    if not headers:
+        print(f"ERROR: No front matter found under '{args.docs_dir}'.")
+        sys.exit(1)
+
+    reference: YamlBackend = BACKENDS['python']
+    candidate: YamlBackend = BACKENDS['libyaml']
+
+    mismatches: List[str] = _check_identical(headers, reference, candidate)
+
+    # Metadata to dump, parsed once up front so that only the dump is timed
+    documents: List[Dict[str, Any]] = [
+        data for data in (reference.load(yaml_text) for _, yaml_text in headers)
+        if isinstance(data, dict)
+    ]
+
+    results: Dict[str, Dict[str, float]] = {}
+    for backend in (reference, candidate):
+        results[backend.name] = {
+            'parse_seconds': _best_of(args.rounds, lambda: [backend.load(text) for _, text in headers]),
+            'dump_seconds': _best_of(args.rounds, lambda: [backend.dump(data) for data in documents]),
+        }
+
+    report: Dict[str, Any] = {
+        'files': len(headers),
+        'rounds': args.rounds,
+        'identical': not mismatches,
+        'mismatches': mismatches,
+        'backends': results,
+        'parse_speedup': results['python']['parse_seconds'] / results['libyaml']['parse_seconds'],
+        'dump_speedup': results['python']['dump_seconds'] / results['libyaml']['dump_seconds'],
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"Front matter blocks: {report['files']} (best of {args.rounds} rounds)")
+        print(f"Byte-for-byte identical output: {'yes' if report['identical'] else 'NO'}")
+        for mismatch in mismatches:
+            print(f"  - {mismatch}")
+        print("-" * 50)
+        print(f"{'backend':<10} {'parse (ms)':>12} {'dump (ms)':>12}")
+        for name, timings in results.items():
+            print(f"{name:<10} {timings['parse_seconds'] * 1000:>12.1f} {timings['dump_seconds'] * 1000:>12.1f}")
+        print("-" * 50)
+        print(f"Speedup (python / libyaml): parse x{report['parse_speedup']:.1f}, dump x{report['dump_speedup']:.1f}")
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
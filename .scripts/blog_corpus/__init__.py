@@ -0,0 +1,21 @@
+"""Shared front matter helpers for the blog maintenance scripts."""
+
+from .header_reader import YAML_BOUNDARY, locate_header, read_header, split_header
+from .frontmatter_index import (
+    DEFAULT_INDEX_PATH,
+    FrontMatterIndex,
+    PostRecord,
+    extract_raw_keys,
+    file_signature,
+    load_index_entry,
+    parse_post_file,
+    parse_post_header,
+    parse_post_text,
+)
+from .corpus import BlogCorpus, Post
+
+__all__ = [
+    'DEFAULT_INDEX_PATH', 'YAML_BOUNDARY', 'BlogCorpus', 'FrontMatterIndex', 'Post', 'PostRecord',
+    'extract_raw_keys', 'file_signature', 'load_index_entry', 'locate_header', 'parse_post_file',
+    'parse_post_header', 'parse_post_text', 'read_header', 'split_header'
+]
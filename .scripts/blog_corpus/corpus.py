@@ -0,0 +1,221 @@
+"""
+Blog Corpus
+-----------
+One importable view of the posts of the blog, shared by yaml-manager.py,
+tags_manager and python_tldr: they all find and parse the posts with the same
+rules, and one process can run several operations off a single parse.
+
+- Discovery: paths() lists the posts with blog_corpus.discovery (scandir,
+  asset folders pruned).
+- Records: the parsed front matter of a post (metadata, raw keys, parse error
+  and the position of the '---' block) comes from the persistent front matter
+  index (.cache/frontmatter-index), keyed on (path, mtime, size). A post is
+  parsed once, then served from memory or from the cache on the next runs.
+- Lazy loading: nothing is read until it is asked for. The index file is only
+  opened on the first record, a post is only parsed when its record is used,
+  and its body is only read by body() / text().
+- Change detection: stale() lists the posts modified since they were indexed,
+  changed_since() the posts touched by a git change (--since / --staged).
+- Tags: tagged() finds the posts using some tags with the persistent tag
+  index (.cache/tag-index, blog_corpus/tag_index.py), without loading the
+  records of the other posts.
+
+Usage:
+    corpus = BlogCorpus('blog')
+    for post in corpus.posts():
+        if post.error is None and 'docker' in post.metadata.get('tags', []):
+            print(post.path, post.body()[:80])
+    corpus.save()
+
+A Post keeps the record it was given: after writing a file, call load() (or
+discard()) so the next access sees the new content.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .discovery import find_posts
+from .frontmatter_index import DEFAULT_INDEX_PATH, FrontMatterIndex, PostRecord, load_index_entry
+from .git_changes import changed_posts
+from .profiler import PROFILER
+from .tag_index import DEFAULT_TAG_INDEX_PATH, TagIndex
+
+# Default folder holding the posts, relative to the repository root
+DEFAULT_ROOT: str = 'blog'
+
+# Runs a worker over a list of paths and yields its results in the same order: the builtin map(),
+# or a process pool (see _map_files() in yaml-manager.py)
+Mapper = Callable[[Callable[[str], Any], List[str]], Iterable[Any]]
+
+
+def load_entry_safely(filepath: str) -> Tuple[str, Optional[Tuple[Tuple[int, int], PostRecord]]]:
+    """Worker: parses one file for the index; unreadable files are left to the caller to report."""
+    try:
+        return filepath, load_index_entry(filepath)
+    except Exception:
+        return filepath, None
+
+
+class Post:
+    """One post of the corpus; its record and its body are loaded on first use."""
+
+    __slots__ = ('corpus', 'path', '_record')
+
+    def __init__(self, corpus: 'BlogCorpus', path: str) -> None:
+        self.corpus: BlogCorpus = corpus
+        self.path: str = path
+        self._record: Optional[PostRecord] = None
+
+    @property
+    def record(self) -> PostRecord:
+        """The parsed front matter, from the index (parsed now if the file changed since it was indexed)."""
+        if self._record is None:
+            self._record = self.corpus.record(self.path)
+        return self._record
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self.record.metadata
+
+    @property
+    def raw_keys(self) -> List[str]:
+        return self.record.raw_keys
+
+    @property
+    def error(self) -> Optional[str]:
+        return self.record.error
+
+    @property
+    def header_span(self) -> Optional[Tuple[int, int]]:
+        """(start, end) of the '---' block in text(), None when the post has no YAML front matter."""
+        return self.record.header_span
+
+    def text(self) -> str:
+        """The whole file, read now."""
+        with PROFILER.phase('read', self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return f.read()
+
+    def body(self) -> str:
+        """The text after the closing '---' line (the whole file when there is no front matter)."""
+        text: str = self.text()
+        span: Optional[Tuple[int, int]] = self.header_span
+        return text if span is None else text[span[1]:]
+
+    def __repr__(self) -> str:
+        return f"Post({self.path!r})"
+
+
+class BlogCorpus:
+    """The posts under a root folder, backed by the persistent front matter index."""
+
+    def __init__(self, root: str = DEFAULT_ROOT, index_path: str = DEFAULT_INDEX_PATH, use_cache: bool = True,
+                 tag_index_path: str = DEFAULT_TAG_INDEX_PATH) -> None:
+        self.root: str = root
+        self.index_path: str = index_path
+        self.tag_index_path: str = tag_index_path
+        # False: nothing is read from or written to the index files (every post is parsed once per process)
+        self.use_cache: bool = use_cache
+        self._index: Optional[FrontMatterIndex] = None
+        self._tag_index: Optional[TagIndex] = None
+        self._posts: Dict[str, Post] = {}
+
+    def load_index(self) -> FrontMatterIndex:
+        """Opens the front matter index (once); records use it automatically."""
+        if self._index is None:
+            self._index = FrontMatterIndex(self.index_path, enabled=self.use_cache)
+        return self._index
+
+    @property
+    def index(self) -> FrontMatterIndex:
+        return self.load_index()
+
+    @property
+    def tag_index(self) -> TagIndex:
+        """The tag -> posts index (opened once, not refreshed: see tagged())."""
+        if self._tag_index is None:
+            self._tag_index = TagIndex(self.tag_index_path, enabled=self.use_cache)
+        return self._tag_index
+
+    def paths(self) -> List[str]:
+        """The sorted paths of the posts under the root (empty when it doesn't exist)."""
+        with PROFILER.phase('discover'):
+            return find_posts(self.root)
+
+    def get(self, path: str) -> Post:
+        """The Post of a path; nothing is read until its record or body is used."""
+        post: Optional[Post] = self._posts.get(path)
+        if post is None:
+            post = self._posts[path] = Post(self, path)
+        return post
+
+    def record(self, path: str) -> PostRecord:
+        """The current record of a path, re-parsed only if the file changed since it was indexed."""
+        return self.index.get(path)
+
+    def stale(self, paths: Optional[List[str]] = None) -> List[str]:
+        """The posts (default: all of them) whose record is missing or older than the file."""
+        return self.index.stale_files(self.paths() if paths is None else paths)
+
+    def load(self, paths: Optional[List[str]] = None, mapper: Mapper = map) -> List[str]:
+        """
+        Makes sure the posts (default: all of them) have an up-to-date record, parsing
+        the stale ones with `mapper` (e.g. a process pool). Returns the paths.
+        """
+        if paths is None:
+            paths = self.paths()
+
+        stale_paths: List[str] = self.stale(paths)
+        for path, entry in mapper(load_entry_safely, stale_paths):
+            if entry is not None:
+                self.index.put(path, entry)
+            post: Optional[Post] = self._posts.get(path)
+            if post is not None:
+                post._record = None
+
+        return paths
+
+    def posts(self, paths: Optional[List[str]] = None, mapper: Mapper = map) -> List[Post]:
+        """The posts (default: all of them), with their records loaded."""
+        return [self.get(path) for path in self.load(paths, mapper)]
+
+    def tagged(self, tags: Iterable[str], paths: Optional[List[str]] = None) -> List[str]:
+        """
+        The posts (among `paths`, default: all of them) using one of the tags, case-insensitive,
+        or whose front matter can't be parsed. The tag index is refreshed first: the posts
+        are only stat()ed, and the new or changed ones read again.
+        """
+        complete: bool = paths is None
+        if paths is None:
+            paths = self.paths()
+        with PROFILER.phase('index'):
+            self.tag_index.refresh(paths, complete=complete)
+            found: List[str] = self.tag_index.paths_with(tags)
+        if complete:
+            return found
+        listed: Set[str] = set(paths)
+        return [path for path in found if path in listed]
+
+    def changed_since(self, since: Optional[str] = None, staged: bool = False) -> List[str]:
+        """The posts changed since a git ref, or staged (raises GitError outside of a repository)."""
+        return changed_posts(self.root, since=since, staged=staged)
+
+    def discard(self, path: str) -> None:
+        """Forgets a post (e.g. deleted, or rewritten by the caller)."""
+        self._posts.pop(path, None)
+        if self._index is not None:
+            self._index.discard(path)
+        if self._tag_index is not None:
+            self._tag_index.discard(path)
+
+    def save(self) -> None:
+        """Persists the records parsed during this run (when the indexes were used)."""
+        if self._index is not None:
+            self._index.save()
+        if self._tag_index is not None:
+            self._tag_index.save()
+
+    def __enter__(self) -> 'BlogCorpus':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.save()
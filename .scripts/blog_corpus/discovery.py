@@ -0,0 +1,145 @@
+"""
+Post Discovery
+--------------
+Finds the Markdown posts of the blog with os.scandir instead of
+`glob('blog/**/*.md*', recursive=True)`, which also matched the
+`*.md.questions.json` sidecars and walked every asset folder.
+
+- Only `.md` and `.mdx` files are posts (the extension is compared
+  case-insensitively).
+- Asset and vendor folders (`files/`, `images/`, `node_modules/`...) and
+  hidden folders are pruned: they are never opened, so discovery costs the
+  same however many images or snippets a post has.
+- Listings are cached per directory for the life of the process, validated
+  against the directory's mtime: a later call only lists again the
+  directories whose entries changed (a new post, a removed file).
+
+Usage:
+    from blog_corpus.discovery import find_posts
+
+    for filepath in find_posts('blog'):
+        ...
+
+Paths are returned sorted, built like the globs of the scripts (relative to
+the current directory when `root` is relative).
+"""
+
+import os
+import time
+from typing import Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Tuple
+
+# Extensions of the posts (lowercase)
+POST_EXTENSIONS: Tuple[str, ...] = ('.md', '.mdx')
+
+# Folders that never hold posts: assets next to the posts, tooling and vendor trees
+PRUNED_DIRECTORIES: FrozenSet[str] = frozenset({
+    'assets',
+    'build',
+    'files',
+    'images',
+    'img',
+    'node_modules',
+    'vendor',
+    '__pycache__',
+})
+
+# A directory modified less than this long ago isn't cached: with a coarse mtime
+# resolution, a change made in the same tick as the listing would go unnoticed
+RACY_MTIME_NS: int = 2 * 1_000_000_000
+
+
+class _Listing(NamedTuple):
+    """Cached content of one directory."""
+    mtime_ns: int
+    directories: List[str]
+    posts: List[str]
+
+
+# Directory path -> listing, shared by every call of this process
+_LISTINGS: Dict[str, _Listing] = {}
+
+
+def is_post_file(name: str) -> bool:
+    """True when a file name has a post extension (.md or .mdx)."""
+    return os.path.splitext(name)[1].lower() in POST_EXTENSIONS
+
+
+def is_pruned_directory(name: str) -> bool:
+    """True for the folders discovery never enters (assets, vendor trees, hidden folders)."""
+    return name in PRUNED_DIRECTORIES or name.startswith('.')
+
+
+def is_post_path(path: str) -> bool:
+    """True when `path` is a post as find_posts() would report it (extension and no pruned folder)."""
+    parts: List[str] = os.path.normpath(path).split(os.sep)
+    return is_post_file(parts[-1]) and not any(
+        is_pruned_directory(part) for part in parts[:-1] if part not in ('', '.', '..')
+    )
+
+
+def _list_directory(directory: str) -> Optional[_Listing]:
+    """Returns the (possibly cached) sub-directories and posts of a directory, None if it can't be read."""
+    try:
+        mtime_ns: int = os.stat(directory).st_mtime_ns
+    except OSError:
+        _LISTINGS.pop(directory, None)
+        return None
+
+    cached: Optional[_Listing] = _LISTINGS.get(directory)
+    if cached is not None and cached.mtime_ns == mtime_ns:
+        return cached
+
+    directories: List[str] = []
+    posts: List[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not is_pruned_directory(entry.name):
+                            directories.append(entry.path)
+                    elif is_post_file(entry.name) and entry.is_file():
+                        posts.append(entry.path)
+                except OSError:
+                    continue  # Removed in the meantime
+    except OSError:
+        _LISTINGS.pop(directory, None)
+        return None
+
+    listing: _Listing = _Listing(mtime_ns, directories, posts)
+    if time.time_ns() - mtime_ns > RACY_MTIME_NS:
+        _LISTINGS[directory] = listing
+    else:
+        _LISTINGS.pop(directory, None)
+    return listing
+
+
+def _walk(root: str) -> Iterator[Tuple[str, _Listing]]:
+    """Yields (directory, listing) for `root` and every sub-directory that isn't pruned."""
+    stack: List[str] = [root]
+    while stack:
+        directory: str = stack.pop()
+        listing: Optional[_Listing] = _list_directory(directory)
+        if listing is None:
+            continue
+        yield directory, listing
+        stack.extend(listing.directories)
+
+
+def walk_directories(root: str) -> Iterator[str]:
+    """Yields `root` and every sub-directory discovery would enter (pruned folders excluded)."""
+    for directory, _ in _walk(root):
+        yield directory
+
+
+def find_posts(root: str) -> List[str]:
+    """Returns the sorted paths of the .md/.mdx posts under `root` (empty when it doesn't exist)."""
+    posts: List[str] = []
+    for _, listing in _walk(root):
+        posts.extend(listing.posts)
+    return sorted(posts)
+
+
+def clear_cache() -> None:
+    """Forgets every cached listing (the next call lists every directory again)."""
+    _LISTINGS.clear()
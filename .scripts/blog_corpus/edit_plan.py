@@ -0,0 +1,230 @@
+"""
+Batch Edit Plans
+----------------
+Runs an ordered list of front matter edits as a single per-file transform, so
+a whole clean-up costs one read and at most one write per post instead of one
+full pass over the tree per add-key / remove-key / cleanup-variants run.
+
+A plan is a YAML file holding a list of operations (or a mapping with an
+`operations` list), applied in order to the metadata of each post:
+
+    - rename: {from: Series, to: series}      # keeps 'series' when it has a value
+    - remove: deprecatedStatus
+    - add: {key: language, value: en}         # only when the key is missing
+    - default: {key: draft, value: false}     # when missing, null or empty
+    - lowercase: tags                         # a string, or the strings of a list
+
+Usage:
+    plan = load_plan('plan.yaml')
+    new_metadata, applied = plan.transform(metadata)  # applied: indexes of the operations that changed it
+    if applied:
+        edit = header_edit(metadata, new_metadata)    # FrontMatterPatch edit for these changes
+
+Every operation is checked when the plan is loaded: a typo is reported before
+any file is touched.
+"""
+
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .header_patch import FrontMatterPatch
+from .yaml_backend import DEFAULT_BACKEND
+
+# Operation name -> fields of its mapping form (the first one is also the scalar form: `remove: key`)
+OPERATION_FIELDS: Dict[str, Tuple[str, ...]] = {
+    'add': ('key', 'value'),
+    'default': ('key', 'value'),
+    'lowercase': ('key',),
+    'remove': ('key',),
+    'rename': ('from', 'to'),
+}
+
+
+class PlanError(ValueError):
+    """Raised when a plan file can't be read or holds an invalid operation."""
+
+
+class Operation(NamedTuple):
+    """One step of a plan."""
+    name: str
+    key: str
+    value: Any = None  # add/default: the value to set
+    new_key: Optional[str] = None  # rename: the key receiving the value
+
+    def describe(self) -> str:
+        """Short human-readable form, e.g. "rename 'Series' -> 'series'"."""
+        if self.name == 'rename':
+            return f"rename '{self.key}' -> '{self.new_key}'"
+        if self.name in ('add', 'default'):
+            return f"{self.name} '{self.key}' = {self.value!r}"
+        return f"{self.name} '{self.key}'"
+
+
+def _is_empty(value: Any) -> bool:
+    """True for the values 'default' replaces: null and empty strings."""
+    return value is None or value == ''
+
+
+def _add(operation: Operation, metadata: Dict[str, Any]) -> bool:
+    if operation.key in metadata:
+        return False
+    metadata[operation.key] = operation.value
+    return True
+
+
+def _default(operation: Operation, metadata: Dict[str, Any]) -> bool:
+    if operation.key in metadata:
+        current: Any = metadata[operation.key]
+        if not _is_empty(current) or current == operation.value:
+            return False
+    metadata[operation.key] = operation.value
+    return True
+
+
+def _lowercase(operation: Operation, metadata: Dict[str, Any]) -> bool:
+    value: Any = metadata.get(operation.key)
+    if isinstance(value, str):
+        lowered: Any = value.lower()
+    elif isinstance(value, list):
+        lowered = [item.lower() if isinstance(item, str) else item for item in value]
+    else:
+        return False
+    if lowered == value:
+        return False
+    metadata[operation.key] = lowered
+    return True
+
+
+def _remove(operation: Operation, metadata: Dict[str, Any]) -> bool:
+    if operation.key not in metadata:
+        return False
+    del metadata[operation.key]
+    return True
+
+
+def _rename(operation: Operation, metadata: Dict[str, Any]) -> bool:
+    # Same rule as cleanup-variants: the target key keeps its value, unless it has none
+    if operation.key not in metadata:
+        return False
+    value: Any = metadata.pop(operation.key)
+    assert operation.new_key is not None
+    if metadata.get(operation.new_key) is None:
+        metadata[operation.new_key] = value
+    return True
+
+
+# Operation name -> function applying it in place to a metadata dict; returns True on change
+_APPLIERS: Dict[str, Callable[[Operation, Dict[str, Any]], bool]] = {
+    'add': _add,
+    'default': _default,
+    'lowercase': _lowercase,
+    'remove': _remove,
+    'rename': _rename,
+}
+
+
+def parse_operation(position: int, entry: Any) -> Operation:
+    """Builds an Operation from one entry of the plan (`position` is 1-based, for error messages)."""
+    if not isinstance(entry, dict) or len(entry) != 1:
+        raise PlanError(f"Operation #{position}: expected a single 'name: arguments' mapping, got {entry!r}.")
+
+    name, arguments = next(iter(entry.items()))
+    fields: Optional[Tuple[str, ...]] = OPERATION_FIELDS.get(name)
+    if fields is None:
+        raise PlanError(f"Operation #{position}: unknown operation '{name}' (expected one of: {', '.join(OPERATION_FIELDS)}).")
+
+    if not isinstance(arguments, dict):
+        arguments = {fields[0]: arguments}
+    unknown: List[str] = [str(field) for field in arguments if field not in fields]
+    if unknown:
+        raise PlanError(f"Operation #{position} ({name}): unknown field(s) {', '.join(unknown)} (expected: {', '.join(fields)}).")
+
+    for field in fields:
+        # An add/default without a value creates an empty key, like add-key
+        if field == 'value':
+            continue
+        if not isinstance(arguments.get(field), str) or not arguments[field].strip():
+            raise PlanError(f"Operation #{position} ({name}): '{field}' must be a non-empty key name.")
+
+    if name == 'rename':
+        old_key: str = arguments['from'].strip()
+        new_key: str = arguments['to'].strip()
+        if old_key == new_key:
+            raise PlanError(f"Operation #{position} (rename): 'from' and 'to' are the same key.")
+        return Operation(name, old_key, new_key=new_key)
+
+    return Operation(name, arguments['key'].strip(), arguments.get('value', ''))
+
+
+class EditPlan:
+    """An ordered list of operations compiled into a single metadata transform."""
+
+    def __init__(self, operations: List[Operation]) -> None:
+        self.operations: List[Operation] = operations
+        # Resolved once: transform() runs for every post
+        self._steps: List[Tuple[int, Operation, Callable[[Operation, Dict[str, Any]], bool]]] = [
+            (index, operation, _APPLIERS[operation.name]) for index, operation in enumerate(operations)
+        ]
+
+    def transform(self, metadata: Dict[str, Any]) -> Tuple[Dict[str, Any], List[int]]:
+        """
+        Applies every operation, in order, to a copy of `metadata`. Returns the new
+        metadata and the indexes of the operations that changed something.
+        """
+        result: Dict[str, Any] = dict(metadata)
+        applied: List[int] = [index for index, operation, apply in self._steps if apply(operation, result)]
+        return result, applied
+
+
+def compile_plan(entries: Any) -> EditPlan:
+    """Checks the loaded content of a plan file and returns the compiled plan."""
+    if isinstance(entries, dict) and set(entries) == {'operations'}:
+        entries = entries['operations']
+    if not isinstance(entries, list) or not entries:
+        raise PlanError("A plan must be a non-empty list of operations (or an 'operations:' list).")
+    return EditPlan([parse_operation(position, entry) for position, entry in enumerate(entries, 1)])
+
+
+def load_plan(path: str) -> EditPlan:
+    """Reads and compiles a plan file. Raises PlanError when it is missing or invalid."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entries: Any = DEFAULT_BACKEND.load(f.read())
+    except OSError as e:
+        raise PlanError(f"Can't read the plan file: {e}")
+    except Exception as e:
+        raise PlanError(f"Invalid YAML in {path}: {e}")
+    return compile_plan(entries)
+
+
+def header_edit(original: Dict[str, Any], result: Dict[str, Any],
+                sort_key: Optional[Callable[[str], Tuple[Any, ...]]] = None) -> Callable[[FrontMatterPatch], None]:
+    """
+    Returns the FrontMatterPatch edit turning the header of `original` into `result`:
+    removed keys are deleted, new or changed keys are (re)written, and a key whose
+    unchanged value moved to a new key is renamed in place (its value lines are kept).
+    """
+    removed: List[str] = [key for key in original if key not in result]
+    written: List[str] = [key for key in result if key not in original or original[key] != result[key]]
+
+    renamed: Dict[str, str] = {}
+    for new_key in written:
+        if new_key in original:
+            continue
+        old_key: Optional[str] = next(
+            (key for key in removed if key not in renamed and original[key] == result[new_key]),
+            None
+        )
+        if old_key is not None:
+            renamed[old_key] = new_key
+
+    def edit(patch: FrontMatterPatch) -> None:
+        for old_key, new_key in renamed.items():
+            patch.rename(old_key, new_key)
+        for key in removed:
+            if key not in renamed:
+                patch.remove(key)
+        for key in written:
+            if key not in renamed.values():
+                patch.set(key, result[key], sort_key=sort_key)
+
+    return edit
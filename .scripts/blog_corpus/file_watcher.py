@@ -0,0 +1,229 @@
+"""
+Content Directory Watcher
+-------------------------
+Reports the posts created, modified or deleted under a directory, batch by
+batch, so a long-running process (e.g. `yaml-manager.py watch`) only has to
+look at the files that actually changed.
+
+Two implementations share the same interface:
+
+- InotifyWatcher: Linux inotify through ctypes (no extra dependency). The
+  kernel pushes the events, so a saved file is reported within milliseconds.
+- PollingWatcher: portable fallback that compares (mtime, size) signatures
+  of every file at a fixed interval.
+
+Usage:
+    watcher = create_watcher('blog')
+    try:
+        for changed_paths in watcher.batches():
+            ...
+    finally:
+        watcher.close()
+
+Paths are reported like the globs of the scripts (relative to the current
+directory when `root` is relative) and filtered like blog_corpus.discovery:
+only .md/.mdx files, asset and vendor folders are not watched. A path that
+no longer exists is a deletion.
+A folder is reported when it was moved away or deleted (or when inotify lost
+events, as the root folder): files known below it may be gone.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from typing import Dict, Iterator, Optional, Set, Tuple, Union
+
+from .discovery import find_posts, is_post_file, is_pruned_directory, walk_directories
+
+# Delay used to coalesce the bursts of events produced by a single save
+# (editors often write, truncate and rename in a row)
+DEBOUNCE_SECONDS: float = 0.02
+
+# Default interval between two scans of the polling watcher
+POLL_INTERVAL_SECONDS: float = 0.5
+
+# --- inotify constants (see <sys/inotify.h>) ---
+IN_MODIFY: int = 0x00000002
+IN_CLOSE_WRITE: int = 0x00000008
+IN_MOVED_FROM: int = 0x00000040
+IN_MOVED_TO: int = 0x00000080
+IN_CREATE: int = 0x00000100
+IN_DELETE: int = 0x00000200
+IN_DELETE_SELF: int = 0x00000400
+IN_Q_OVERFLOW: int = 0x00004000
+IN_IGNORED: int = 0x00008000
+IN_ISDIR: int = 0x40000000
+IN_NONBLOCK: int = 0x00000800
+IN_CLOEXEC: int = 0x00080000
+
+WATCH_MASK: int = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+
+# struct inotify_event { int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[]; }
+EVENT_HEADER: struct.Struct = struct.Struct('iIII')
+
+
+def _scan(root: str) -> Dict[str, Tuple[int, int]]:
+    """Returns the (mtime_ns, size) signature of every post under `root`."""
+    signatures: Dict[str, Tuple[int, int]] = {}
+    for path in find_posts(root):
+        try:
+            stat: os.stat_result = os.stat(path)
+        except OSError:
+            continue  # Removed in the meantime
+        signatures[path] = (stat.st_mtime_ns, stat.st_size)
+    return signatures
+
+
+class PollingWatcher:
+    """Detects changes by comparing file signatures every `interval` seconds."""
+
+    name: str = 'polling'
+
+    def __init__(self, root: str, interval: float = POLL_INTERVAL_SECONDS) -> None:
+        self.root: str = root
+        self.interval: float = interval
+        self._signatures: Dict[str, Tuple[int, int]] = _scan(root)
+
+    def batches(self) -> Iterator[Set[str]]:
+        """Blocks until files change, then yields the set of changed paths (forever)."""
+        while True:
+            time.sleep(self.interval)
+            current: Dict[str, Tuple[int, int]] = _scan(self.root)
+            changed: Set[str] = {
+                path for path in current.keys() | self._signatures.keys()
+                if current.get(path) != self._signatures.get(path)
+            }
+            self._signatures = current
+            if changed:
+                yield changed
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+class InotifyWatcher:
+    """Receives change notifications from the Linux kernel (inotify), recursively."""
+
+    name: str = 'inotify'
+
+    def __init__(self, root: str) -> None:
+        """Raises OSError when inotify isn't available (non-Linux system, no libc, limits reached)."""
+        libc_name: Optional[str] = ctypes.util.find_library('c')
+        try:
+            self._libc = ctypes.CDLL(libc_name or 'libc.so.6', use_errno=True)
+            self._libc.inotify_init1.argtypes = [ctypes.c_int]
+            self._libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        except (OSError, AttributeError) as e:
+            raise OSError(f"inotify is not available: {e}") from e
+
+        self.root: str = root
+        self._fd: int = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            errno: int = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1 failed: {os.strerror(errno)}")
+
+        # Watch descriptor -> watched directory
+        self._directories: Dict[int, str] = {}
+        try:
+            for directory in walk_directories(root):
+                self._add_watch(directory)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, directory: str) -> None:
+        """Starts watching one directory (not recursive: inotify has no such option)."""
+        wd: int = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            errno: int = ctypes.get_errno()
+            raise OSError(errno, f"Can't watch '{directory}': {os.strerror(errno)}")
+        self._directories[wd] = directory
+
+    def _read_events(self) -> Set[str]:
+        """Drains the pending events and returns the changed paths."""
+        changed: Set[str] = set()
+
+        while True:
+            try:
+                buffer: bytes = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+
+            offset: int = 0
+            while offset < len(buffer):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+                raw_name: bytes = buffer[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length]
+                offset += EVENT_HEADER.size + length
+
+                if mask & IN_Q_OVERFLOW:
+                    # Events were lost: report every file and the root folder itself,
+                    # the caller re-validates them all and forgets the vanished ones
+                    changed.update(_scan(self.root))
+                    changed.add(self.root)
+                    continue
+
+                directory: Optional[str] = self._directories.get(wd)
+                if directory is None:
+                    continue
+                if mask & (IN_IGNORED | IN_DELETE_SELF):
+                    self._directories.pop(wd, None)
+                    continue
+
+                path: str = os.path.join(directory, os.fsdecode(raw_name.rstrip(b'\0')))
+                if mask & IN_ISDIR:
+                    if is_pruned_directory(os.path.basename(path)):
+                        continue  # Assets: never watched, never holding posts
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        # New (or moved in) folder, e.g. a new post: watch it and
+                        # report the files it may already hold
+                        for sub_directory in walk_directories(path):
+                            try:
+                                self._add_watch(sub_directory)
+                            except OSError:
+                                continue
+                        changed.update(_scan(path))
+                    elif mask & (IN_MOVED_FROM | IN_DELETE):
+                        # Folder moved away or deleted: reported as is, the caller
+                        # drops every file it knows below it
+                        changed.add(path)
+                    continue
+
+                if is_post_file(os.path.basename(path)):
+                    changed.add(path)
+
+    def batches(self) -> Iterator[Set[str]]:
+        """Blocks until files change, then yields the set of changed paths (forever)."""
+        while True:
+            select.select([self._fd], [], [])
+            changed: Set[str] = self._read_events()
+
+            # Coalesce the rest of the burst into the same batch
+            while select.select([self._fd], [], [], DEBOUNCE_SECONDS)[0]:
+                changed |= self._read_events()
+
+            if changed:
+                yield changed
+
+    def close(self) -> None:
+        """Closes the inotify file descriptor (all watches are released with it)."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(root: str, interval: float = POLL_INTERVAL_SECONDS,
+                   polling: bool = False) -> Union[InotifyWatcher, PollingWatcher]:
+    """
+    Returns an InotifyWatcher when the system supports it, a PollingWatcher otherwise
+    (or when `polling` is True, e.g. for network or Docker-mounted folders where
+    inotify events aren't propagated).
+    """
+    if not polling:
+        try:
+            return InotifyWatcher(root)
+        except OSError:
+            pass
+    return PollingWatcher(root, interval)
@@ -0,0 +1,243 @@
+"""
+Persistent Front Matter Index
+-----------------------------
+Keeps the parsed front matter of every post on disk, keyed on the file path
+and validated against the file's (mtime, size) pair. Read-only commands ask
+the index for a record; only files that changed since the previous run are
+opened and parsed again, all others are served straight from the cache.
+
+The cache is a pickle file (default: '.cache/frontmatter-index') so that YAML
+types such as `datetime.date` round-trip without any conversion. Keys and
+list items (tags, authors...) are interned when parsed: all the records share
+the same string objects, which pickle then stores only once.
+"""
+
+import os
+import pickle
+import re
+import tempfile
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+import frontmatter
+
+from .compact import intern_metadata
+from .header_reader import YAML_BOUNDARY, locate_header, split_header
+from .profiler import PROFILER
+from .yaml_backend import DEFAULT_BACKEND
+
+# Default on-disk location of the index, relative to the repository root
+DEFAULT_INDEX_PATH: str = os.path.join('.cache', 'frontmatter-index')
+
+# Bump this number whenever the layout of PostRecord changes
+INDEX_FORMAT_VERSION: int = 2
+
+
+class PostRecord(NamedTuple):
+    """Parsed front matter of a single file, as stored in the index."""
+    metadata: Dict[str, Any]
+    raw_keys: List[str]
+    error: Optional[str] = None
+    # (start, end) of the '---' block in the text of the file; the body starts at `end`.
+    # None when the file has no YAML front matter block.
+    header_span: Optional[Tuple[int, int]] = None
+
+
+def extract_raw_keys(raw_content: str) -> List[str]:
+    """
+    Extracts the top-level keys of the front matter block using basic text
+    parsing, keeping literal/case variants that a YAML parser would merge.
+    """
+    matches: List[re.Match[str]] = []
+    for match in YAML_BOUNDARY.finditer(raw_content):
+        matches.append(match)
+        if len(matches) == 2:
+            break
+
+    if len(matches) < 2:
+        return []  # No valid front matter
+
+    yaml_block: str = raw_content[matches[0].end():matches[1].start()].strip()
+
+    original_keys: List[str] = []
+    for line in yaml_block.splitlines():
+        line = line.strip()
+        # Checks: contains ':', not a comment, not indented (no space), not a list item ('-')
+        if ':' in line and not line.startswith('#') and not line.startswith(' ') and not line.startswith('-'):
+            original_keys.append(line.split(':', 1)[0].strip())
+
+    return original_keys
+
+
+def parse_post_text(raw_content: str) -> PostRecord:
+    """Parses the raw text of a file once and returns its PostRecord."""
+    raw_keys: List[str] = extract_raw_keys(raw_content)
+    try:
+        post = frontmatter.loads(raw_content)
+    except Exception as e:
+        return PostRecord({}, raw_keys, str(e))
+    return PostRecord(intern_metadata(post.metadata), raw_keys)
+
+
+def parse_post_header(header: str, offset: int = 0) -> PostRecord:
+    """
+    Parses a front matter block returned by read_header() (body not needed).
+    `offset` is the position of the block in the file (see locate_header()).
+    """
+    raw_keys: List[str] = extract_raw_keys(header)
+    span: Tuple[int, int] = (offset, offset + len(header))
+    try:
+        fm_data: Any = DEFAULT_BACKEND.load(split_header(header))
+    except Exception as e:
+        return PostRecord({}, raw_keys, str(e), span)
+    return PostRecord(intern_metadata(fm_data) if isinstance(fm_data, dict) else {}, raw_keys, header_span=span)
+
+
+def parse_post_file(filepath: str) -> PostRecord:
+    """
+    Reads and parses a single file from disk.
+    Only the front matter block is read; the whole file is loaded only when it
+    has no YAML front matter (e.g. JSON front matter) or an unterminated one.
+    """
+    with PROFILER.phase('read', filepath):
+        located: Optional[Tuple[int, str]] = locate_header(filepath)
+    if located is not None:
+        with PROFILER.phase('parse', filepath):
+            return parse_post_header(located[1], located[0])
+
+    with PROFILER.phase('read', filepath):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            text: str = f.read()
+    with PROFILER.phase('parse', filepath):
+        return parse_post_text(text)
+
+
+def file_signature(filepath: str) -> Tuple[int, int]:
+    """Returns the (mtime_ns, size) pair used to validate an index entry."""
+    stat: os.stat_result = os.stat(filepath)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_index_entry(filepath: str) -> Tuple[Tuple[int, int], PostRecord]:
+    """
+    Parses a file and returns it as an index entry (signature, record).
+    The signature is taken *before* reading, so a file modified while being
+    parsed is simply detected as stale on the next run.
+    This is a module-level function so it can be sent to worker processes.
+    """
+    signature: Tuple[int, int] = file_signature(filepath)
+    return signature, parse_post_file(filepath)
+
+
+class FrontMatterIndex:
+    """
+    On-disk cache of parsed front matter keyed on (path, mtime, size).
+
+    Usage:
+        index = FrontMatterIndex()
+        record = index.get('blog/2026/01/05/post/index.md')
+        ...
+        index.save()
+    """
+
+    def __init__(self, index_path: str = DEFAULT_INDEX_PATH, enabled: bool = True) -> None:
+        self.index_path: str = index_path
+        self.enabled: bool = enabled
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: Dict[str, Tuple[Tuple[int, int], PostRecord]] = {}
+        self._seen: Set[str] = set()
+        self._dirty: bool = False
+
+        if self.enabled:
+            self._load()
+
+    def _load(self) -> None:
+        """Loads the index from disk; a missing or unreadable index simply starts empty."""
+        try:
+            with open(self.index_path, 'rb') as f:
+                payload: Dict[str, Any] = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception:
+            # Corrupted or incompatible cache: rebuild it from scratch
+            self._dirty = True
+            return
+
+        if not isinstance(payload, dict) or payload.get('version') != INDEX_FORMAT_VERSION:
+            self._dirty = True
+            return
+
+        self._entries = payload.get('entries', {})
+
+    def _is_fresh(self, filepath: str) -> bool:
+        """Returns True when the cached entry of a file still matches the file on disk."""
+        entry = self._entries.get(filepath)
+        return entry is not None and entry[0] == file_signature(filepath)
+
+    def get(self, filepath: str) -> PostRecord:
+        """Returns the record for a file, re-parsing it only if it changed on disk."""
+        self._seen.add(filepath)
+
+        if self._is_fresh(filepath):
+            self.hits += 1
+            return self._entries[filepath][1]
+
+        self.misses += 1
+        entry: Tuple[Tuple[int, int], PostRecord] = load_index_entry(filepath)
+        self.put(filepath, entry)
+        return entry[1]
+
+    def stale_files(self, filepaths: List[str]) -> List[str]:
+        """Returns the files whose entry is missing or outdated (i.e. that need parsing)."""
+        return [path for path in filepaths if not self._is_fresh(path)]
+
+    def put(self, filepath: str, entry: Tuple[Tuple[int, int], PostRecord]) -> None:
+        """Stores an entry produced by load_index_entry() (e.g. in a worker process)."""
+        self._entries[filepath] = entry
+        self._dirty = True
+
+    def discard(self, filepath: str) -> None:
+        """Forgets the entry of a file (e.g. deleted while a watcher is running)."""
+        self._seen.discard(filepath)
+        if self._entries.pop(filepath, None) is not None:
+            self._dirty = True
+
+    def _prune_missing(self) -> None:
+        """Forgets entries whose file has been deleted or moved since it was indexed."""
+        stale: List[str] = [
+            path for path in self._entries
+            if path not in self._seen and not os.path.exists(path)
+        ]
+        for path in stale:
+            del self._entries[path]
+        if stale:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Writes the index back to disk (atomically) if anything changed."""
+        if not self.enabled:
+            return
+
+        self._prune_missing()
+        if not self._dirty:
+            return
+
+        directory: str = os.path.dirname(self.index_path) or '.'
+        os.makedirs(directory, exist_ok=True)
+
+        # Write to a temporary file first, then swap it in place
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.frontmatter-index-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(
+                    {'version': INDEX_FORMAT_VERSION, 'entries': self._entries},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL
+                )
+            os.replace(tmp_path, self.index_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        self._dirty = False
@@ -0,0 +1,61 @@
+"""
+Git-Aware File Selection
+------------------------
+Lists the posts touched by a change so that pre-commit hooks and CI jobs only
+process those files instead of the whole blog:
+
+- `--since REF`: files that differ between REF and the working tree
+  (`git diff --name-only REF`), e.g. `--since origin/main`, plus the new posts
+  not added to git yet (`git ls-files --others --exclude-standard`);
+- `--staged`: files staged for the next commit (`git diff --name-only --cached`).
+
+Deleted files are ignored; renamed files are reported under their new name.
+Paths are read NUL-separated (`-z`), so git doesn't quote the non-ASCII ones
+('café/index.md' stays as-is).
+Only the files blog_corpus.discovery would report as posts are kept.
+"""
+
+import os
+import subprocess
+from typing import List, Optional, Set
+
+from .discovery import is_post_path
+
+
+class GitError(RuntimeError):
+    """Raised when git is missing or the diff can't be computed (e.g. unknown ref)."""
+
+
+def changed_posts(docs_dir: str, since: Optional[str] = None, staged: bool = False) -> List[str]:
+    """
+    Returns the sorted list of changed .md/.mdx files under `docs_dir`, with paths
+    relative to the current directory (like the globs of the scripts).
+    Exactly one of `since` and `staged` must be given.
+    """
+    if (since is None) == (not staged):
+        raise ValueError("Use either 'since' or 'staged'.")
+
+    command: List[str] = ['git', 'diff', '--name-only', '--relative', '--diff-filter=ACMR', '-z']
+    command += ['--cached'] if staged else [since]  # type: ignore[list-item]
+    command += ['--', docs_dir]
+
+    paths: List[str] = _git_paths(command)
+    if since is not None:
+        # New posts not added to git yet: not part of any diff
+        paths += _git_paths(['git', 'ls-files', '--others', '--exclude-standard', '-z', '--', docs_dir])
+
+    files: Set[str] = {os.path.normpath(path) for path in paths if is_post_path(path)}
+    return sorted(path for path in files if os.path.isfile(path))
+
+
+def _git_paths(command: List[str]) -> List[str]:
+    """Runs a git command printing NUL-separated paths (-z) and returns them."""
+    try:
+        completed = subprocess.run(command, capture_output=True, check=False)
+    except FileNotFoundError as e:
+        raise GitError("git executable not found.") from e
+
+    if completed.returncode != 0:
+        raise GitError(completed.stderr.decode('utf-8', 'replace').strip() or f"'{' '.join(command)}' failed.")
+
+    return [path for path in os.fsdecode(completed.stdout).split('\0') if path]
@@ -0,0 +1,165 @@
+"""
+Front Matter Line Patcher
+-------------------------
+Edits the top-level keys of a front matter block *in place*: only the lines
+of the keys being added, replaced or removed are touched, every other byte
+of the file (other keys, comments, quoting style, the whole body) is kept
+as-is. This avoids the reformatting noise of a full YAML re-serialization.
+
+Usage:
+    patch = FrontMatterPatch(text)
+    patch.remove('deprecatedStatus')
+    patch.set('language', 'en', sort_key=my_rank_function)
+    if patch.changed:
+        new_text = patch.render()
+
+Values written by set() are serialized with the shared YAML backend, so they
+follow the blog's formatting rules (flow-style lists, non-folded strings).
+"""
+
+import re
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+from .header_reader import YAML_BOUNDARY
+from .yaml_backend import DEFAULT_BACKEND, YamlBackend
+
+# A top-level 'key:' line: column 0, optionally quoted key, followed by ':' then a space or end of line
+TOP_LEVEL_KEY: re.Pattern[str] = re.compile(
+    r'''^(?P<token>"[^"]+"|'[^']+'|[^\s#'"\-][^:]*?)[ \t]*:(?:[ \t]|$)'''
+)
+
+
+class KeyBlock(NamedTuple):
+    """Lines [start, end) of the header holding one top-level key and its value."""
+    key: str
+    start: int
+    end: int
+
+
+def _is_continuation(line: str) -> bool:
+    """True for the lines that belong to the value of the previous key (indented or list items)."""
+    return line[:1] in (' ', '\t') or (line.startswith('-') and not YAML_BOUNDARY.match(line))
+
+
+class FrontMatterPatch:
+    """Line-level editor for the top-level keys of a front matter block."""
+
+    def __init__(self, text: str, backend: YamlBackend = DEFAULT_BACKEND) -> None:
+        """Raises ValueError when the text doesn't start with a closed '---' block."""
+        self.backend: YamlBackend = backend
+        self.changed: bool = False
+
+        lines: List[str] = text.splitlines(keepends=True)
+        if not lines or not YAML_BOUNDARY.match(lines[0]):
+            raise ValueError("The file doesn't start with a front matter block.")
+
+        closing: Optional[int] = next(
+            (i for i in range(1, len(lines)) if YAML_BOUNDARY.match(lines[i])),
+            None
+        )
+        if closing is None:
+            raise ValueError("The front matter block is never closed.")
+
+        self.newline: str = '\r\n' if lines[0].endswith('\r\n') else '\n'
+        self._opening: str = lines[0]
+        self._lines: List[str] = lines[1:closing]
+        self._rest: str = ''.join(lines[closing:])
+
+    def _blocks(self) -> List[KeyBlock]:
+        """Splits the header into top-level key blocks."""
+        blocks: List[KeyBlock] = []
+        current_key: Optional[str] = None
+        start: int = 0
+
+        for i, line in enumerate(self._lines):
+            if current_key is not None and _is_continuation(line):
+                continue
+
+            # The current block ends here (new key, blank line or comment)
+            if current_key is not None:
+                blocks.append(KeyBlock(current_key, start, i))
+                current_key = None
+
+            match = TOP_LEVEL_KEY.match(line)
+            if match:
+                current_key = match.group('token').strip('"\'')
+                start = i
+
+        if current_key is not None:
+            blocks.append(KeyBlock(current_key, start, len(self._lines)))
+
+        return blocks
+
+    def _find(self, key: str) -> Optional[KeyBlock]:
+        """Returns the first block of a key, if present."""
+        return next((block for block in self._blocks() if block.key == key), None)
+
+    def keys(self) -> List[str]:
+        """Returns the top-level keys in the order they appear in the header."""
+        return [block.key for block in self._blocks()]
+
+    def _serialize(self, key: str, value: Any) -> List[str]:
+        """Dumps a single 'key: value' pair with the shared YAML backend."""
+        dumped: str = self.backend.dump({key: value})
+        return [line + self.newline for line in dumped.splitlines()]
+
+    def remove(self, key: str) -> bool:
+        """Deletes all the lines of a key. Returns True if the key was present."""
+        block: Optional[KeyBlock] = self._find(key)
+        if block is None:
+            return False
+
+        del self._lines[block.start:block.end]
+        self.changed = True
+        return True
+
+    def rename(self, old_key: str, new_key: str) -> bool:
+        """Renames a key in place, keeping its value lines untouched. Returns True if renamed."""
+        block: Optional[KeyBlock] = self._find(old_key)
+        if block is None:
+            return False
+
+        line: str = self._lines[block.start]
+        match = TOP_LEVEL_KEY.match(line)
+        assert match is not None
+        # Only the key token changes: spacing, value and comments stay as they were
+        self._lines[block.start] = new_key + line[match.end('token'):]
+        self.changed = True
+        return True
+
+    def set(self, key: str, value: Any, sort_key: Optional[Callable[[str], Tuple[Any, ...]]] = None) -> bool:
+        """
+        Sets the value of a key. An existing key is rewritten where it stands;
+        a new key is inserted before the first key ranking after it according to
+        `sort_key` (or appended after the last key without `sort_key`).
+        Returns True if the header changed.
+        """
+        new_lines: List[str] = self._serialize(key, value)
+        block: Optional[KeyBlock] = self._find(key)
+
+        if block is not None:
+            if self._lines[block.start:block.end] == new_lines:
+                return False
+            self._lines[block.start:block.end] = new_lines
+            self.changed = True
+            return True
+
+        blocks: List[KeyBlock] = self._blocks()
+        position: int = blocks[-1].end if blocks else len(self._lines)
+        if sort_key is not None:
+            rank: Tuple[Any, ...] = sort_key(key)
+            following: Optional[KeyBlock] = next((b for b in blocks if sort_key(b.key) > rank), None)
+            if following is not None:
+                position = following.start
+
+        self._lines[position:position] = new_lines
+        self.changed = True
+        return True
+
+    def header_yaml(self) -> str:
+        """Returns the YAML text between the two boundary lines, as currently patched."""
+        return ''.join(self._lines)
+
+    def render(self) -> str:
+        """Returns the full text of the file, as currently patched."""
+        return self._opening + ''.join(self._lines) + self._rest
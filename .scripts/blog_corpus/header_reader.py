@@ -0,0 +1,61 @@
+"""
+Header-Only Front Matter Reader
+-------------------------------
+Streams a Markdown file line by line and stops at the closing '---' of the
+front matter block, so the body of the post (often a long tutorial full of
+code blocks) is never read nor kept in memory.
+
+Only YAML front matter is handled here; callers fall back to a full
+`frontmatter.loads()` when read_header() returns None.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+# Regex to find the YAML boundary (e.g., '---')
+YAML_BOUNDARY: re.Pattern[str] = re.compile(r'^-{3,}\s*$', re.MULTILINE)
+
+
+def locate_header(filepath: str) -> Optional[Tuple[int, str]]:
+    """
+    Returns (offset, header): the front matter block of a file, both '---' boundary
+    lines included, and the position of its first character in the text of the file
+    (as read in text mode, i.e. after the blank lines that may precede it).
+    The body of the post starts at `offset + len(header)`.
+
+    Returns None when the file doesn't start with a YAML boundary (after optional
+    blank lines, as python-frontmatter does) or when the block is never closed;
+    in both cases the caller has to look at the whole file.
+    """
+    header_lines: List[str] = []
+    offset: int = 0
+
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not header_lines:
+                if not line.strip():
+                    offset += len(line)
+                    continue  # Leading blank lines are ignored
+                if not YAML_BOUNDARY.match(line):
+                    return None  # No (YAML) front matter
+                header_lines.append(line)
+                continue
+
+            header_lines.append(line)
+            if YAML_BOUNDARY.match(line):
+                # Closing boundary found: stop reading, the body is never loaded
+                return offset, ''.join(header_lines)
+
+    return None  # Unterminated block
+
+
+def read_header(filepath: str) -> Optional[str]:
+    """Returns the front matter block of a file (see locate_header()), None when there is none."""
+    located: Optional[Tuple[int, str]] = locate_header(filepath)
+    return None if located is None else located[1]
+
+
+def split_header(header: str) -> str:
+    """Returns the YAML text found between the two boundary lines of a header."""
+    lines: List[str] = header.splitlines(keepends=True)
+    return ''.join(lines[1:-1])
@@ -0,0 +1,134 @@
+"""
+Per-Phase Profiler
+------------------
+Tells where the time of a script goes: file discovery, reading, YAML parsing,
+checks, YAML dumping or writing, and which files are the slowest.
+
+The scripts wrap each step in a named phase, optionally tied to a file:
+
+    from blog_corpus.profiler import PROFILER
+
+    with PROFILER.phase('parse', filepath):
+        post = frontmatter.loads(text)
+
+PROFILER is disabled by default: phase() then returns a shared no-op context
+manager, so the instrumentation costs next to nothing. The `--profile` flag
+of the scripts enables it and prints summary_lines() at the end; phases must
+not be nested, or their time would be counted twice.
+
+With `cprofile=True`, a cProfile.Profile runs for the whole session and can be
+saved with dump_stats() (open it with `python -m pstats FILE` or snakeviz).
+"""
+
+import cProfile
+import time
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, List, Optional, Tuple
+
+# Context manager returned by phase() while profiling is disabled
+_NO_PHASE: ContextManager[None] = nullcontext()
+
+
+class _Phase:
+    """Times one occurrence of a phase and records it on exit."""
+
+    __slots__ = ('profiler', 'name', 'filepath', 'start')
+
+    def __init__(self, profiler: 'PhaseProfiler', name: str, filepath: Optional[str]) -> None:
+        self.profiler: PhaseProfiler = profiler
+        self.name: str = name
+        self.filepath: Optional[str] = filepath
+        self.start: float = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.profiler.add(self.name, time.perf_counter() - self.start, self.filepath)
+
+
+class PhaseProfiler:
+    """Accumulates wall time per phase and per file."""
+
+    def __init__(self) -> None:
+        self.enabled: bool = False
+        # phase -> [total seconds, number of calls], in order of first use
+        self.phases: Dict[str, List[float]] = {}
+        # file -> total seconds over all its phases
+        self.files: Dict[str, float] = {}
+        self._started_at: Optional[float] = None
+        self._stopped_at: Optional[float] = None
+        self._cprofile: Optional[cProfile.Profile] = None
+
+    def start(self, cprofile: bool = False) -> None:
+        """Enables the profiler (and cProfile when asked) and starts the session clock."""
+        self.enabled = True
+        self._started_at = time.perf_counter()
+        if cprofile:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def stop(self) -> None:
+        """Stops the session clock (and cProfile)."""
+        self._stopped_at = time.perf_counter()
+        if self._cprofile is not None:
+            self._cprofile.disable()
+
+    def phase(self, name: str, filepath: Optional[str] = None) -> ContextManager[None]:
+        """Context manager timing a phase, attributed to `filepath` when given."""
+        if not self.enabled:
+            return _NO_PHASE
+        return _Phase(self, name, filepath)
+
+    def add(self, name: str, seconds: float, filepath: Optional[str] = None) -> None:
+        """Records a measure taken elsewhere."""
+        totals: List[float] = self.phases.setdefault(name, [0.0, 0])
+        totals[0] += seconds
+        totals[1] += 1
+        if filepath is not None:
+            self.files[filepath] = self.files.get(filepath, 0.0) + seconds
+
+    def total_seconds(self) -> float:
+        """Wall time of the session (up to now if it isn't stopped yet)."""
+        if self._started_at is None:
+            return 0.0
+        return (self._stopped_at or time.perf_counter()) - self._started_at
+
+    def slowest_files(self, top: int) -> List[Tuple[str, float]]:
+        """The `top` files with the highest time, slowest first."""
+        return sorted(self.files.items(), key=lambda item: item[1], reverse=True)[:top]
+
+    def summary_lines(self, top: int = 10) -> List[str]:
+        """Returns the report as plain text lines: one row per phase, then the slowest files."""
+        total: float = self.total_seconds()
+        measured: float = sum(seconds for seconds, _ in self.phases.values())
+        rows: List[Tuple[str, float, int]] = [(name, seconds, int(calls)) for name, (seconds, calls) in self.phases.items()]
+        # Everything outside the instrumented phases (imports, argument parsing, printing...)
+        rows.append(('other', max(0.0, total - measured), 0))
+
+        lines: List[str] = [
+            f"{'phase':<12} {'time (s)':>10} {'share':>7} {'calls':>8} {'avg (ms)':>10}",
+        ]
+        for name, seconds, calls in rows:
+            share: float = seconds / total * 100 if total > 0 else 0.0
+            average: str = f"{seconds / calls * 1000:>10.3f}" if calls else f"{'':>10}"
+            lines.append(f"{name:<12} {seconds:>10.3f} {share:>6.1f}% {calls or '':>8} {average}")
+        lines.append(f"{'total':<12} {total:>10.3f}")
+
+        slowest: List[Tuple[str, float]] = self.slowest_files(top)
+        if slowest:
+            lines.append('')
+            lines.append(f"Top {len(slowest)} slowest file(s):")
+            lines.extend(f"  {seconds * 1000:>9.3f} ms  {filepath}" for filepath, seconds in slowest)
+
+        return lines
+
+    def dump_stats(self, path: str) -> None:
+        """Writes the cProfile statistics (pstats format); requires start(cprofile=True)."""
+        if self._cprofile is None:
+            raise RuntimeError("cProfile wasn't enabled for this session.")
+        self._cprofile.dump_stats(path)
+
+
+# Profiler shared by the scripts and the blog_corpus modules of the current process
+PROFILER: PhaseProfiler = PhaseProfiler()
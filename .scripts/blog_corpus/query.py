@@ -0,0 +1,327 @@
+"""
+Front Matter Query Language
+---------------------------
+Evaluates small boolean expressions over the front matter of the whole blog:
+
+    tags contains docker and date >= 2025-01-01 and not image
+    (authors = christophe or authors = guest) and language != fr
+    title contains "docker compose"
+
+The corpus is stored column by column (one sparse column per key) in a
+ColumnarIndex built once per run. Conditions are answered from indexes
+built lazily, on first use of a key, instead of scanning every post:
+
+- a hash index (value -> rows) for `=`, `!=` and `contains` (list items
+  such as tags or authors are indexed one by one);
+- a sorted index for `<`, `<=`, `>` and `>=`, searched with bisect.
+
+Grammar (keywords are case-insensitive):
+
+    expression := term ('or' term)*
+    term       := factor ('and' factor)*
+    factor     := 'not' factor | '(' expression ')' | condition
+    condition  := KEY                      -- the key is present
+                | KEY OPERATOR VALUE       -- =, ==, !=, <, <=, >, >=, contains
+
+Values are bare words or quoted strings. `=` and `contains` ignore case;
+`contains` also matches substrings of text values (e.g. a title). Dates are
+compared as ISO strings (2025-01-01), numbers numerically.
+"""
+
+import bisect
+import datetime
+import re
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
+
+# Tokens: parentheses, comparison operators, quoted strings and bare words
+TOKEN_PATTERN: re.Pattern[str] = re.compile(
+    r'''\s*(?:(?P<paren>[()])|(?P<op><=|>=|!=|==|=|<|>)|"(?P<dquoted>[^"]*)"|'(?P<squoted>[^']*)'|(?P<word>[^\s()<>=!"']+))'''
+)
+
+KEYWORDS: Set[str] = {'and', 'or', 'not', 'contains'}
+RANGE_OPERATORS: Set[str] = {'<', '<=', '>', '>='}
+
+# Sorted index partitions: numbers are compared numerically, everything else as text
+NUMBER_KIND: int = 0
+TEXT_KIND: int = 1
+
+
+class QueryError(ValueError):
+    """Raised when a query can't be parsed."""
+
+
+# --- Syntax tree ---
+
+class Condition(NamedTuple):
+    key: str
+    operator: Optional[str] = None  # None: presence test
+    value: Optional[str] = None
+
+class Not(NamedTuple):
+    operand: 'Node'
+
+class And(NamedTuple):
+    left: 'Node'
+    right: 'Node'
+
+class Or(NamedTuple):
+    left: 'Node'
+    right: 'Node'
+
+Node = Union[Condition, Not, And, Or]
+
+
+# --- Parser ---
+
+class Token(NamedTuple):
+    kind: str  # 'paren', 'op', 'keyword', 'word' or 'string'
+    text: str
+
+
+def tokenize(text: str) -> List[Token]:
+    """Splits a query into tokens; raises QueryError on an unexpected character."""
+    tokens: List[Token] = []
+    position: int = 0
+    text = text.rstrip()
+
+    while position < len(text):
+        match = TOKEN_PATTERN.match(text, position)
+        if match is None or match.end() == position:
+            raise QueryError(f"Unexpected character at position {position}: {text[position:]!r}")
+        position = match.end()
+
+        if match.group('paren'):
+            tokens.append(Token('paren', match.group('paren')))
+        elif match.group('op'):
+            tokens.append(Token('op', match.group('op')))
+        elif match.group('dquoted') is not None or match.group('squoted') is not None:
+            quoted = match.group('dquoted')
+            tokens.append(Token('string', quoted if quoted is not None else match.group('squoted')))
+        elif match.group('word').lower() in KEYWORDS:
+            tokens.append(Token('keyword', match.group('word').lower()))
+        else:
+            tokens.append(Token('word', match.group('word')))
+
+    return tokens
+
+
+class _Parser:
+    """Recursive descent parser producing a syntax tree (see the grammar above)."""
+
+    def __init__(self, tokens: List[Token]) -> None:
+        self.tokens: List[Token] = tokens
+        self.position: int = 0
+
+    def _peek(self) -> Optional[Token]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _accept(self, kind: str, text: Optional[str] = None) -> Optional[Token]:
+        token: Optional[Token] = self._peek()
+        if token is not None and token.kind == kind and (text is None or token.text == text):
+            self.position += 1
+            return token
+        return None
+
+    def parse(self) -> Node:
+        node: Node = self._expression()
+        token: Optional[Token] = self._peek()
+        if token is not None:
+            raise QueryError(f"Unexpected '{token.text}'.")
+        return node
+
+    def _expression(self) -> Node:
+        node: Node = self._term()
+        while self._accept('keyword', 'or'):
+            node = Or(node, self._term())
+        return node
+
+    def _term(self) -> Node:
+        node: Node = self._factor()
+        while self._accept('keyword', 'and'):
+            node = And(node, self._factor())
+        return node
+
+    def _factor(self) -> Node:
+        if self._accept('keyword', 'not'):
+            return Not(self._factor())
+
+        if self._accept('paren', '('):
+            node: Node = self._expression()
+            if not self._accept('paren', ')'):
+                raise QueryError("Missing closing parenthesis.")
+            return node
+
+        key: Optional[Token] = self._accept('word') or self._accept('string')
+        if key is None:
+            token: Optional[Token] = self._peek()
+            raise QueryError(f"Expected a key, got '{token.text}'." if token else "Unexpected end of query.")
+
+        operator: Optional[Token] = self._accept('op') or self._accept('keyword', 'contains')
+        if operator is None:
+            return Condition(key.text)
+
+        value: Optional[Token] = self._accept('word') or self._accept('string')
+        if value is None:
+            raise QueryError(f"Missing value after '{key.text} {operator.text}'.")
+        return Condition(key.text, '=' if operator.text == '==' else operator.text, value.text)
+
+
+def parse_query(text: str) -> Node:
+    """Parses a query into a syntax tree; raises QueryError when it is invalid."""
+    tokens: List[Token] = tokenize(text)
+    if not tokens:
+        raise QueryError("The query is empty.")
+    return _Parser(tokens).parse()
+
+
+# --- Columnar index ---
+
+def _to_text(value: Any) -> str:
+    """Text form of a scalar, as written in a query (dates in ISO format, booleans lowercase)."""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if value is None:
+        return ''
+    return str(value)
+
+
+def _sort_key(value: Any) -> Tuple[int, Any]:
+    """Partition and comparable value of a scalar for the sorted index."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return NUMBER_KIND, float(value)
+    return TEXT_KIND, _to_text(value)
+
+
+def _literal_sort_key(literal: str) -> Tuple[int, Any]:
+    """Partition and comparable value of a query literal (numbers only match numbers)."""
+    try:
+        return NUMBER_KIND, float(literal)
+    except ValueError:
+        return TEXT_KIND, literal
+
+
+def _items(value: Any) -> List[Any]:
+    """The indexed items of a cell: each element of a list, or the value itself."""
+    return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+
+class ColumnarIndex:
+    """
+    Front matter of the corpus stored by column, with lazily built indexes.
+
+    Usage:
+        index = ColumnarIndex((path, metadata) for path, metadata in posts)
+        paths = index.query('tags contains docker and not image')
+    """
+
+    def __init__(self, records: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        self.paths: List[str] = []
+        # key -> {row: value}, only for the rows having the key
+        self.columns: Dict[str, Dict[int, Any]] = {}
+        self._hash_indexes: Dict[str, Dict[str, Set[int]]] = {}
+        self._sorted_indexes: Dict[str, Dict[int, Tuple[List[Any], List[int]]]] = {}
+
+        for row, (path, metadata) in enumerate(records):
+            self.paths.append(path)
+            for key, value in metadata.items():
+                self.columns.setdefault(str(key), {})[row] = value
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def _hash_index(self, key: str) -> Dict[str, Set[int]]:
+        """Lower-cased value (or list item) -> rows, built on first use of a key."""
+        index: Optional[Dict[str, Set[int]]] = self._hash_indexes.get(key)
+        if index is None:
+            index = {}
+            for row, value in self.columns.get(key, {}).items():
+                for item in _items(value):
+                    index.setdefault(_to_text(item).lower(), set()).add(row)
+            self._hash_indexes[key] = index
+        return index
+
+    def _sorted_index(self, key: str) -> Dict[int, Tuple[List[Any], List[int]]]:
+        """Partition -> (sorted values, matching rows), built on first use of a key."""
+        index: Optional[Dict[int, Tuple[List[Any], List[int]]]] = self._sorted_indexes.get(key)
+        if index is None:
+            pairs: Dict[int, List[Tuple[Any, int]]] = {}
+            for row, value in self.columns.get(key, {}).items():
+                for item in _items(value):
+                    if isinstance(item, (dict, list)):
+                        continue
+                    kind, comparable = _sort_key(item)
+                    pairs.setdefault(kind, []).append((comparable, row))
+            index = {}
+            for kind, entries in pairs.items():
+                entries.sort()
+                index[kind] = ([value for value, _ in entries], [row for _, row in entries])
+            self._sorted_indexes[key] = index
+        return index
+
+    def has(self, key: str) -> Set[int]:
+        """Rows where the key is present."""
+        return set(self.columns.get(key, ()))
+
+    def equals(self, key: str, literal: str) -> Set[int]:
+        """Rows where the value (or one of the list items) equals the literal, ignoring case."""
+        return set(self._hash_index(key).get(literal.lower(), ()))
+
+    def contains(self, key: str, literal: str) -> Set[int]:
+        """Rows where a list item equals the literal, or a text value contains it (ignoring case)."""
+        needle: str = literal.lower()
+        rows: Set[int] = self.equals(key, literal)
+        # Substring search is only needed on text cells of this column
+        for row, value in self.columns.get(key, {}).items():
+            if row not in rows and isinstance(value, str) and needle in value.lower():
+                rows.add(row)
+        return rows
+
+    def compare(self, key: str, operator: str, literal: str) -> Set[int]:
+        """Rows where a value satisfies a range condition (<, <=, >, >=), using bisect."""
+        kind, bound = _literal_sort_key(literal)
+        partition: Optional[Tuple[List[Any], List[int]]] = self._sorted_index(key).get(kind)
+        if partition is None:
+            return set()
+
+        values, rows = partition
+        if operator == '<':
+            return set(rows[:bisect.bisect_left(values, bound)])
+        if operator == '<=':
+            return set(rows[:bisect.bisect_right(values, bound)])
+        if operator == '>':
+            return set(rows[bisect.bisect_right(values, bound):])
+        return set(rows[bisect.bisect_left(values, bound):])
+
+    def evaluate(self, node: Node) -> Set[int]:
+        """Returns the rows matching a syntax tree."""
+        if isinstance(node, And):
+            left: Set[int] = self.evaluate(node.left)
+            return left & self.evaluate(node.right) if left else left
+        if isinstance(node, Or):
+            return self.evaluate(node.left) | self.evaluate(node.right)
+        if isinstance(node, Not):
+            return set(range(len(self.paths))) - self.evaluate(node.operand)
+
+        if node.operator is None:
+            return self.has(node.key)
+
+        value: str = node.value or ''
+        if node.operator == '=':
+            return self.equals(node.key, value)
+        if node.operator == '!=':
+            return self.has(node.key) - self.equals(node.key, value)
+        if node.operator == 'contains':
+            return self.contains(node.key, value)
+        if node.operator in RANGE_OPERATORS:
+            return self.compare(node.key, node.operator, value)
+        raise QueryError(f"Unknown operator '{node.operator}'.")
+
+    def select(self, node: Node) -> List[str]:
+        """Returns the sorted paths of the posts matching a parsed query."""
+        return sorted(self.paths[row] for row in self.evaluate(node))
+
+    def query(self, text: str) -> List[str]:
+        """Returns the sorted paths of the posts matching a query (raises QueryError)."""
+        return self.select(parse_query(text))
@@ -0,0 +1,159 @@
+"""
+Machine-Readable Output
+-----------------------
+Lets the scripts report their results as JSON instead of colored text, so
+dashboards and other tools can consume the checks without scraping the
+terminal (`--format ndjson|json` on every subcommand).
+
+Each finding is one record, a flat JSON object with a `type`:
+
+    {"type": "issue", "file": "blog/2025/01/02/post/index.md", "check": "seo", "message": "..."}
+
+and the run ends with a single summary record, always the last one:
+
+    {"type": "summary", "command": "check-all", "status": 1, "files": 248, "files_with_issues": 3}
+
+- ndjson: one record per line, written and flushed as soon as it is emitted,
+  so `... | jq` or a dashboard sees the findings while the run goes on;
+- json: one document, {"command": ..., "records": [...], "summary": {...}},
+  written at the end of the run.
+
+The scripts wrap their action in a session, and keep their text output as is:
+
+    from blog_corpus.record_output import OUTPUT
+
+    with OUTPUT.session(args.format, args.action):
+        OUTPUT.emit('issue', file=filepath, check='seo', message=issue)
+        OUTPUT.summary(files=len(files))
+
+OUTPUT is disabled by default ('text'): emit() then returns at once. In the
+JSON formats, the text printed on stdout during the session is discarded, so
+stdout only holds JSON. Dates and other non-JSON values are written as strings.
+"""
+
+import datetime
+import json
+import os
+import sys
+from contextlib import contextmanager, redirect_stdout
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+# Values accepted by --format ('text' is the colored console output)
+OUTPUT_FORMATS: List[str] = ['text', 'ndjson', 'json']
+
+
+def _to_json(value: Any) -> Any:
+    """json.dumps() fallback: dates as ISO strings, sets as sorted lists, anything else as str()."""
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def _exit_status(code: Any) -> int:
+    """The process exit status of a SystemExit code."""
+    if code is None:
+        return 0
+    return code if isinstance(code, int) else 1
+
+
+class RecordWriter:
+    """Writes the records of one command as NDJSON or JSON (or nothing, in 'text' format)."""
+
+    def __init__(self) -> None:
+        self.format: str = 'text'
+        self.command: Optional[str] = None
+        self.stream: TextIO = sys.stdout
+        self._records: List[Dict[str, Any]] = []
+        self._summary: Dict[str, Any] = {}
+        # True once the reader of the stream has gone away
+        self._closed: bool = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.format != 'text'
+
+    def start(self, output_format: str, command: Optional[str], stream: Optional[TextIO] = None) -> None:
+        """Selects the format of the run. Raises ValueError for an unknown format."""
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format '{output_format}'. Expected one of: {', '.join(OUTPUT_FORMATS)}.")
+        self.format = output_format
+        self.command = command
+        self.stream = stream if stream is not None else sys.stdout
+        self._records = []
+        self._summary = {}
+        self._closed = False
+
+    def _write(self, document: Dict[str, Any]) -> None:
+        if self._closed:
+            return
+        try:
+            self.stream.write(json.dumps(document, ensure_ascii=False, default=_to_json) + '\n')
+            self.stream.flush()
+        except BrokenPipeError:
+            # The reader went away (e.g. `| head`): stop the run without a traceback,
+            # and point the stream at /dev/null so that the final flush of Python succeeds
+            self._closed = True
+            os.dup2(os.open(os.devnull, os.O_WRONLY), self.stream.fileno())
+            raise SystemExit(1)
+
+    def emit(self, record_type: str, **fields: Any) -> None:
+        """Outputs one finding (streamed at once in ndjson, kept for the document in json)."""
+        if not self.enabled:
+            return
+        record: Dict[str, Any] = {'type': record_type, **fields}
+        if self.format == 'ndjson':
+            self._write(record)
+        else:
+            self._records.append(record)
+
+    def summary(self, **fields: Any) -> None:
+        """Adds fields to the summary record written by finish()."""
+        if self.enabled:
+            self._summary.update(fields)
+
+    def finish(self, status: int = 0) -> None:
+        """Writes the summary record (and, in json, the whole document). Does nothing in 'text' format."""
+        if not self.enabled:
+            return
+        summary: Dict[str, Any] = {'type': 'summary', 'command': self.command, 'status': status, **self._summary}
+        if self.format == 'ndjson':
+            self._write(summary)
+        else:
+            self._write({'command': self.command, 'records': self._records, 'summary': summary})
+        self._records = []
+        self._summary = {}
+
+    @contextmanager
+    def human_output(self) -> Iterator[None]:
+        """Discards the text printed on stdout while the output is JSON."""
+        if not self.enabled:
+            yield
+            return
+        with open(os.devnull, 'w', encoding='utf-8') as devnull, redirect_stdout(devnull):
+            yield
+
+    @contextmanager
+    def session(self, output_format: str, command: Optional[str]) -> Iterator[None]:
+        """
+        Runs a command in `output_format`: its text output is discarded (JSON formats),
+        and the summary is written on exit, with the exit status (sys.exit() included).
+        """
+        self.start(output_format, command)
+        status: int = 0
+        try:
+            with self.human_output():
+                yield
+        except SystemExit as e:
+            status = _exit_status(e.code)
+            raise
+        except BaseException:
+            status = 1
+            raise
+        finally:
+            self.finish(status)
+
+
+# Shared writer: disabled ('text') until a script starts a session
+OUTPUT: RecordWriter = RecordWriter()
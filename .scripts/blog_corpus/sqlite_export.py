@@ -0,0 +1,228 @@
+"""
+SQLite Export of the Front Matter Corpus
+----------------------------------------
+Writes the front matter of every post into a SQLite database so that
+analytics questions become plain SQL instead of chained shell commands:
+
+    -- Posts per tag per year
+    SELECT t.tag, p.year, COUNT(*) FROM tags t JOIN posts p ON p.id = t.post_id
+    GROUP BY t.tag, p.year ORDER BY t.tag, p.year;
+
+    -- Posts with a short description
+    SELECT path, length(description) FROM posts WHERE length(description) < 50;
+
+Schema (normalized, indexed on the columns used for lookups and joins):
+
+- posts:   one row per file (path, signature, the common keys as columns);
+- keys:    every top-level key of every post, its value stored as JSON;
+- tags:    one row per (post, tag);
+- authors: one row per (post, author).
+
+The export is incremental: the (mtime_ns, size) signature of each file is
+stored with its row, so only new or changed posts are upserted and deleted
+posts are removed. All the changes of a run are written in one transaction.
+"""
+
+import datetime
+import json
+import os
+import sqlite3
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .frontmatter_index import PostRecord
+
+# Bumped when the schema changes: the database is then rebuilt from scratch
+SCHEMA_VERSION: int = 1
+
+# Default location of the database, next to the front matter index
+DEFAULT_DATABASE_PATH: str = os.path.join('.cache', 'frontmatter.sqlite')
+
+# Front matter keys copied into a column of 'posts' (key -> column)
+POST_COLUMNS: Dict[str, str] = {
+    'slug': 'slug',
+    'title': 'title',
+    'description': 'description',
+    'date': 'date',
+    'language': 'language',
+    'image': 'image',
+    'mainTag': 'main_tag',
+}
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS posts (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    slug TEXT,
+    title TEXT,
+    description TEXT,
+    date TEXT,
+    year INTEGER,
+    language TEXT,
+    image TEXT,
+    main_tag TEXT,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS keys (
+    post_id INTEGER NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (post_id, key)
+);
+CREATE TABLE IF NOT EXISTS tags (
+    post_id INTEGER NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (post_id, tag)
+);
+CREATE TABLE IF NOT EXISTS authors (
+    post_id INTEGER NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
+    author TEXT NOT NULL,
+    PRIMARY KEY (post_id, author)
+);
+CREATE INDEX IF NOT EXISTS idx_posts_date ON posts(date);
+CREATE INDEX IF NOT EXISTS idx_posts_year ON posts(year);
+CREATE INDEX IF NOT EXISTS idx_posts_slug ON posts(slug);
+CREATE INDEX IF NOT EXISTS idx_keys_key ON keys(key);
+CREATE INDEX IF NOT EXISTS idx_tags_tag ON tags(tag);
+CREATE INDEX IF NOT EXISTS idx_authors_author ON authors(author);
+"""
+
+TABLES: Tuple[str, ...] = ('authors', 'tags', 'keys', 'posts', 'meta')
+
+
+def _to_text(value: Any) -> Any:
+    """Column value of a scalar: dates in ISO format, other non-SQL types as text."""
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return str(value)
+
+
+def _to_json(value: Any) -> str:
+    """JSON form of any front matter value (dates in ISO format)."""
+    return json.dumps(value, ensure_ascii=False, default=_to_text)
+
+
+def _as_list(value: Any) -> List[str]:
+    """Items of a list-like key (tags, authors); a single value becomes a one-item list."""
+    if value is None:
+        return []
+    items: List[Any] = list(value) if isinstance(value, (list, tuple)) else [value]
+    return [str(item) for item in items if item is not None and not isinstance(item, (dict, list))]
+
+
+def _year(date: Any) -> Any:
+    """Year of the 'date' key, when it can be told."""
+    if isinstance(date, (datetime.date, datetime.datetime)):
+        return date.year
+    if isinstance(date, str) and date[:4].isdigit():
+        return int(date[:4])
+    return None
+
+
+def connect(database_path: str = DEFAULT_DATABASE_PATH, rebuild: bool = False) -> sqlite3.Connection:
+    """
+    Opens (or creates) the database and makes sure the schema is up to date.
+    With `rebuild`, or when the schema version changed, every table is dropped first.
+    """
+    directory: str = os.path.dirname(database_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    connection: sqlite3.Connection = sqlite3.connect(database_path)
+    connection.execute('PRAGMA foreign_keys = ON')
+
+    version: Any = None
+    try:
+        row = connection.execute("SELECT value FROM meta WHERE name = 'schema_version'").fetchone()
+        version = row[0] if row else None
+    except sqlite3.OperationalError:
+        pass  # New database
+
+    with connection:
+        if rebuild or (version is not None and version != str(SCHEMA_VERSION)):
+            for table in TABLES:
+                connection.execute(f'DROP TABLE IF EXISTS {table}')
+        connection.executescript(SCHEMA)
+        connection.execute(
+            "INSERT OR REPLACE INTO meta (name, value) VALUES ('schema_version', ?)",
+            (str(SCHEMA_VERSION),)
+        )
+
+    return connection
+
+
+def plan_export(connection: sqlite3.Connection, signatures: Dict[str, Tuple[int, int]]) -> Tuple[List[str], List[str]]:
+    """
+    Compares the files on disk with the database.
+    Returns (files to upsert, paths to delete): new or changed files, and rows whose file is gone.
+    """
+    stored: Dict[str, Tuple[int, int]] = {
+        path: (mtime_ns, size)
+        for path, mtime_ns, size in connection.execute('SELECT path, mtime_ns, size FROM posts')
+    }
+    to_upsert: List[str] = sorted(path for path, signature in signatures.items() if stored.get(path) != signature)
+    to_delete: List[str] = sorted(path for path in stored if path not in signatures)
+    return to_upsert, to_delete
+
+
+def apply_export(connection: sqlite3.Connection,
+                 posts: Iterable[Tuple[str, Tuple[int, int], PostRecord]],
+                 deleted: Iterable[str]) -> Tuple[int, int]:
+    """
+    Upserts posts given as (path, signature, record) and deletes removed paths,
+    all in one transaction. Returns (upserted, deleted) counts.
+    """
+    upserted: int = 0
+    removed: int = 0
+
+    with connection:
+        for path in deleted:
+            connection.execute('DELETE FROM posts WHERE path = ?', (path,))
+            removed += 1
+
+        key_rows: List[Tuple[int, str, str]] = []
+        tag_rows: List[Tuple[int, str, int]] = []
+        author_rows: List[Tuple[int, str]] = []
+
+        for path, (mtime_ns, size), record in posts:
+            metadata: Dict[str, Any] = record.metadata if record.error is None else {}
+            # Nested values (lists, mappings) only live in 'keys', as JSON
+            columns: Dict[str, Any] = {
+                column: None if isinstance(metadata.get(key), (dict, list)) else _to_text(metadata.get(key))
+                for key, column in POST_COLUMNS.items()
+            }
+            values: Dict[str, Any] = {
+                'path': path, 'mtime_ns': mtime_ns, 'size': size,
+                'year': _year(metadata.get('date')), 'error': record.error,
+                **columns,
+            }
+            names: List[str] = list(values)
+            connection.execute(
+                f"INSERT INTO posts ({', '.join(names)}) VALUES ({', '.join('?' for _ in names)}) "
+                f"ON CONFLICT(path) DO UPDATE SET {', '.join(f'{n} = excluded.{n}' for n in names if n != 'path')}",
+                [values[n] for n in names]
+            )
+            post_id: int = connection.execute('SELECT id FROM posts WHERE path = ?', (path,)).fetchone()[0]
+
+            # Child rows are rewritten as a whole
+            for table in ('keys', 'tags', 'authors'):
+                connection.execute(f'DELETE FROM {table} WHERE post_id = ?', (post_id,))
+
+            key_rows.extend((post_id, str(key), _to_json(value)) for key, value in metadata.items())
+            tag_rows.extend((post_id, tag, position) for position, tag in enumerate(_as_list(metadata.get('tags'))))
+            author_rows.extend((post_id, author) for author in _as_list(metadata.get('authors')))
+            upserted += 1
+
+        connection.executemany('INSERT OR IGNORE INTO keys (post_id, key, value) VALUES (?, ?, ?)', key_rows)
+        connection.executemany('INSERT OR IGNORE INTO tags (post_id, tag, position) VALUES (?, ?, ?)', tag_rows)
+        connection.executemany('INSERT OR IGNORE INTO authors (post_id, author) VALUES (?, ?)', author_rows)
+
+    return upserted, removed
@@ -0,0 +1,146 @@
+"""
+Tag Co-occurrence
+-----------------
+Which tags are used together, for the related-tag suggestions of the tags
+manager (`cooccurrence` action) and for spotting tags that always appear
+together (merge candidates).
+
+The posts of a PostTable (see compact.py) become a sparse posts × tags
+incidence matrix X (1 when the post uses the tag), built in one pass from the
+tag id arrays the table already holds. The tag × tag co-occurrence matrix is
+then a single sparse product, C = Xᵀ·X:
+
+- C[i, i] is the number of posts using tag i;
+- C[i, j] is the number of posts using both tags i and j.
+
+Only the pairs of tags used together are stored, so thousands of tags never
+need a dense matrix. Two scores are computed for every pair, as NumPy array
+operations over the non-zero entries:
+
+- Jaccard: C[i, j] / (C[i, i] + C[j, j] - C[i, j]), the share of the posts
+  using either tag that use both (1.0: always together);
+- PMI (pointwise mutual information): log(C[i, j] × N / (C[i, i] × C[j, j])),
+  N being the number of tagged posts; > 0 when the tags meet more often than
+  by chance, highest for rare tags that always come together.
+
+NumPy and SciPy are optional dependencies of the scripts: only this module
+needs them (check cooccurrence_available() before using it).
+
+Usage:
+    table = PostTable()
+    for post in corpus.posts():
+        table.add(post.path, post.metadata)
+    cooccurrence = TagCooccurrence(table)
+    for tag_id, related in cooccurrence.top_related(5, metric='jaccard', min_count=2).items():
+        print(table.tags[tag_id], [table.tags[item.tag_id] for item in related])
+"""
+
+from array import array
+from typing import Any, Dict, List, NamedTuple
+
+from .compact import ID_TYPECODE, CompactPost, PostTable
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:
+    np = None
+    sparse = None
+
+# Scores a tag's related tags can be ranked by
+METRICS: List[str] = ['jaccard', 'pmi']
+
+
+def cooccurrence_available() -> bool:
+    """True when NumPy and SciPy can be imported."""
+    return np is not None and sparse is not None
+
+
+class TagPair(NamedTuple):
+    """Two tags (ids of the PostTable) used together, and their scores."""
+    tag_id: int
+    other_id: int
+    count: int  # Posts using both tags
+    jaccard: float
+    pmi: float
+
+
+class TagCooccurrence:
+    """Sparse tag × tag co-occurrence counts of the posts of a PostTable, with their scores."""
+
+    def __init__(self, table: PostTable) -> None:
+        tagged: List[CompactPost] = [post for post in table.posts if post.tag_ids]
+        # Number of tagged posts (N of the PMI)
+        self.posts: int = len(tagged)
+
+        # Incidence matrix in COO form: one (post, tag) entry per tag of each post
+        tag_ids: array = array(ID_TYPECODE)
+        for post in tagged:
+            tag_ids.extend(post.tag_ids)
+        columns: Any = np.frombuffer(tag_ids, dtype=np.uintc) if tag_ids else np.zeros(0, dtype=np.uintc)
+        rows: Any = np.repeat(np.arange(self.posts), [len(post.tag_ids) for post in tagged])
+
+        # Converting to CSR sums the duplicates (a tag listed twice in a post): reset them to 1
+        incidence: Any = sparse.csr_matrix(
+            (np.ones(len(columns), dtype=np.int32), (rows, columns)),
+            shape=(self.posts, len(table.tags))
+        )
+        incidence.data[:] = 1
+
+        cooccurrence: Any = (incidence.T @ incidence).tocoo()
+        # Posts using each tag, indexed by tag id
+        self.counts: Any = cooccurrence.diagonal()
+
+        # The pairs of distinct tags used together (both orders), with their scores
+        off_diagonal: Any = cooccurrence.row != cooccurrence.col
+        self.rows: Any = cooccurrence.row[off_diagonal]
+        self.columns: Any = cooccurrence.col[off_diagonal]
+        self.together: Any = cooccurrence.data[off_diagonal]
+
+        together: Any = self.together.astype(np.float64)
+        row_counts: Any = self.counts[self.rows].astype(np.float64)
+        column_counts: Any = self.counts[self.columns].astype(np.float64)
+        self.jaccard: Any = together / (row_counts + column_counts - together)
+        self.pmi: Any = np.log(together * self.posts / (row_counts * column_counts))
+
+    def _pair(self, index: int) -> TagPair:
+        return TagPair(
+            int(self.rows[index]), int(self.columns[index]), int(self.together[index]),
+            float(self.jaccard[index]), float(self.pmi[index])
+        )
+
+    def top_related(self, top: int, metric: str = 'jaccard', min_count: int = 1) -> Dict[int, List[TagPair]]:
+        """
+        Tag id -> its `top` related tags (TagPair, other_id being the related tag), best
+        `metric` score first (ties: the most posts together first). Only the pairs used
+        together in at least `min_count` posts are kept; tags without any are left out.
+        """
+        score: Any = self.jaccard if metric == 'jaccard' else self.pmi
+        kept: Any = np.flatnonzero(self.together >= min_count)
+
+        # Sorted by tag, then by score and count (descending): the first `top` entries of each tag are its best
+        order: Any = kept[np.lexsort((-self.together[kept], -score[kept], self.rows[kept]))]
+        sorted_rows: Any = self.rows[order]
+        first_of_row: Any = np.searchsorted(sorted_rows, sorted_rows, side='left')
+        best: Any = order[np.arange(len(order)) - first_of_row < top]
+
+        related: Dict[int, List[TagPair]] = {}
+        for index in best.tolist():
+            pair: TagPair = self._pair(index)
+            related.setdefault(pair.tag_id, []).append(pair)
+        return related
+
+    def pairs(self, min_jaccard: float, min_count: int = 1) -> List[TagPair]:
+        """
+        The pairs of tags (tag_id < other_id) whose Jaccard score is at least `min_jaccard`,
+        used together in at least `min_count` posts: best score first.
+        """
+        kept: Any = np.flatnonzero(
+            (self.rows < self.columns) & (self.jaccard >= min_jaccard) & (self.together >= min_count)
+        )
+        order: Any = kept[np.lexsort((-self.together[kept], -self.jaccard[kept]))]
+        return [self._pair(index) for index in order.tolist()]
+
+    def __len__(self) -> int:
+        """Number of pairs of distinct tags used together."""
+        return len(self.together) // 2
@@ -0,0 +1,187 @@
+"""
+Persistent Tag Index
+--------------------
+An inverted index of the tags of the blog: lowercase tag -> the posts using
+it, with the (mtime, size) signature of each post when it was indexed. It is
+kept on disk next to the front matter index (default: '.cache/tag-index'), so
+renaming or deleting a tag only opens the posts that carry it instead of
+loading the records of the whole blog.
+
+The index is brought up to date incrementally by refresh(): every post is
+stat()ed (no file is opened), and only the posts that are new or changed
+since they were indexed have their front matter read again; deleted posts are
+forgotten. A command rewriting a post records its new tags with update(), so
+the next run doesn't read it again.
+
+Usage:
+    index = TagIndex()
+    index.refresh(find_posts('blog'))
+    for path in index.paths_with(['docker']):   # posts using 'docker' (any case)
+        ...
+    index.save()
+
+Posts whose front matter can't be parsed are returned by paths_with() too,
+so that the caller opens them and reports the error.
+"""
+
+import os
+import pickle
+import tempfile
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .frontmatter_index import PostRecord, file_signature, parse_post_file
+
+# Default on-disk location of the index, relative to the repository root
+DEFAULT_TAG_INDEX_PATH: str = os.path.join('.cache', 'tag-index')
+
+# Bump this number whenever the layout of the index changes
+TAG_INDEX_FORMAT_VERSION: int = 1
+
+# (mtime_ns, size) of a post when it was indexed (see frontmatter_index.file_signature())
+Signature = Tuple[int, int]
+
+
+def _lowercase_tags(tags: Any) -> Tuple[str, ...]:
+    """The distinct lowercase tags of a tags value (only a list holds tags)."""
+    if not isinstance(tags, list):
+        return ()
+    return tuple(dict.fromkeys(str(tag).lower() for tag in tags if tag is not None))
+
+
+class TagIndex:
+    """On-disk inverted index: lowercase tag -> {path: signature}."""
+
+    def __init__(self, index_path: str = DEFAULT_TAG_INDEX_PATH, enabled: bool = True) -> None:
+        self.index_path: str = index_path
+        self.enabled: bool = enabled
+        # Number of posts read again by refresh() during this run
+        self.reindexed: int = 0
+        # Lowercase tag -> {path: signature of the post}
+        self._tags: Dict[str, Dict[str, Signature]] = {}
+        # Path -> (signature, lowercase tags), None as tags when the front matter can't be parsed
+        self._posts: Dict[str, Tuple[Signature, Optional[Tuple[str, ...]]]] = {}
+        # Posts whose front matter can't be parsed
+        self._unparsable: Set[str] = set()
+        self._dirty: bool = False
+
+        if self.enabled:
+            self._load()
+
+    def _load(self) -> None:
+        """Loads the index from disk; a missing or unreadable index simply starts empty."""
+        try:
+            with open(self.index_path, 'rb') as f:
+                payload: Dict[str, Any] = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception:
+            # Corrupted or incompatible cache: rebuild it from scratch
+            self._dirty = True
+            return
+
+        if not isinstance(payload, dict) or payload.get('version') != TAG_INDEX_FORMAT_VERSION:
+            self._dirty = True
+            return
+
+        self._tags = payload.get('tags', {})
+        self._posts = payload.get('posts', {})
+        self._unparsable = {path for path, (_, tags) in self._posts.items() if tags is None}
+
+    def _store(self, path: str, signature: Signature, tags: Optional[Tuple[str, ...]]) -> None:
+        """Replaces the indexed tags of a post."""
+        self._forget(path)
+        self._posts[path] = (signature, tags)
+        if tags is None:
+            self._unparsable.add(path)
+        for tag in tags or ():
+            self._tags.setdefault(tag, {})[path] = signature
+        self._dirty = True
+
+    def _forget(self, path: str) -> None:
+        previous: Optional[Tuple[Signature, Optional[Tuple[str, ...]]]] = self._posts.pop(path, None)
+        if previous is None:
+            return
+        self._unparsable.discard(path)
+        for tag in previous[1] or ():
+            paths: Optional[Dict[str, Signature]] = self._tags.get(tag)
+            if paths is not None:
+                paths.pop(path, None)
+                if not paths:
+                    del self._tags[tag]
+        self._dirty = True
+
+    def refresh(self, paths: List[str], complete: bool = True) -> List[str]:
+        """
+        Reads again the posts of `paths` that are new or changed since they were indexed,
+        and returns them. With `complete` (the list holds every post of the blog), the
+        indexed posts missing from it are forgotten.
+        """
+        changed: List[str] = []
+        for path in paths:
+            try:
+                signature: Signature = file_signature(path)
+            except OSError:
+                self._forget(path)
+                continue
+            indexed: Optional[Tuple[Signature, Optional[Tuple[str, ...]]]] = self._posts.get(path)
+            if indexed is not None and indexed[0] == signature:
+                continue
+
+            try:
+                record: PostRecord = parse_post_file(path)
+            except Exception:
+                self._store(path, signature, None)  # Unreadable: the caller reports it
+            else:
+                self._store(path, signature, None if record.error is not None else _lowercase_tags(record.metadata.get('tags')))
+            changed.append(path)
+
+        if complete:
+            listed: Set[str] = set(paths)
+            for path in [path for path in self._posts if path not in listed]:
+                self._forget(path)
+
+        self.reindexed += len(changed)
+        return changed
+
+    def update(self, path: str, tags: Any) -> None:
+        """Records the tags just written to a post (its signature is taken now)."""
+        self._store(path, file_signature(path), _lowercase_tags(tags))
+
+    def discard(self, path: str) -> None:
+        """Forgets a post (e.g. deleted)."""
+        self._forget(path)
+
+    def paths_with(self, tags: Iterable[str]) -> List[str]:
+        """The sorted paths of the posts using one of the tags (case-insensitive), or that can't be parsed."""
+        found: Set[str] = set(self._unparsable)
+        for tag in tags:
+            found.update(self._tags.get(str(tag).lower(), ()))
+        return sorted(found)
+
+    def save(self) -> None:
+        """Writes the index back to disk (atomically) if anything changed."""
+        if not self.enabled or not self._dirty:
+            return
+
+        directory: str = os.path.dirname(self.index_path) or '.'
+        os.makedirs(directory, exist_ok=True)
+
+        # Write to a temporary file first, then swap it in place
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tag-index-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(
+                    {'version': TAG_INDEX_FORMAT_VERSION, 'tags': self._tags, 'posts': self._posts},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL
+                )
+            os.replace(tmp_path, self.index_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._posts)
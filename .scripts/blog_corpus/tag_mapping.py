@@ -0,0 +1,123 @@
+"""
+Tag Mappings
+------------
+Applies a whole taxonomy clean-up (renames, merges, deletions of tags) in a
+single pass, so each post is read and rewritten at most once instead of once
+per `rename`/`delete` run.
+
+A mapping is a YAML file of `old tag: new tag` entries (case-insensitive on
+the old tag):
+
+    prog: programming      # rename
+    k8s: kubernetes        # merge: several old tags renamed to the same tag
+    kubernets: kubernetes
+    Docker: docker         # fix the case of a tag
+    draft: ~               # delete (null)
+
+The mapping is compiled once into a lowercase lookup dict; the tags of a post
+are then remapped in one loop, the duplicates produced by merges being
+dropped with a set of the lowercase tags already kept.
+
+Usage:
+    mapping = load_tag_mapping('mapping.yaml')
+    if mapping.matches(post.metadata.get('tags')):
+        new_tags, changes = mapping.remap(post.metadata['tags'])   # changes: [(old, new or None)]
+
+Every entry is checked when the mapping is loaded: an invalid mapping is
+reported before any file is touched.
+"""
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .yaml_backend import DEFAULT_BACKEND
+
+
+class TagMappingError(ValueError):
+    """Raised when a mapping file can't be read or holds an invalid entry."""
+
+
+def _tag_text(value: Any) -> str:
+    """A tag of a mapping entry or of a post, as text ('2024' for the number 2024)."""
+    return value if isinstance(value, str) else str(value)
+
+
+class TagMapping:
+    """A compiled tag mapping: lowercase old tag -> new tag (None to delete it)."""
+
+    def __init__(self, lookup: Dict[str, Optional[str]]) -> None:
+        self.lookup: Dict[str, Optional[str]] = lookup
+
+    def matches(self, tags: Any) -> bool:
+        """True when a tags value (a list) holds a tag of the mapping."""
+        return isinstance(tags, list) and not self.lookup.keys().isdisjoint(_tag_text(tag).lower() for tag in tags)
+
+    def remap(self, tags: List[Any]) -> Tuple[List[Any], List[Tuple[str, Optional[str]]]]:
+        """
+        Returns the remapped tags (first spelling kept when two tags become the same)
+        and the (old tag, new tag or None) changes made.
+        """
+        result: List[Any] = []
+        changes: List[Tuple[str, Optional[str]]] = []
+        kept: Set[str] = set()
+
+        for tag in tags:
+            tag_lower: str = _tag_text(tag).lower()
+            if tag_lower in self.lookup:
+                new_tag: Optional[str] = self.lookup[tag_lower]
+                if new_tag != tag:
+                    changes.append((_tag_text(tag), new_tag))
+                if new_tag is None:
+                    continue
+                tag, tag_lower = new_tag, new_tag.lower()
+            if tag_lower not in kept:
+                kept.add(tag_lower)
+                result.append(tag)
+
+        return result, changes
+
+    def __len__(self) -> int:
+        return len(self.lookup)
+
+
+def compile_tag_mapping(entries: Any) -> TagMapping:
+    """Checks the loaded content of a mapping file and returns the compiled mapping."""
+    if not isinstance(entries, dict) or not entries:
+        raise TagMappingError("A tag mapping must be a non-empty 'old tag: new tag' mapping (new tag null to delete).")
+
+    lookup: Dict[str, Optional[str]] = {}
+    for old, new in entries.items():
+        if old is None or isinstance(old, (dict, list)) or not _tag_text(old).strip():
+            raise TagMappingError(f"Invalid old tag {old!r}: expected a non-empty tag.")
+        if isinstance(new, (dict, list)) or (new is not None and not _tag_text(new).strip()):
+            raise TagMappingError(f"'{old}': invalid new tag {new!r} (expected a tag, or null to delete it).")
+
+        old_lower: str = _tag_text(old).strip().lower()
+        new_tag: Optional[str] = None if new is None else _tag_text(new).strip()
+        if old_lower in lookup and lookup[old_lower] != new_tag:
+            raise TagMappingError(f"'{old}' is mapped twice (case-insensitive), to {lookup[old_lower]!r} and {new_tag!r}.")
+        lookup[old_lower] = new_tag
+
+    # A single pass can't follow chains (a -> b, b -> c): each tag must be mapped to its final form
+    for old_lower, new_tag in list(lookup.items()):
+        if new_tag is None or new_tag.lower() == old_lower or new_tag.lower() not in lookup:
+            continue
+        target: Optional[str] = lookup[new_tag.lower()]
+        if target is None or target.lower() != new_tag.lower():
+            action: str = 'deleted' if target is None else f"renamed to '{target}'"
+            raise TagMappingError(f"'{old_lower}' is renamed to '{new_tag}', which is itself {action}: map '{old_lower}' to the final tag.")
+        # The target only has its case fixed ('Docker: docker'): every tag merged into it gets that spelling
+        lookup[old_lower] = target
+
+    return TagMapping(lookup)
+
+
+def load_tag_mapping(path: str) -> TagMapping:
+    """Reads and compiles a mapping file. Raises TagMappingError when it is missing or invalid."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entries: Any = DEFAULT_BACKEND.load(f.read())
+    except OSError as e:
+        raise TagMappingError(f"Can't read the mapping file: {e}")
+    except Exception as e:
+        raise TagMappingError(f"Invalid YAML in {path}: {e}")
+    return compile_tag_mapping(entries)
@@ -0,0 +1,173 @@
+"""
+Tag Similarity
+--------------
+Finds the tags that look like the same tag written twice, for the merge
+suggestions of the tag managers (tags_manager and tags-manager.py):
+
+- singular/plural: 'snippet' vs 'snippets';
+- small prefix/suffix: the shorter tag is part of the longer one, which is at
+  most `max_length_difference` characters longer ('php' vs 'phpx').
+
+Comparing every pair of tags costs O(n²). Here, every tag is looked up the
+other way round: the tags are indexed by their lowercase form, and each tag
+only generates its own substrings that are 1 to max_length_difference
+characters shorter (the only lengths that can match), each one a dict lookup.
+The plural rule is one of these lookups (the tag minus its final 's'). The
+cost is O(n × L × max_length_difference), L being the length of a tag.
+
+fuzzy_candidates() catches the typos these rules miss ('kubernets' vs
+'kubernetes', 'dockerfile' vs 'docker-file'): the pairs of tags within an edit
+distance (insertions, deletions, substitutions, swaps of adjacent characters).
+It uses a SymSpell deletion index: every tag is stored under the strings left
+by deleting up to max_distance of its characters, and two tags within the
+distance always share one of them. Only the tags sharing a deletion string are
+compared, so the cost grows with the number of tags (times the C(L, distance)
+deletions of each tag) instead of its square.
+
+Usage:
+    exceptions = normalize_exceptions(MERGE_EXCEPTIONS)   # once
+    for t1, t2 in sorted(merge_candidates(tags, 3, exceptions)):
+        print(f"{t1} vs {t2}")
+    for (t1, t2), distance in sorted(fuzzy_candidates(tags, 2, exceptions).items()):
+        print(f"{t1} vs {t2} ({distance} edits)")
+"""
+
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+# Tags shorter than this are left out of the fuzzy search: 'ai' and 'ci' are
+# 1 edit apart, and most short tags are within 2 edits of each other
+FUZZY_MIN_LENGTH: int = 4
+
+
+def normalize_exceptions(exceptions: Iterable[Tuple[str, str]]) -> FrozenSet[Tuple[str, str]]:
+    """
+    Lowercases the pairs of tags never suggested for merging, in both orders, so a
+    pair can be checked with a single lookup whatever the order and case of its tags.
+    """
+    normalized: Set[Tuple[str, str]] = set()
+    for first, second in exceptions:
+        normalized.add((first.lower(), second.lower()))
+        normalized.add((second.lower(), first.lower()))
+    return frozenset(normalized)
+
+
+def _group_by_lower(tags: Iterable[str]) -> Dict[str, List[str]]:
+    """Lowercase tag -> the spellings of that tag."""
+    by_lower: Dict[str, List[str]] = {}
+    for tag in set(tags):
+        by_lower.setdefault(tag.lower(), []).append(tag)
+    return by_lower
+
+
+def _sorted_pair(first: str, second: str) -> Tuple[str, str]:
+    return (first, second) if first < second else (second, first)
+
+
+def merge_candidates(tags: Iterable[str], max_length_difference: int,
+                     exceptions: FrozenSet[Tuple[str, str]] = frozenset()) -> Set[Tuple[str, str]]:
+    """
+    Returns the pairs (sorted tuples) of tags that look like duplicates: the lowercase
+    form of one is part of the other's, which is 1 to max_length_difference characters
+    longer. Tags differing only by case are not paired (they are case variants), nor
+    the pairs of `exceptions` (see normalize_exceptions()).
+    """
+    by_lower: Dict[str, List[str]] = _group_by_lower(tags)
+
+    pairs: Set[Tuple[str, str]] = set()
+    for longer_lower, longer_tags in by_lower.items():
+        length: int = len(longer_lower)
+        shorter_forms: Set[str] = {
+            longer_lower[start:start + sub_length]
+            for sub_length in range(max(0, length - max_length_difference), length)
+            for start in range(length - sub_length + 1)
+        }
+        for shorter_lower in shorter_forms:
+            shorter_tags: Optional[List[str]] = by_lower.get(shorter_lower)
+            if shorter_tags is None or (shorter_lower, longer_lower) in exceptions:
+                continue
+            for longer_tag in longer_tags:
+                for shorter_tag in shorter_tags:
+                    pairs.add(_sorted_pair(shorter_tag, longer_tag))
+
+    return pairs
+
+
+def edit_distance(first: str, second: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance between two strings: the number of insertions,
+    deletions, substitutions and swaps of two adjacent characters turning one into the
+    other. Stops as soon as it exceeds max_distance, and then returns max_distance + 1.
+    """
+    too_far: int = max_distance + 1
+    if abs(len(first) - len(second)) > max_distance:
+        return too_far
+
+    # Only the cells within max_distance of the diagonal can stay within the distance
+    length: int = len(second)
+    before_previous: List[int] = []
+    previous: List[int] = [j if j <= max_distance else too_far for j in range(length + 1)]
+    for i in range(1, len(first) + 1):
+        current: List[int] = [i if i <= max_distance else too_far] + [too_far] * length
+        row_minimum: int = current[0]
+        for j in range(max(1, i - max_distance), min(length, i + max_distance) + 1):
+            value: int = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (first[i - 1] != second[j - 1]))
+            if i > 1 and j > 1 and first[i - 1] == second[j - 2] and first[i - 2] == second[j - 1]:
+                value = min(value, before_previous[j - 2] + 1)
+            current[j] = value
+            row_minimum = min(row_minimum, value)
+        if row_minimum > max_distance:
+            return too_far
+        before_previous, previous = previous, current
+
+    return min(previous[length], too_far)
+
+
+def _deletions(word: str, max_distance: int) -> Set[str]:
+    """The word and every string left by deleting 1 to max_distance of its characters."""
+    deletions: Set[str] = {word}
+    edge: Set[str] = {word}
+    for _ in range(max_distance):
+        edge = {variant[:i] + variant[i + 1:] for variant in edge for i in range(len(variant))}
+        deletions |= edge
+    return deletions
+
+
+def fuzzy_candidates(tags: Iterable[str], max_distance: int,
+                     exceptions: FrozenSet[Tuple[str, str]] = frozenset(),
+                     min_length: int = FUZZY_MIN_LENGTH) -> Dict[Tuple[str, str], int]:
+    """
+    Returns the pairs (sorted tuples) of tags whose lowercase forms are 1 to max_distance
+    edits apart (see edit_distance()), with their distance. Tags shorter than min_length,
+    case variants and the pairs of `exceptions` are left out.
+    """
+    by_lower: Dict[str, List[str]] = _group_by_lower(tags)
+
+    # Deletion string -> the lowercase tags already indexed with it (SymSpell index)
+    index: Dict[str, List[str]] = {}
+    pairs: Dict[Tuple[str, str], int] = {}
+    for lower in by_lower:
+        if len(lower) < min_length:
+            continue
+
+        # Each pair is compared once, when its second tag is indexed
+        deletions: Set[str] = _deletions(lower, max_distance)
+        candidates: Set[str] = set()
+        for deletion in deletions:
+            indexed: Optional[List[str]] = index.get(deletion)
+            if indexed is None:
+                index[deletion] = [lower]
+            else:
+                candidates.update(indexed)
+                indexed.append(lower)
+
+        for candidate in candidates:
+            if (lower, candidate) in exceptions:
+                continue
+            distance: int = edit_distance(lower, candidate, max_distance)
+            if distance > max_distance:
+                continue
+            for first_tag in by_lower[lower]:
+                for second_tag in by_lower[candidate]:
+                    pairs[_sorted_pair(first_tag, second_tag)] = distance
+
+    return pairs
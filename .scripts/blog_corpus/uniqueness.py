@@ -0,0 +1,205 @@
+"""
+Cross-Post Uniqueness
+---------------------
+Finds posts sharing a value that should identify a single post (slug, title,
+description...) without comparing every pair of posts:
+
+- exact collisions: one hash index per key (normalized value -> posts),
+  filled in a single pass over the corpus;
+- near-duplicates (e.g. a description copied then slightly edited): each
+  text is reduced to a MinHash signature of its word shingles, signatures
+  are split in bands and hashed into LSH buckets. Only the posts sharing a
+  bucket are compared, and their similarity (Jaccard index of the shingle
+  sets) is checked exactly, so the cost grows linearly with the corpus.
+
+Values are compared ignoring case and extra spaces.
+
+Usage:
+    collisions = find_collisions(records, ['slug', 'title'])  # records: (path, metadata)
+    groups = find_near_duplicates(descriptions, 'description', threshold=0.8)  # (path, text)
+"""
+
+import hashlib
+import re
+from array import array
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+# Number of words per shingle ("how to", "to install", "install docker"...). Descriptions are
+# short: with 2 words, editing one word of a 25-word text keeps the similarity above 0.85
+SHINGLE_SIZE: int = 2
+
+# MinHash signature length, split in BANDS bands of NUM_PERMUTATIONS / BANDS rows.
+# With 16 bands of 4 rows, two texts with a similarity of 0.8 share a bucket
+# with a probability above 99.9%; at 0.3 the probability drops to about 12%.
+NUM_PERMUTATIONS: int = 64
+BANDS: int = 16
+
+# Default minimum similarity (Jaccard index) of two near-duplicate texts
+DEFAULT_THRESHOLD: float = 0.8
+
+_WORD_PATTERN: re.Pattern[str] = re.compile(r'\w+')
+
+
+class Collision(NamedTuple):
+    """Posts sharing the same (normalized) value of a key."""
+    key: str
+    value: str  # As written in the first post
+    files: List[str]
+
+
+class NearDuplicateGroup(NamedTuple):
+    """Posts whose texts are similar without being identical."""
+    key: str
+    similarity: float  # Highest similarity between two posts of the group
+    files: List[str]
+
+
+def normalize_value(value: Any) -> Optional[str]:
+    """Comparable form of a scalar value: lowercase, single spaces; None when empty or not a scalar."""
+    if value is None or isinstance(value, (dict, list)):
+        return None
+    text: str = ' '.join(str(value).split()).casefold()
+    return text or None
+
+
+def find_collisions(records: Iterable[Tuple[str, Dict[str, Any]]], keys: List[str]) -> List[Collision]:
+    """
+    Returns, for each key, the groups of posts sharing a value, in one pass over
+    the (path, metadata) records. Groups are sorted by key (in `keys` order), then value.
+    """
+    # key -> normalized value -> (first original value, files)
+    indexes: Dict[str, Dict[str, Tuple[str, List[str]]]] = {key: {} for key in keys}
+
+    for path, metadata in records:
+        for key in keys:
+            normalized: Optional[str] = normalize_value(metadata.get(key))
+            if normalized is None:
+                continue
+            entry: Optional[Tuple[str, List[str]]] = indexes[key].get(normalized)
+            if entry is None:
+                indexes[key][normalized] = (str(metadata[key]), [path])
+            else:
+                entry[1].append(path)
+
+    return [
+        Collision(key, value, sorted(files))
+        for key in keys
+        for _, (value, files) in sorted(indexes[key].items())
+        if len(files) > 1
+    ]
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """Word n-grams of a text (a text shorter than `size` words is a single shingle)."""
+    words: List[str] = _WORD_PATTERN.findall(text.casefold())
+    return {' '.join(words[i:i + size]) for i in range(max(1, len(words) - size + 1))} if words else set()
+
+
+def jaccard(first: Set[str], second: Set[str]) -> float:
+    """Jaccard index of two shingle sets (size of the intersection / size of the union)."""
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+class MinHashLSH:
+    """
+    Locality-sensitive hashing of MinHash signatures: items whose shingle sets
+    are similar land in the same bucket of at least one band.
+
+    Each shingle is hashed once with SHAKE-128 into `num_permutations` 32-bit
+    values, one per hash function; the signature keeps the minimum of each.
+    """
+
+    def __init__(self, num_permutations: int = NUM_PERMUTATIONS, bands: int = BANDS) -> None:
+        if num_permutations % bands:
+            raise ValueError("num_permutations must be a multiple of bands.")
+        self.num_permutations: int = num_permutations
+        self.bands: int = bands
+        self.rows: int = num_permutations // bands
+        # (band, hash of the band's rows) -> items
+        self.buckets: Dict[Tuple[int, int], List[int]] = {}
+
+    def signature(self, shingle_set: Set[str]) -> List[int]:
+        """MinHash signature: the minimum of each hash function over the shingles."""
+        hashes: List[List[int]] = [
+            array('I', hashlib.shake_128(shingle.encode('utf-8')).digest(4 * self.num_permutations)).tolist()
+            for shingle in shingle_set
+        ]
+        if len(hashes) == 1:
+            return hashes[0]
+        # min() of the i-th value of every shingle, for each i
+        return list(map(min, *hashes))
+
+    def add(self, item: int, shingle_set: Set[str]) -> None:
+        """Indexes one item (an integer id) by its shingles."""
+        if not shingle_set:
+            return
+        signature: List[int] = self.signature(shingle_set)
+        for band in range(self.bands):
+            rows: Tuple[int, ...] = tuple(signature[band * self.rows:(band + 1) * self.rows])
+            self.buckets.setdefault((band, hash(rows)), []).append(item)
+
+    def candidate_pairs(self) -> Set[Tuple[int, int]]:
+        """Pairs of items (smallest id first) sharing at least one bucket."""
+        pairs: Set[Tuple[int, int]] = set()
+        for items in self.buckets.values():
+            if len(items) < 2:
+                continue
+            for i, first in enumerate(items):
+                for second in items[i + 1:]:
+                    pairs.add((first, second) if first < second else (second, first))
+        return pairs
+
+
+def find_near_duplicates(texts: Iterable[Tuple[str, Any]], key: str,
+                         threshold: float = DEFAULT_THRESHOLD) -> List[NearDuplicateGroup]:
+    """
+    Groups the (path, text) pairs whose texts have a similarity of at least
+    `threshold`, identical texts excluded (find_collisions() reports those).
+    Posts linked through a chain of similar pairs end up in the same group.
+    """
+    paths: List[str] = []
+    normalized: List[str] = []
+    shingle_sets: List[Set[str]] = []
+    lsh: MinHashLSH = MinHashLSH()
+
+    for path, value in texts:
+        text: Optional[str] = normalize_value(value)
+        if text is None:
+            continue
+        item: int = len(paths)
+        paths.append(path)
+        normalized.append(text)
+        shingle_sets.append(shingles(text))
+        lsh.add(item, shingle_sets[item])
+
+    # Union-find over the verified pairs
+    parents: List[int] = list(range(len(paths)))
+
+    def root(item: int) -> int:
+        while parents[item] != item:
+            parents[item] = parents[parents[item]]
+            item = parents[item]
+        return item
+
+    best: Dict[int, float] = {}
+    for first, second in lsh.candidate_pairs():
+        if normalized[first] == normalized[second]:
+            continue
+        similarity: float = jaccard(shingle_sets[first], shingle_sets[second])
+        if similarity < threshold:
+            continue
+        parents[root(second)] = root(first)
+        best[first] = max(best.get(first, 0.0), similarity)
+        best[second] = max(best.get(second, 0.0), similarity)
+
+    members: Dict[int, List[int]] = {}
+    for item in best:
+        members.setdefault(root(item), []).append(item)
+
+    groups: List[NearDuplicateGroup] = [
+        NearDuplicateGroup(key, max(best[item] for item in items), sorted(paths[item] for item in items))
+        for items in members.values()
+    ]
+    return sorted(groups, key=lambda group: (-group.similarity, group.files))
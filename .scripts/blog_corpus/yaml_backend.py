@@ -0,0 +1,129 @@
+"""
+Pluggable YAML Backend
+----------------------
+One place to load and dump front matter for every script, with the blog's
+formatting rules registered once:
+
+- lists are written in flow style: `tags: [docker, php]`;
+- single-line strings are never folded, multi-line strings use a literal block;
+- `width=4096` so long descriptions stay on one line.
+
+Two backends are available: 'libyaml' (PyYAML's CSafeLoader/CSafeDumper,
+only when PyYAML was built against libyaml) and 'python' (pure-Python
+SafeLoader/SafeDumper). 'auto' picks libyaml when it is installed and falls
+back to the pure-Python one otherwise. The BLOG_YAML_BACKEND environment
+variable overrides the default choice.
+
+See .scripts/benchmarks/yaml_backend_benchmark.py for a byte-for-byte
+comparison of both backends on the real corpus.
+"""
+
+import io
+import os
+import re
+from typing import Any, Dict, List, Optional, Type
+
+# oyaml patches PyYAML so that dicts are dumped in insertion order
+import oyaml as yaml
+
+# Environment variable used to force a backend ('auto', 'libyaml' or 'python')
+BACKEND_ENV_VAR: str = 'BLOG_YAML_BACKEND'
+
+# Characters outside the Basic Multilingual Plane (most emojis, e.g. '🎉').
+# libyaml escapes them ("\U0001F389") even with allow_unicode=True.
+ASTRAL_CHARS: re.Pattern[str] = re.compile('[\U00010000-\U0010FFFF]')
+
+
+def custom_list_representer(dumper: yaml.SafeDumper, data: List[Any]) -> yaml.nodes.SequenceNode:
+    """Forces Python lists to be represented in YAML flow style: [item1, item2]."""
+    return dumper.represent_sequence('tag:yaml.org,2002:seq', data, flow_style=True)
+
+def custom_string_representer(dumper: yaml.SafeDumper, data: str) -> yaml.nodes.ScalarNode:
+    """Prevents PyYAML from folding long strings into multi-line blocks."""
+    if '\n' in data:
+        # Use block style (literal block) if the string explicitly contains newlines
+        return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='|')
+    # Use plain style for single-line strings, preventing folding
+    return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='')
+
+
+def _contains_astral_chars(data: Any) -> bool:
+    """Returns True if any string in the (nested) metadata contains a non-BMP character."""
+    if isinstance(data, str):
+        return ASTRAL_CHARS.search(data) is not None
+    if isinstance(data, dict):
+        return any(_contains_astral_chars(k) or _contains_astral_chars(v) for k, v in data.items())
+    if isinstance(data, (list, tuple)):
+        return any(_contains_astral_chars(item) for item in data)
+    return False
+
+
+class YamlBackend:
+    """A loader/dumper pair sharing the blog's formatting rules."""
+
+    def __init__(self, name: str, loader: Type[Any], dumper: Type[Any], fallback: Optional['YamlBackend'] = None) -> None:
+        self.name: str = name
+        self.loader: Type[Any] = loader
+        self.dumper: Type[Any] = dumper
+        # Backend used to dump documents this one can't write identically (see dump())
+        self.fallback: Optional[YamlBackend] = fallback
+
+        # Registering custom representers on this backend's dumper
+        yaml.add_representer(list, custom_list_representer, Dumper=dumper)
+        yaml.add_representer(str, custom_string_representer, Dumper=dumper)
+
+    def load(self, text: str) -> Any:
+        """Parses a YAML document (e.g. the text between the two '---' lines)."""
+        return yaml.load(text, Loader=self.loader)
+
+    def dump(self, metadata: Dict[str, Any]) -> str:
+        """Dumps front matter metadata using the blog's formatting rules."""
+        if self.fallback is not None and _contains_astral_chars(metadata):
+            # Keep emojis as-is: hand the document over to the pure-Python emitter
+            return self.fallback.dump(metadata)
+
+        output: io.StringIO = io.StringIO()
+        yaml.dump(
+            metadata,
+            output,
+            Dumper=self.dumper,
+            default_flow_style=False,
+            allow_unicode=True,
+            width=4096  # Prevent line folding
+        )
+        return output.getvalue()
+
+    def __repr__(self) -> str:
+        return f"YamlBackend({self.name!r})"
+
+
+# Available backends, keyed by name
+BACKENDS: Dict[str, YamlBackend] = {
+    'python': YamlBackend('python', yaml.SafeLoader, yaml.SafeDumper),
+}
+
+try:
+    BACKENDS['libyaml'] = YamlBackend('libyaml', yaml.CSafeLoader, yaml.CSafeDumper, fallback=BACKENDS['python'])
+except AttributeError:
+    # PyYAML was built without libyaml: only the pure-Python backend is available
+    pass
+
+
+def get_backend(name: Optional[str] = None) -> YamlBackend:
+    """
+    Returns a backend by name ('auto', 'libyaml' or 'python').
+    Without a name, BLOG_YAML_BACKEND is used, then 'auto'.
+    Asking for 'libyaml' when it isn't installed silently falls back to 'python'.
+    """
+    name = (name or os.environ.get(BACKEND_ENV_VAR) or 'auto').lower()
+
+    if name not in ('auto', 'libyaml', 'python'):
+        raise ValueError(f"Unknown YAML backend '{name}'. Expected 'auto', 'libyaml' or 'python'.")
+
+    if name == 'python':
+        return BACKENDS['python']
+    return BACKENDS.get('libyaml', BACKENDS['python'])
+
+
+# Backend used by the scripts unless told otherwise
+DEFAULT_BACKEND: YamlBackend = get_backend()
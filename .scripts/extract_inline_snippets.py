@@ -16,15 +16,16 @@ Key Features:
 6. Ignores snippets targeting files with a '.md' extension to prevent externalizing Markdown into Markdown.
 
 Usage:
-1. Save this code as 'externalize_snippets.py'.
-2. Set the 'markdown_files_pattern' variable to target your documentation files.
-3. Run the script: python externalize_snippets.py
+1. Keep this script in the '.scripts/' folder (it uses the shared 'blog_corpus' package).
+2. Set the 'markdown_root' variable to the folder holding your documentation files.
+3. Run the script: python .scripts/extract_inline_snippets.py
 """
 import re
 import os
-import glob
 from pathlib import Path
 
+from blog_corpus.discovery import find_posts
+
 def extract_and_replace_snippets(markdown_file_path):
     """
     Core logic to process a single Markdown file.
@@ -155,16 +156,17 @@ def extract_and_replace_snippets(markdown_file_path):
 # --- Main Part of the Script ---
 
 if __name__ == "__main__":
-    # Use a pattern to find all your Markdown files
-    # CAUTION: The pattern is relative to the directory where you run the script.
-    # Recommended default: './**/*.md' to process all files recursively.
-    markdown_files_pattern = './**/*.md' # Set this to your desired path pattern
+    # Folder holding your Markdown files, searched recursively
+    # CAUTION: The folder is relative to the directory where you run the script.
+    # Recommended default: '.' to process all files; node_modules, hidden folders
+    # and asset folders such as files/ are skipped.
+    markdown_root = '.' # Set this to your desired folder
 
-    # Use glob.glob to find all matching files
-    file_list = glob.glob(markdown_files_pattern, recursive=True)
+    # Find all .md/.mdx files (see blog_corpus/discovery.py)
+    file_list = find_posts(markdown_root)
 
     if not file_list:
-        print(f"No files found with the pattern '{markdown_files_pattern}'. Check the path.")
+        print(f"No .md/.mdx files found in '{markdown_root}'. Check the path.")
     else:
         print("="*60)
         print(f"Starting snippet externalization for {len(file_list)} Markdown files...")
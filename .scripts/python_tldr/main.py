@@ -29,26 +29,31 @@ from typing import List, Final
 from dotenv import load_dotenv
 
 # --- PATH PATCH ---
-# Ensures 'src' module is found regardless of execution context
+# Ensures 'src' module (and the shared 'blog_corpus' package of .scripts/) is found regardless of execution context
 BASE_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = BASE_DIR.parent
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.append(str(SCRIPTS_DIR))
 # ------------------
 
 try:
+    from blog_corpus import BlogCorpus, Post
+    from blog_corpus.discovery import is_post_file
     from src.ai_service import AIService
     from src.file_manager import FileManager
 except ImportError as e:
     print(f"❌ Configuration Error: Could not import internal modules.\nDetails: {e}")
     sys.exit(1)
 
-def process_single_file(file_path: Path, ai_service: AIService) -> str:
+def process_single_file(post: Post, ai_service: AIService) -> str:
     """
     Processes a single markdown file: reads, checks for existence, generates TL;DR, and injects.
     Returns a status string for logging.
     """
     try:
-        file_manager = FileManager(file_path)
+        file_manager = FileManager(post)
         content = file_manager.read_content()
 
         # 1. Skip if already exists
@@ -56,7 +61,7 @@ def process_single_file(file_path: Path, ai_service: AIService) -> str:
             return "SKIPPED (Exists)"
 
         # 2. Generate
-        print(f"   Generating summary for {file_path.name}...")
+        print(f"   Generating summary for {Path(post.path).name}...")
         tldr = ai_service.generate_tldr(content)
 
         # 3. Inject
@@ -97,16 +102,18 @@ def main() -> None:
         print(f"❌ Error initializing AI Service: {e}")
         sys.exit(1)
 
-    # Collect files to process
+    # Collect files to process. Only the front matter block of each post is located (to
+    # insert the TL;DR after it): the persistent front matter index isn't needed here.
+    corpus = BlogCorpus(str(target_path), use_cache=False)
     files_to_process: List[Path] = []
 
     if target_path.is_file():
-        if target_path.suffix.lower() == ".md":
+        if is_post_file(target_path.name):
             files_to_process.append(target_path)
     elif target_path.is_dir():
-        # Recursive search for all .md files
+        # Recursive search for all .md/.mdx files (asset folders such as files/ are skipped)
         print(f"📂 Scanning directory: {target_path} ...")
-        files_to_process = list(target_path.rglob("*.md"))
+        files_to_process = [Path(path) for path in corpus.paths()]
 
     if not files_to_process:
         print("⚠️  No Markdown files found to process.")
@@ -120,7 +127,7 @@ def main() -> None:
     for i, file_path in enumerate(files_to_process):
         print(f"📄 Processing [{i+1}/{len(files_to_process)}]: {file_path.name}...", end="", flush=True)
 
-        status = process_single_file(file_path, ai_service)
+        status = process_single_file(corpus.get(str(file_path)), ai_service)
 
         if "SKIPPED" in status:
             stats["SKIPPED"] += 1
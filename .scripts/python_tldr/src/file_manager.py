@@ -1,23 +1,26 @@
 from pathlib import Path
 from typing import Final, List
 
+from blog_corpus import Post
+
 class FileManager:
     """
     Handles file reading, content checking, and safe injection.
+    The post comes from the shared BlogCorpus, which locates its front matter block.
     """
 
-    _FRONTMATTER_DELIMITER: Final[str] = "---"
     _IMAGE_START_TAG: Final[str] = "!["
     _TLDR_TAG: Final[str] = "<TLDR>"
 
-    def __init__(self, file_path: Path) -> None:
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-        self._file_path = file_path
+    def __init__(self, post: Post) -> None:
+        self._file_path = Path(post.path)
+        if not self._file_path.exists():
+            raise FileNotFoundError(f"File not found: {self._file_path}")
+        self._post = post
 
     def read_content(self) -> str:
         """Reads the file content securely."""
-        return self._file_path.read_text(encoding="utf-8")
+        return self._post.text()
 
     def has_tldr(self, content: str) -> bool:
         """
@@ -33,13 +36,10 @@ class FileManager:
         lines: List[str] = original_content.splitlines()
         insertion_index: int = 0
 
-        # 1. Detect Frontmatter end
-        if lines and lines[0].strip() == self._FRONTMATTER_DELIMITER:
-            try:
-                frontmatter_end_index = lines.index(self._FRONTMATTER_DELIMITER, 1)
-                insertion_index = frontmatter_end_index + 1
-            except ValueError:
-                insertion_index = 0
+        # 1. Detect Frontmatter end (the first line after the closing '---')
+        header_span = self._post.header_span
+        if header_span is not None:
+            insertion_index = original_content.count("\n", 0, header_span[1])
 
         # 2. Scan for the first image AFTER the frontmatter
         for i in range(insertion_index, len(lines)):
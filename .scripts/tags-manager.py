@@ -2,15 +2,20 @@
 
 import argparse
 import requests
-from typing import List, Dict, Any, Tuple, Set
+from typing import List, Dict, Any, FrozenSet, Tuple, Set
 import os
-import glob
-from collections import Counter
+from contextlib import nullcontext, redirect_stdout
 
 # YAML processing libraries
 import oyaml as yaml
 import frontmatter
 
+from blog_corpus.compact import PostTable
+from blog_corpus.discovery import find_posts
+from blog_corpus.profiler import PROFILER
+from blog_corpus.record_output import OUTPUT, OUTPUT_FORMATS
+from blog_corpus.tag_similarity import fuzzy_candidates, merge_candidates, normalize_exceptions
+
 # --- ANSI Color Codes ---
 class Colors:
     """ANSI color codes for console output."""
@@ -26,8 +31,8 @@ class Colors:
 
 # --- Configuration ---
 DOCS_DIR: str = 'blog'
-FILE_PATTERN_BASE: str = os.path.join(DOCS_DIR, '**', '*.md*')
 MAX_LENGTH_DIFFERENCE: int = 3 # Max difference in characters to suggest a merge based on substring
+FUZZY_MAX_DISTANCE: int = 1 # Edit distance of 'list --fuzzy' when no value is given
 
 # Tags to exclude from merge suggestions (case-insensitive and order-independent)
 # Example: ('php', 'phpcbf') will prevent 'php' vs 'phpcbf' from being suggested.
@@ -44,6 +49,9 @@ MERGE_EXCEPTIONS: Set[Tuple[str, str]] = {
     ('xml', 'xmlstarlet'),
 }
 
+# Lowercased in both orders once, so each candidate pair is checked with a single lookup
+NORMALIZED_MERGE_EXCEPTIONS: FrozenSet[Tuple[str, str]] = normalize_exceptions(MERGE_EXCEPTIONS)
+
 
 # --- YAML Dumper Configuration ---
 
@@ -74,75 +82,80 @@ def custom_dumper_factory(metadata: Dict[str, Any], content: str) -> str:
     import io
     output = io.StringIO()
 
-    yaml.dump(
-        metadata,
-        output,
-        Dumper=yaml.SafeDumper,
-        default_flow_style=False,
-        allow_unicode=True,
-        width=4096 # High width ensures long single-line strings are not folded
-    )
+    with PROFILER.phase('dump'):
+        yaml.dump(
+            metadata,
+            output,
+            Dumper=yaml.SafeDumper,
+            default_flow_style=False,
+            allow_unicode=True,
+            width=4096 # High width ensures long single-line strings are not folded
+        )
 
     yaml_output: str = output.getvalue()
 
     return f"---\n{yaml_output}---\n{content}"
 
 
+def load_post(filepath: str) -> frontmatter.Post:
+    """
+    Same as frontmatter.load(filepath), with reading and parsing timed
+    separately for --profile.
+    """
+    with PROFILER.phase('read', filepath):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            text: str = f.read()
+    with PROFILER.phase('parse', filepath):
+        return frontmatter.loads(text)
+
+
 # ----------------------------------------------------------------------
 # Core Tag Management Functions
 # ----------------------------------------------------------------------
 
-def list_tags(sort_by: str = 'count') -> None:
+def list_tags(sort_by: str = 'count', fuzzy_distance: int | None = None) -> None:
     """
     Collects and displays all tags, sorted either by count (desc) or name (asc).
     It also lists tags with case variations and suggests tags for potential merging.
 
     Args:
         sort_by: The primary sorting method ('count' or 'name').
+        fuzzy_distance: Also report the tags up to that many edits apart (typos), or None.
     """
 
-    tag_counter: Counter = Counter()
-
     print(f"{Colors.BOLD}Action:{Colors.ENDC} {Colors.OKBLUE}Listing all tags{Colors.ENDC} (Sort by: {Colors.OKCYAN}{sort_by.upper()}{Colors.ENDC})")
     print(f"Base Directory: {Colors.OKBLUE}{DOCS_DIR}/{Colors.ENDC}")
 
     if not os.path.exists(DOCS_DIR):
         print(f"{Colors.FAIL}{Colors.BOLD}ERROR: Directory '{DOCS_DIR}' not found.{Colors.ENDC}")
+        OUTPUT.emit('error', message=f"Directory '{DOCS_DIR}' not found.")
         return
 
-    files: List[str] = glob.glob(FILE_PATTERN_BASE, recursive=True)
+    with PROFILER.phase('discover'):
+        files: List[str] = find_posts(DOCS_DIR)
 
     if not files:
-        print(f"{Colors.WARNING}No files found matching '{FILE_PATTERN_BASE}'.{Colors.ENDC}")
+        print(f"{Colors.WARNING}No .md/.mdx file found in '{DOCS_DIR}'.{Colors.ENDC}")
         return
 
     print(f"{Colors.OKBLUE}INFO: {len(files)} file(s) found. Processing tags...{Colors.ENDC}")
 
-    case_variants: Dict[str, List[str]] = {}
-    unique_tags: set[str] = set()
-
+    # Compact records: every tag is interned once and counted by id, not per file
+    table: PostTable = PostTable()
     for filepath in files:
         try:
-            post = frontmatter.load(filepath)
-            tags: List[str] = post.metadata.get('tags', [])
-
-            if isinstance(tags, list):
-                tag_counter.update(tags)
-
-                for tag in tags:
-                    tag_lower = tag.lower()
-
-                    # Fill case variant dictionary
-                    if tag_lower not in case_variants:
-                        case_variants[tag_lower] = []
-                    if tag not in case_variants[tag_lower]:
-                        case_variants[tag_lower].append(tag)
+            post = load_post(filepath)
+        except Exception:
+            continue
+        if isinstance(post.metadata.get('tags'), list):
+            table.add(filepath, post.metadata)
 
-                    # Fill unique tags set (case-sensitive)
-                    unique_tags.add(tag)
+    tag_counts: List[int] = table.tag_counts()
+    tag_counter: Dict[str, int] = {table.tags[tag_id]: count for tag_id, count in enumerate(tag_counts) if count}
+    case_variants: Dict[str, List[str]] = table.tag_case_variants()
+    unique_tags: Set[str] = set(tag_counter)
 
-        except Exception:
-            pass
+    OUTPUT.summary(files=len(files), tags=len(tag_counter))
 
     print("\n" + "=" * 50)
     if not tag_counter:
@@ -169,6 +182,7 @@ def list_tags(sort_by: str = 'count') -> None:
     print(f"{Colors.HEADER}{Colors.BOLD}Top Tags ({sort_desc}):{Colors.ENDC}")
     for tag, count in tag_list:
         print(f"  {Colors.OKGREEN}{tag:<30}{Colors.ENDC}{Colors.BOLD}{Colors.OKBLUE}{count}{Colors.ENDC}")
+        OUTPUT.emit('tag', tag=tag, count=count)
     print("=" * 50)
 
 
@@ -179,64 +193,27 @@ def list_tags(sort_by: str = 'count') -> None:
         for variants in case_variants.values()
         if len(variants) > 1
     ]
-    merge_suggestions: set[Tuple[str, str]] = set()
-    sorted_unique_tags = sorted(list(unique_tags))
-
-
-    # Logic to check if a pair is an exception (case-insensitive and order-independent)
-    def is_exception(t1: str, t2: str) -> bool:
-        t1_lower, t2_lower = t1.lower(), t2.lower()
-
-        # Create the canonical lowercased and sorted tuple (e.g., ('php', 'phpcbf'))
-        canonical_pair = tuple(sorted((t1_lower, t2_lower)))
-
-        # Check against the MERGE_EXCEPTIONS set
-        return canonical_pair in MERGE_EXCEPTIONS
-
-
-    # Refined merge suggestion logic
-    for i in range(len(sorted_unique_tags)):
-        t1 = sorted_unique_tags[i]
-        t1_lower = t1.lower()
-
-        for j in range(i + 1, len(sorted_unique_tags)):
-            t2 = sorted_unique_tags[j]
-            t2_lower = t2.lower()
-
-            # Skip tags that only differ by case
-            if t1_lower == t2_lower:
-                continue
-
-            # Skip if the pair is explicitly listed as an exception
-            if is_exception(t1, t2):
-                continue
-
-            pair = tuple(sorted((t1, t2)))
-
-            # Heuristic 1: Singular/Plural Check (Highly reliable)
-            # Example: 'snippet' vs 'snippets'
-            if (t1_lower + 's' == t2_lower or t2_lower + 's' == t1_lower):
-                merge_suggestions.add(pair)
-                continue
-
-            # Heuristic 2: Substring with Length Constraint
-
-            len_diff = abs(len(t1_lower) - len(t2_lower))
-
-            if len_diff > 0 and len_diff <= MAX_LENGTH_DIFFERENCE:
-
-                # Check if the shorter tag is a substring of the longer tag
-                if len(t1_lower) < len(t2_lower):
-                    shorter_tag = t1_lower
-                    longer_tag = t2_lower
-                else:
-                    shorter_tag = t2_lower
-                    longer_tag = t1_lower
-
-                if shorter_tag in longer_tag:
-                    merge_suggestions.add(pair)
-
-
+    # Merge suggestions (blog_corpus.tag_similarity), for tags that are not only case variants:
+    # Heuristic 1: Singular/Plural Check (Highly reliable), e.g. 'snippet' vs 'snippets'
+    # Heuristic 2: Substring with Length Constraint (MAX_LENGTH_DIFFERENCE)
+    # Each tag looks up its own shorter substrings in a dict instead of being compared with every other tag
+    with PROFILER.phase('analyze'):
+        merge_suggestions: Set[Tuple[str, str]] = merge_candidates(unique_tags, MAX_LENGTH_DIFFERENCE, NORMALIZED_MERGE_EXCEPTIONS)
+
+        # Heuristic 3 (--fuzzy): Typos, e.g. 'kubernets' vs 'kubernetes', found with a SymSpell deletion index
+        # Pairs already suggested for a merge are not repeated
+        fuzzy_duplicates: Dict[Tuple[str, str], int] = {}
+        if fuzzy_distance is not None:
+            fuzzy_duplicates = {
+                pair: distance
+                for pair, distance in fuzzy_candidates(unique_tags, fuzzy_distance, NORMALIZED_MERGE_EXCEPTIONS).items()
+                if pair not in merge_suggestions
+            }
+
+
+    OUTPUT.summary(listed=len(tag_list), case_issues=len(case_issues), merge_candidates=len(merge_suggestions))
+    if fuzzy_distance is not None:
+        OUTPUT.summary(fuzzy_duplicates=len(fuzzy_duplicates))
     print(f"\n{Colors.WARNING}{Colors.BOLD}--- TAG OPTIMIZATION SUGGESTIONS ---{Colors.ENDC}")
 
     # Display Case Issues (Part 2)
@@ -249,6 +226,7 @@ def list_tags(sort_by: str = 'count') -> None:
             ])
             print(f"  {Colors.FAIL}❌ Case Issue ({variants[0].lower()}): {Colors.ENDC}{counts_info}")
             print(f"    {Colors.OKCYAN}  Suggestion: Rename all to a canonical form (e.g., '{variants[0]}').{Colors.ENDC}")
+            OUTPUT.emit('case_variants', tag=variants[0].lower(), counts={v: tag_counter[v] for v in sorted(variants)}, suggestion=variants[0])
 
     # Display Merge Suggestions (Part 3 - Refined)
     if merge_suggestions:
@@ -260,8 +238,21 @@ def list_tags(sort_by: str = 'count') -> None:
 
             print(f"  {Colors.WARNING}⚠️ Found: {Colors.ENDC}{t1} ({count1}) vs {t2} ({count2})")
             print(f"    {Colors.OKCYAN}  Suggestion: Merge into a canonical form (e.g., '{t1}' or '{t2}').{Colors.ENDC}")
+            OUTPUT.emit('merge_candidate', tags=[t1, t2], counts={t1: count1, t2: count2})
+
+    # Display Possible Typos (--fuzzy)
+    if fuzzy_duplicates:
+        print(f"\n{Colors.WARNING}3. Possible Typos (up to {fuzzy_distance} edit(s)):{Colors.ENDC}")
+
+        for (t1, t2), distance in sorted(fuzzy_duplicates.items()):
+            count1 = tag_counter[t1]
+            count2 = tag_counter[t2]
+
+            print(f"  {Colors.WARNING}⚠️ Found: {Colors.ENDC}{t1} ({count1}) vs {t2} ({count2}), {distance} edit(s)")
+            print(f"    {Colors.OKCYAN}  Suggestion: Merge into a canonical form (e.g., '{t1}' or '{t2}').{Colors.ENDC}")
+            OUTPUT.emit('fuzzy_duplicate', tags=[t1, t2], distance=distance, counts={t1: count1, t2: count2})
 
-    if not case_issues and not merge_suggestions:
+    if not case_issues and not merge_suggestions and not fuzzy_duplicates:
         print(f"  {Colors.OKGREEN}No obvious tag duplicates or merge candidates found.{Colors.ENDC}")
 
     print("-" * 50)
@@ -296,6 +287,7 @@ def suggest_tags_for_file(filepath: str) -> List[str]:
             return [t.strip() for t in raw_tags.split(',')]
     except Exception as e:
         print(f"  {Colors.FAIL}Error calling Ollama: {e}{Colors.ENDC}")
+        OUTPUT.emit('error', message=f"Error calling Ollama: {e}")
     return []
 
 
@@ -318,12 +310,14 @@ def _process_files(action: str, old_tag: str = None, new_tag: str = None) -> Non
 
     if not os.path.exists(DOCS_DIR):
         print(f"{Colors.FAIL}{Colors.BOLD}ERROR: Directory '{DOCS_DIR}' not found.{Colors.ENDC}")
+        OUTPUT.emit('error', message=f"Directory '{DOCS_DIR}' not found.")
         return
 
-    files: List[str] = glob.glob(FILE_PATTERN_BASE, recursive=True)
+    with PROFILER.phase('discover'):
+        files: List[str] = find_posts(DOCS_DIR)
 
     if not files:
-        print(f"{Colors.WARNING}No files found matching '{FILE_PATTERN_BASE}'.{Colors.ENDC}")
+        print(f"{Colors.WARNING}No .md/.mdx file found in '{DOCS_DIR}'.{Colors.ENDC}")
         return
 
     print(f"{Colors.OKBLUE}INFO: {len(files)} file(s) found. Processing...{Colors.ENDC}")
@@ -334,7 +328,7 @@ def _process_files(action: str, old_tag: str = None, new_tag: str = None) -> Non
 
     for filepath in files:
         try:
-            post = frontmatter.load(filepath)
+            post = load_post(filepath)
             metadata: Dict[str, Any] = post.metadata
             file_changed: bool = False
 
@@ -368,20 +362,24 @@ def _process_files(action: str, old_tag: str = None, new_tag: str = None) -> Non
                     # Generate content and write the file manually to preserve YAML formatting
                     full_content: str = custom_dumper_factory(post.metadata, post.content)
 
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(full_content)
+                    with PROFILER.phase('write', filepath):
+                        with open(filepath, 'w', encoding='utf-8') as f:
+                            f.write(full_content)
 
                     if action == 'delete':
                         print(f"{Colors.OKGREEN}  ✓ Deleted '{old_tag}' from: {filepath}{Colors.ENDC}")
                     else:
                         print(f"{Colors.OKGREEN}  ✓ Renamed '{old_tag}' to '{new_tag}' in: {filepath}{Colors.ENDC}")
+                    OUTPUT.emit('change', file=filepath, action=action, old_tag=old_tag, new_tag=new_tag)
 
                     changes_made += 1
 
         except Exception as e:
             error_message: str = str(e)
             print(f"{Colors.FAIL}  ❌ FATAL ERROR PROCESSING {filepath}: {error_message}{Colors.ENDC}")
+            OUTPUT.emit('error', file=filepath, message=error_message)
 
+    OUTPUT.summary(files=len(files), modified=changes_made)
     print("-" * 50)
     print(f"{Colors.BOLD}Operation completed.{Colors.ENDC} {changes_made} file(s) modified.")
 
@@ -393,6 +391,24 @@ if __name__ == "__main__":
         formatter_class=argparse.RawTextHelpFormatter
     )
 
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print the time spent per phase (discover, read, parse, analyze, dump, write) and the slowest files."
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=10,
+        metavar="N",
+        help="Number of slowest files listed by --profile (default: 10)."
+    )
+    parser.add_argument(
+        "--profile-dump",
+        metavar="FILE",
+        help="Also run cProfile and save its statistics to FILE (implies --profile)."
+    )
+
     # Define subparsers and actions
     subparsers = parser.add_subparsers(dest="action", help="Available actions.")
 
@@ -408,6 +424,15 @@ if __name__ == "__main__":
         default='count',
         help="Primary sorting method: 'count' (default, frequency descending) or 'name' (alphabetical ascending)."
     )
+    parser_list.add_argument(
+        '--fuzzy',
+        type=int,
+        nargs='?',
+        const=FUZZY_MAX_DISTANCE,
+        default=None,
+        metavar='DISTANCE',
+        help=f"Also report the tags up to DISTANCE edits apart, e.g. 'kubernets' vs 'kubernetes' (default distance: {FUZZY_MAX_DISTANCE})."
+    )
 
     # DELETE action
     parser_delete = subparsers.add_parser(
@@ -440,6 +465,16 @@ if __name__ == "__main__":
     )
     parser_suggest.add_argument("file", type=str, help="Path to the .md file.")
 
+    # Machine-readable output for every action
+    for action_parser in subparsers.choices.values():
+        action_parser.add_argument(
+            "--format",
+            choices=OUTPUT_FORMATS,
+            default='text',
+            help="Output format (default: text). ndjson streams one JSON record per finding, then a summary record;\n"
+                 "json writes a single document at the end."
+        )
+
     # Display full help page if no arguments are provided
     if len(os.sys.argv) == 1:
         parser.print_help()
@@ -448,41 +483,69 @@ if __name__ == "__main__":
     # Parse arguments
     args = parser.parse_args()
 
-    # Execute actions
-    if args.action == 'list':
-        list_tags(args.sort)
-
-    elif args.action == 'suggest':
-        print(f"{Colors.BOLD}Suggesting tags for: {Colors.OKBLUE}{args.file}{Colors.ENDC}")
-        suggestions = suggest_tags_for_file(args.file)
-        print(f"{Colors.OKGREEN}Suggested tags: {', '.join(suggestions)}{Colors.ENDC}")
-
-    elif args.action == 'delete' or args.action == 'rename':
-
-        old_tag: str | None = None
-        new_tag: str | None = None
+    with OUTPUT.session(getattr(args, 'format', 'text'), args.action):
+        profile: bool = args.profile or bool(args.profile_dump)
+        if profile:
+            PROFILER.start(cprofile=bool(args.profile_dump))
 
-        if args.action == 'delete':
-            old_tag = args.tag
-
-        elif args.action == 'rename':
-            if ',' not in args.tags:
-                print(f"{Colors.FAIL}Error: Rename argument must be in 'OLD_TAG,NEW_TAG' format.{Colors.ENDC}")
-                os.sys.exit(1)
-
-            try:
-                old_tag, new_tag = [t.strip() for t in args.tags.split(',', 1)]
-
-                if not old_tag or not new_tag:
-                     print(f"{Colors.FAIL}Error: Both tags (old and new) must be specified and non-empty.{Colors.ENDC}")
-                     os.sys.exit(1)
-
-            except ValueError:
-                 print(f"{Colors.FAIL}Error: Problem splitting tags. Expected format: 'OLD_TAG,NEW_TAG'.{Colors.ENDC}")
-                 os.sys.exit(1)
-
-        _process_files(
-            action=args.action,
-            old_tag=old_tag,
-            new_tag=new_tag
-        )
+        # Execute actions
+        try:
+            if args.action == 'list':
+                if args.fuzzy is not None and args.fuzzy < 1:
+                    print(f"{Colors.FAIL}Error: --fuzzy expects an edit distance of at least 1.{Colors.ENDC}")
+                    OUTPUT.emit('error', message="--fuzzy expects an edit distance of at least 1.")
+                    os.sys.exit(1)
+
+                list_tags(args.sort, args.fuzzy)
+
+            elif args.action == 'suggest':
+                print(f"{Colors.BOLD}Suggesting tags for: {Colors.OKBLUE}{args.file}{Colors.ENDC}")
+                suggestions = suggest_tags_for_file(args.file)
+                OUTPUT.emit('suggestion', file=args.file, tags=suggestions)
+                print(f"{Colors.OKGREEN}Suggested tags: {', '.join(suggestions)}{Colors.ENDC}")
+
+            elif args.action == 'delete' or args.action == 'rename':
+
+                old_tag: str | None = None
+                new_tag: str | None = None
+
+                if args.action == 'delete':
+                    old_tag = args.tag
+
+                elif args.action == 'rename':
+                    if ',' not in args.tags:
+                        print(f"{Colors.FAIL}Error: Rename argument must be in 'OLD_TAG,NEW_TAG' format.{Colors.ENDC}")
+                        OUTPUT.emit('error', message="Rename argument must be in 'OLD_TAG,NEW_TAG' format.")
+                        os.sys.exit(1)
+
+                    try:
+                        old_tag, new_tag = [t.strip() for t in args.tags.split(',', 1)]
+
+                        if not old_tag or not new_tag:
+                             print(f"{Colors.FAIL}Error: Both tags (old and new) must be specified and non-empty.{Colors.ENDC}")
+                             OUTPUT.emit('error', message="Both tags (old and new) must be specified and non-empty.")
+                             os.sys.exit(1)
+
+                    except ValueError:
+                         print(f"{Colors.FAIL}Error: Problem splitting tags. Expected format: 'OLD_TAG,NEW_TAG'.{Colors.ENDC}")
+                         OUTPUT.emit('error', message="Problem splitting tags. Expected format: 'OLD_TAG,NEW_TAG'.")
+                         os.sys.exit(1)
+
+                _process_files(
+                    action=args.action,
+                    old_tag=old_tag,
+                    new_tag=new_tag
+                )
+        finally:
+            if profile:
+                PROFILER.stop()
+                lines: List[str] = PROFILER.summary_lines(args.profile_top)
+                # With --format ndjson/json, stdout only holds records: the report goes to stderr
+                with redirect_stdout(os.sys.stderr) if OUTPUT.enabled else nullcontext():
+                    print(f"\n{Colors.HEADER}{Colors.BOLD}--- Profile ---{Colors.ENDC}")
+                    print(f"{Colors.BOLD}{lines[0]}{Colors.ENDC}")
+                    for line in lines[1:]:
+                        print(line)
+                    if args.profile_dump:
+                        PROFILER.dump_stats(args.profile_dump)
+                        print(f"{Colors.OKCYAN}cProfile statistics written to {args.profile_dump}{Colors.ENDC}")
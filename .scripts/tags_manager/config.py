@@ -1,10 +1,11 @@
 """Configuration settings for the Tag Manager."""
 
-import os
-
 DOCS_DIR: str = 'blog'
-FILE_PATTERN_BASE: str = os.path.join(DOCS_DIR, '**', '*.md*')
 MAX_LENGTH_DIFFERENCE: int = 3
+FUZZY_MAX_DISTANCE: int = 1  # Edit distance of 'list --fuzzy' when no value is given
+COOCCURRENCE_TOP: int = 5  # Related tags listed per tag by 'cooccurrence'
+COOCCURRENCE_MIN_COUNT: int = 2  # Posts two tags must share to be related (one shared post is noise)
+COOCCURRENCE_MERGE_JACCARD: float = 0.8  # Tags used together this often are reported as merge candidates
 
 # AI Configuration
 OLLAMA_URL: str = 'http://host.docker.internal:11434/api/generate'
@@ -2,6 +2,6 @@
 
 from .analyzer import list_tags
 from .ai import suggest_tags_for_file
-from .mutator import process_files
+from .mutator import process_files, remap_tags
 
-__all__ = ['list_tags', 'suggest_tags_for_file', 'process_files']
+__all__ = ['list_tags', 'suggest_tags_for_file', 'process_files', 'remap_tags']
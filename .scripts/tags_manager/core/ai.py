@@ -1,16 +1,14 @@
 """AI integration for tag suggestion."""
 
 import requests
-import frontmatter
+from blog_corpus import BlogCorpus
 from config import OLLAMA_URL, OLLAMA_MODEL, OLLAMA_TIMEOUT
 from helpers import Colors, print_error
 
-def suggest_tags_for_file(filepath: str) -> list[str]:
-    """Sends file content to Ollama to retrieve tag suggestions."""
+def suggest_tags_for_file(corpus: BlogCorpus, filepath: str) -> list[str]:
+    """Sends file content (the body of the post, without its front matter) to Ollama to retrieve tag suggestions."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            post = frontmatter.load(f)
-            content = post.content
+        content = corpus.get(filepath).body().strip()
     except Exception as e:
         print_error(f"Failed to read file {filepath}: {e}")
         return []
@@ -1,21 +1,29 @@
 """Logic for analyzing, listing, and cross-referencing tags."""
 
 import os
-import glob
-from collections import Counter
-import frontmatter
-from config import DOCS_DIR, FILE_PATTERN_BASE, MERGE_EXCEPTIONS, MAX_LENGTH_DIFFERENCE
+from blog_corpus import BlogCorpus
+from blog_corpus.compact import PostTable
+from blog_corpus.record_output import OUTPUT
+from blog_corpus.tag_similarity import fuzzy_candidates, merge_candidates, normalize_exceptions
+from config import DOCS_DIR, MERGE_EXCEPTIONS, MAX_LENGTH_DIFFERENCE
 from helpers import Colors, print_error, print_warning, print_info
 
-def _is_exception(t1: str, t2: str) -> bool:
-    """Checks if a pair of tags is explicitly excluded from merge suggestions."""
-    canonical_pair = tuple(sorted((t1.lower(), t2.lower())))
-    return canonical_pair in MERGE_EXCEPTIONS
+# Pairs excluded from merge suggestions, lowercased in both orders once for all
+_MERGE_EXCEPTIONS: frozenset[tuple[str, str]] = normalize_exceptions(MERGE_EXCEPTIONS)
 
-def list_tags(sort_by: str = 'count') -> None:
-    """Collects and displays all tags, identifying case variations and merge candidates."""
-    tag_counter: Counter = Counter()
+def list_tags(corpus: BlogCorpus, sort_by: str = 'count', changed_files: list[str] | None = None,
+              fuzzy_distance: int | None = None) -> None:
+    """
+    Collects and displays all tags, identifying case variations and merge candidates.
 
+    Tags are read from the records of the corpus: posts unchanged since the previous run
+    come from the persisted front matter index (.cache/frontmatter-index) instead of being
+    parsed again. With `changed_files` (--since/--staged), only the tags used by those files
+    are listed and checked, but against the tags of the whole blog.
+
+    With `fuzzy_distance` (--fuzzy), the tags up to that many edits apart are reported too
+    ('kubernets' vs 'kubernetes'), found with the deletion index of blog_corpus.tag_similarity.
+    """
     print(f"{Colors.BOLD}Action:{Colors.ENDC} {Colors.OKBLUE}Listing all tags{Colors.ENDC} (Sort by: {Colors.OKCYAN}{sort_by.upper()}{Colors.ENDC})")
     print(f"Base Directory: {Colors.OKBLUE}{DOCS_DIR}/{Colors.ENDC}")
 
@@ -23,41 +31,46 @@ def list_tags(sort_by: str = 'count') -> None:
         print_error(f"Directory '{DOCS_DIR}' not found.")
         return
 
-    files: list[str] = glob.glob(FILE_PATTERN_BASE, recursive=True)
+    files: list[str] = corpus.paths()
 
     if not files:
-        print_warning(f"No files found matching '{FILE_PATTERN_BASE}'.")
+        print_warning(f"No .md/.mdx file found in '{DOCS_DIR}'.")
         return
 
     print_info(f"{len(files)} file(s) found. Processing tags...")
 
-    case_variants: dict[str, list[str]] = {}
-    unique_tags: set[str] = set()
-
-    for filepath in files:
-        try:
-            post = frontmatter.load(filepath)
-            tags: list[str] = post.metadata.get('tags', [])
-
-            if isinstance(tags, list):
-                tag_counter.update(tags)
-                for tag in tags:
-                    tag_lower = tag.lower()
-                    if tag_lower not in case_variants:
-                        case_variants[tag_lower] = []
-                    if tag not in case_variants[tag_lower]:
-                        case_variants[tag_lower].append(tag)
-                    unique_tags.add(tag)
-        except Exception:
+    # Tags of the changed files (incremental mode only)
+    focus_tags: set[str] | None = None if changed_files is None else set()
+    changed: set[str] = {os.path.normpath(path) for path in changed_files or []}
+
+    # Compact records: every tag is interned once and counted by id, not per file
+    table = PostTable()
+    for post in corpus.posts(files):
+        if post.error is not None or not isinstance(post.metadata.get('tags'), list):
             continue
+        compact = table.add(post.path, post.metadata)
+        if focus_tags is not None and os.path.normpath(post.path) in changed:
+            focus_tags.update(table.tags[tag_id] for tag_id in compact.tag_ids)
+
+    tag_counts: list[int] = table.tag_counts()
+    tag_counter: dict[str, int] = {table.tags[tag_id]: count for tag_id, count in enumerate(tag_counts) if count}
+    case_variants: dict[str, list[str]] = table.tag_case_variants()
+    unique_tags: set[str] = set(tag_counter)
+    OUTPUT.summary(files=len(files), tags=len(tag_counter))
 
     print("\n" + "=" * 50)
     if not tag_counter:
         print_warning("No tags found in the files.")
         return
 
+    if focus_tags is not None:
+        print_info(f"Incremental mode: {len(changed)} changed file(s), {len(focus_tags)} tag(s) checked against the whole blog.")
+
     # --- LISTING ---
-    tag_list: list[tuple[str, int]] = list(tag_counter.items())
+    tag_list: list[tuple[str, int]] = [
+        item for item in tag_counter.items()
+        if focus_tags is None or item[0] in focus_tags
+    ]
     if sort_by == 'count':
         tag_list.sort(key=lambda item: item[0])
         tag_list.sort(key=lambda item: item[1], reverse=True)
@@ -69,34 +82,29 @@ def list_tags(sort_by: str = 'count') -> None:
     print(f"{Colors.HEADER}{Colors.BOLD}Top Tags ({sort_desc}):{Colors.ENDC}")
     for tag, count in tag_list:
         print(f"  {Colors.OKGREEN}{tag:<30}{Colors.ENDC}{Colors.BOLD}{Colors.OKBLUE}{count}{Colors.ENDC}")
+        OUTPUT.emit('tag', tag=tag, count=count)
     print("=" * 50)
 
     # --- OPTIMIZATION SUGGESTIONS ---
-    case_issues: list[list[str]] = [v for v in case_variants.values() if len(v) > 1]
-    merge_suggestions: set[tuple[str, str]] = set()
-    sorted_unique_tags = sorted(list(unique_tags))
-
-    for i, t1 in enumerate(sorted_unique_tags):
-        t1_lower = t1.lower()
-        for j in range(i + 1, len(sorted_unique_tags)):
-            t2 = sorted_unique_tags[j]
-            t2_lower = t2.lower()
-
-            if t1_lower == t2_lower or _is_exception(t1, t2):
-                continue
-
-            pair = tuple(sorted((t1, t2)))
-
-            if t1_lower + 's' == t2_lower or t2_lower + 's' == t1_lower:
-                merge_suggestions.add(pair)
-                continue
-
-            len_diff = abs(len(t1_lower) - len(t2_lower))
-            if 0 < len_diff <= MAX_LENGTH_DIFFERENCE:
-                shorter_tag, longer_tag = (t1_lower, t2_lower) if len(t1_lower) < len(t2_lower) else (t2_lower, t1_lower)
-                if shorter_tag in longer_tag:
-                    merge_suggestions.add(pair)
-
+    case_issues: list[list[str]] = [
+        v for v in case_variants.values()
+        if len(v) > 1 and (focus_tags is None or focus_tags.intersection(v))
+    ]
+    # Indexed lookup (blog_corpus.tag_similarity) instead of comparing every pair of tags
+    # Incremental mode: at least one of the two tags must come from a changed file
+    merge_suggestions: set[tuple[str, str]] = {
+        pair for pair in merge_candidates(unique_tags, MAX_LENGTH_DIFFERENCE, _MERGE_EXCEPTIONS)
+        if focus_tags is None or focus_tags.intersection(pair)
+    }
+    # Typos (--fuzzy): pairs already suggested for a merge are not repeated
+    fuzzy_duplicates: dict[tuple[str, str], int] = {} if fuzzy_distance is None else {
+        pair: distance for pair, distance in fuzzy_candidates(unique_tags, fuzzy_distance, _MERGE_EXCEPTIONS).items()
+        if pair not in merge_suggestions and (focus_tags is None or focus_tags.intersection(pair))
+    }
+
+    OUTPUT.summary(listed=len(tag_list), case_issues=len(case_issues), merge_candidates=len(merge_suggestions))
+    if fuzzy_distance is not None:
+        OUTPUT.summary(fuzzy_duplicates=len(fuzzy_duplicates))
     print(f"\n{Colors.WARNING}{Colors.BOLD}--- TAG OPTIMIZATION SUGGESTIONS ---{Colors.ENDC}")
 
     if case_issues:
@@ -105,14 +113,23 @@ def list_tags(sort_by: str = 'count') -> None:
             counts_info = ", ".join([f"{v} ({tag_counter[v]})" for v in sorted(variants)])
             print(f"  {Colors.FAIL}❌ Case Issue ({variants[0].lower()}): {Colors.ENDC}{counts_info}")
             print(f"    {Colors.OKCYAN}  Suggestion: Rename all to '{variants[0]}'.{Colors.ENDC}")
+            OUTPUT.emit('case_variants', tag=variants[0].lower(), counts={v: tag_counter[v] for v in sorted(variants)}, suggestion=variants[0])
 
     if merge_suggestions:
         print_warning("\n2. Potential Merge Candidates:")
         for t1, t2 in sorted(list(merge_suggestions)):
             print(f"  {Colors.WARNING}⚠️ Found: {Colors.ENDC}{t1} ({tag_counter[t1]}) vs {t2} ({tag_counter[t2]})")
             print(f"    {Colors.OKCYAN}  Suggestion: Merge into '{t1}' or '{t2}'.{Colors.ENDC}")
+            OUTPUT.emit('merge_candidate', tags=[t1, t2], counts={t1: tag_counter[t1], t2: tag_counter[t2]})
+
+    if fuzzy_duplicates:
+        print_warning(f"\n3. Possible Typos (up to {fuzzy_distance} edit(s)):")
+        for (t1, t2), distance in sorted(fuzzy_duplicates.items()):
+            print(f"  {Colors.WARNING}⚠️ Found: {Colors.ENDC}{t1} ({tag_counter[t1]}) vs {t2} ({tag_counter[t2]}), {distance} edit(s)")
+            print(f"    {Colors.OKCYAN}  Suggestion: Merge into '{t1}' or '{t2}'.{Colors.ENDC}")
+            OUTPUT.emit('fuzzy_duplicate', tags=[t1, t2], distance=distance, counts={t1: tag_counter[t1], t2: tag_counter[t2]})
 
-    if not case_issues and not merge_suggestions:
+    if not case_issues and not merge_suggestions and not fuzzy_duplicates:
         print(f"  {Colors.OKGREEN}No obvious tag duplicates or merge candidates found.{Colors.ENDC}")
 
     print("-" * 50)
@@ -0,0 +1,122 @@
+"""Tag co-occurrence: related tags, and tags always used together.
+
+Not exported by the core package: it loads NumPy and SciPy, so main.py only
+imports it for the 'cooccurrence' action.
+"""
+
+import json
+import os
+from typing import Any
+from blog_corpus import BlogCorpus
+from blog_corpus.compact import PostTable
+from blog_corpus.record_output import OUTPUT
+from blog_corpus.tag_cooccurrence import TagCooccurrence, TagPair
+from config import COOCCURRENCE_MERGE_JACCARD, DOCS_DIR
+from helpers import Colors, print_error, print_info, print_success, print_warning
+
+def _related_record(table: PostTable, pair: TagPair) -> dict[str, Any]:
+    """A related tag, as listed by the 'related_tags' records and the --output file."""
+    return {'tag': table.tags[pair.other_id], 'count': pair.count, 'jaccard': round(pair.jaccard, 4), 'pmi': round(pair.pmi, 4)}
+
+def tag_cooccurrence(corpus: BlogCorpus, top: int, metric: str = 'jaccard', min_count: int = 2,
+                     changed_files: list[str] | None = None, output_path: str | None = None) -> None:
+    """
+    Lists the `top` related tags of each tag, ranked by `metric` ('jaccard' or 'pmi'), then
+    the pairs of tags nearly always used together (Jaccard >= COOCCURRENCE_MERGE_JACCARD),
+    which are merge candidates.
+
+    The tag × tag co-occurrence counts come from one pass over the posts and a sparse
+    matrix product (blog_corpus.tag_cooccurrence): only the pairs of tags actually used
+    together are stored. Pairs shared by fewer than `min_count` posts are ignored. With
+    `changed_files` (--since/--staged), only the tags used by those files are listed, but
+    scored against the whole blog. With `output_path`, the related tags are also written
+    to that file as JSON.
+    """
+    print(f"{Colors.BOLD}Action:{Colors.ENDC} {Colors.OKBLUE}Tag co-occurrence{Colors.ENDC} (Metric: {Colors.OKCYAN}{metric.upper()}{Colors.ENDC}, Top: {Colors.OKCYAN}{top}{Colors.ENDC})")
+    print(f"Base Directory: {Colors.OKBLUE}{DOCS_DIR}/{Colors.ENDC}")
+
+    if not os.path.exists(DOCS_DIR):
+        print_error(f"Directory '{DOCS_DIR}' not found.")
+        return
+
+    files: list[str] = corpus.paths()
+
+    if not files:
+        print_warning(f"No .md/.mdx file found in '{DOCS_DIR}'.")
+        return
+
+    print_info(f"{len(files)} file(s) found. Processing tags...")
+
+    # Tags of the changed files (incremental mode only)
+    focus_tags: set[str] | None = None if changed_files is None else set()
+    changed: set[str] = {os.path.normpath(path) for path in changed_files or []}
+
+    # The tag ids of the compact records become the rows of the sparse posts × tags matrix
+    table = PostTable()
+    for post in corpus.posts(files):
+        if post.error is not None or not isinstance(post.metadata.get('tags'), list):
+            continue
+        compact = table.add(post.path, post.metadata)
+        if focus_tags is not None and os.path.normpath(post.path) in changed:
+            focus_tags.update(table.tags[tag_id] for tag_id in compact.tag_ids)
+
+    cooccurrence = TagCooccurrence(table)
+    # Posts using each tag, indexed by tag id
+    tag_counts: list[int] = cooccurrence.counts.tolist()
+    OUTPUT.summary(files=len(files), posts=cooccurrence.posts, tags=len(table.tags), pairs=len(cooccurrence))
+
+    print("\n" + "=" * 50)
+    if not len(table.tags):
+        print_warning("No tags found in the files.")
+        return
+
+    if focus_tags is not None:
+        print_info(f"Incremental mode: {len(changed)} changed file(s), {len(focus_tags)} tag(s) scored against the whole blog.")
+
+    # --- RELATED TAGS (most used tags first) ---
+    related: dict[int, list[TagPair]] = cooccurrence.top_related(top, metric, min_count)
+    tag_ids: list[int] = sorted(
+        (tag_id for tag_id in related if focus_tags is None or table.tags[tag_id] in focus_tags),
+        key=lambda tag_id: (-tag_counts[tag_id], table.tags[tag_id])
+    )
+
+    print(f"{Colors.HEADER}{Colors.BOLD}Related Tags (by {metric}, sharing at least {min_count} post(s)):{Colors.ENDC}")
+    document: dict[str, Any] = {}
+    for tag_id in tag_ids:
+        tag: str = table.tags[tag_id]
+        related_tags: list[dict[str, Any]] = [_related_record(table, pair) for pair in related[tag_id]]
+        print(f"  {Colors.OKGREEN}{tag}{Colors.ENDC} ({Colors.BOLD}{Colors.OKBLUE}{tag_counts[tag_id]}{Colors.ENDC})")
+        for pair in related[tag_id]:
+            print(f"      {table.tags[pair.other_id]:<30}jaccard {pair.jaccard:.2f}   pmi {pair.pmi:>5.2f}   ({pair.count} post(s))")
+        OUTPUT.emit('related_tags', tag=tag, count=tag_counts[tag_id], related=related_tags)
+        document[tag] = {'count': tag_counts[tag_id], 'related': related_tags}
+    if not tag_ids:
+        print(f"  {Colors.OKGREEN}No tags sharing at least {min_count} post(s).{Colors.ENDC}")
+    print("=" * 50)
+
+    # --- TAGS ALWAYS USED TOGETHER ---
+    # Incremental mode: at least one of the two tags must come from a changed file
+    together: list[TagPair] = [
+        pair for pair in cooccurrence.pairs(COOCCURRENCE_MERGE_JACCARD, min_count)
+        if focus_tags is None or table.tags[pair.tag_id] in focus_tags or table.tags[pair.other_id] in focus_tags
+    ]
+    OUTPUT.summary(listed=len(tag_ids), merge_candidates=len(together))
+
+    print(f"\n{Colors.WARNING}{Colors.BOLD}--- TAGS USED TOGETHER (Jaccard >= {COOCCURRENCE_MERGE_JACCARD}) ---{Colors.ENDC}")
+    for pair in together:
+        id1, id2 = sorted((pair.tag_id, pair.other_id), key=lambda tag_id: table.tags[tag_id])
+        t1, t2 = table.tags[id1], table.tags[id2]
+        print(f"  {Colors.WARNING}⚠️ Found: {Colors.ENDC}{t1} ({tag_counts[id1]}) vs {t2} ({tag_counts[id2]}), together in {pair.count} post(s), Jaccard {pair.jaccard:.2f}")
+        print(f"    {Colors.OKCYAN}  Suggestion: Merge into '{t1}' or '{t2}'.{Colors.ENDC}")
+        OUTPUT.emit('cooccurring_tags', tags=[t1, t2], together=pair.count, jaccard=round(pair.jaccard, 4),
+                    counts={t1: tag_counts[id1], t2: tag_counts[id2]})
+    if not together:
+        print(f"  {Colors.OKGREEN}No tags always used together.{Colors.ENDC}")
+    print("-" * 50)
+
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump({'metric': metric, 'top': top, 'min_count': min_count, 'posts': cooccurrence.posts, 'tags': document},
+                      f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        print_success(f"Related tags written to {output_path}.")
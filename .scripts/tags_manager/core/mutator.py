@@ -1,14 +1,22 @@
 """Logic for mutating file states, specifically editing tags."""
 
 import os
-import glob
 from typing import Any
 import frontmatter
-from config import DOCS_DIR, FILE_PATTERN_BASE
+from blog_corpus import BlogCorpus
+from blog_corpus.record_output import OUTPUT
+from blog_corpus.tag_mapping import TagMapping
+from config import DOCS_DIR
 from helpers import generate_markdown_file_content, Colors, print_error, print_warning, print_info, print_success
 
-def process_files(action: str, old_tag: str | None = None, new_tag: str | None = None) -> None:
-    """Modifies tags across all markdown files based on the specified action."""
+def process_files(corpus: BlogCorpus, action: str, old_tag: str | None = None, new_tag: str | None = None,
+                  files: list[str] | None = None) -> None:
+    """
+    Modifies tags across all markdown files based on the specified action.
+    When `files` is given (--since/--staged), only those files are processed.
+    The tags are first looked up in the tag index of the corpus (.cache/tag-index): only
+    the files using `old_tag` are opened and rewritten, the others are only stat()ed.
+    """
     if action == 'delete':
         operation_desc = f"{Colors.FAIL}Deleting tag '{old_tag}'{Colors.ENDC}"
     elif action == 'rename':
@@ -23,9 +31,13 @@ def process_files(action: str, old_tag: str | None = None, new_tag: str | None =
         print_error(f"Directory '{DOCS_DIR}' not found.")
         return
 
-    files: list[str] = glob.glob(FILE_PATTERN_BASE, recursive=True)
-    if not files:
-        print_warning(f"No files found matching '{FILE_PATTERN_BASE}'.")
+    if files is None:
+        files = corpus.paths()
+        if not files:
+            print_warning(f"No .md/.mdx file found in '{DOCS_DIR}'.")
+            return
+    elif not files:
+        print_warning("No changed .md/.mdx file to process.")
         return
 
     print_info(f"{len(files)} file(s) found. Processing...")
@@ -34,7 +46,10 @@ def process_files(action: str, old_tag: str | None = None, new_tag: str | None =
     old_tag_lower = old_tag.lower() if old_tag else None
     new_tag_lower = new_tag.lower() if new_tag else None
 
-    for filepath in files:
+    # Unparsable posts are candidates too: loading them below reports the error
+    candidates: list[str] = corpus.tagged([old_tag] if old_tag else [], files)
+
+    for filepath in candidates:
         try:
             post = frontmatter.load(filepath)
             metadata: dict[str, Any] = post.metadata
@@ -65,16 +80,79 @@ def process_files(action: str, old_tag: str | None = None, new_tag: str | None =
 
                     with open(filepath, 'w', encoding='utf-8') as f:
                         f.write(full_content)
+                    corpus.tag_index.update(filepath, new_tags)
 
                     if action == 'delete':
                         print_success(f"  ✓ Deleted '{old_tag}' from: {filepath}")
                     else:
                         print_success(f"  ✓ Renamed '{old_tag}' to '{new_tag}' in: {filepath}")
+                    OUTPUT.emit('change', file=filepath, action=action, old_tag=old_tag, new_tag=new_tag)
 
                     changes_made += 1
 
         except Exception as e:
             print_error(f"FATAL ERROR PROCESSING {filepath}: {str(e)}")
 
+    OUTPUT.summary(files=len(files), candidates=len(candidates), modified=changes_made)
+    print("-" * 50)
+    print(f"{Colors.BOLD}Operation completed.{Colors.ENDC} {changes_made} file(s) modified.")
+
+def _describe_changes(changes: list[tuple[str, str | None]]) -> str:
+    """Short form of the changes of one post, e.g. "'k8s' -> 'kubernetes', 'draft' deleted"."""
+    return ", ".join(f"'{old}' deleted" if new is None else f"'{old}' -> '{new}'" for old, new in changes)
+
+def remap_tags(corpus: BlogCorpus, mapping: TagMapping, mapping_path: str, files: list[str] | None = None) -> None:
+    """
+    Applies a whole tag mapping (renames, merges, deletions; see blog_corpus/tag_mapping.py)
+    in a single pass: only the posts using a mapped tag, as found in the tag index of the
+    corpus, are opened, and each of them is rewritten at most once.
+    When `files` is given (--since/--staged), only those files are processed.
+    """
+    print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.OKCYAN}Remapping {len(mapping)} tag(s) from '{mapping_path}'{Colors.ENDC}")
+    print(f"Base Directory: {Colors.OKBLUE}{DOCS_DIR}/{Colors.ENDC}")
+
+    if not os.path.exists(DOCS_DIR):
+        print_error(f"Directory '{DOCS_DIR}' not found.")
+        return
+
+    if files is None:
+        files = corpus.paths()
+        if not files:
+            print_warning(f"No .md/.mdx file found in '{DOCS_DIR}'.")
+            return
+    elif not files:
+        print_warning("No changed .md/.mdx file to process.")
+        return
+
+    print_info(f"{len(files)} file(s) found. Processing...")
+
+    changes_made: int = 0
+    # Unparsable posts are candidates too: loading them below reports the error
+    candidates: list[str] = corpus.tagged(mapping.lookup, files)
+
+    for filepath in candidates:
+        try:
+            post = frontmatter.load(filepath)
+            tags: Any = post.metadata.get('tags')
+            if not isinstance(tags, list):
+                continue
+
+            new_tags, changes = mapping.remap(tags)
+            if new_tags == tags:
+                continue
+
+            post.metadata['tags'] = new_tags
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(generate_markdown_file_content(post.metadata, post.content))
+            corpus.tag_index.update(filepath, new_tags)
+
+            print_success(f"  ✓ {_describe_changes(changes) or 'Duplicate tags removed'} in: {filepath}")
+            OUTPUT.emit('change', file=filepath, action='remap', changes=[{'old_tag': old, 'new_tag': new} for old, new in changes])
+            changes_made += 1
+
+        except Exception as e:
+            print_error(f"FATAL ERROR PROCESSING {filepath}: {str(e)}")
+
+    OUTPUT.summary(files=len(files), mappings=len(mapping), candidates=len(candidates), modified=changes_made)
     print("-" * 50)
     print(f"{Colors.BOLD}Operation completed.{Colors.ENDC} {changes_made} file(s) modified.")
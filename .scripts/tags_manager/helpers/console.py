@@ -1,5 +1,7 @@
 """Terminal UI and color definitions."""
 
+from blog_corpus.record_output import OUTPUT
+
 class Colors:
     """ANSI color codes for console output."""
     HEADER = '\033[95m'
@@ -13,8 +15,9 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 def print_error(msg: str) -> None:
-    """Prints a formatted error message."""
+    """Prints a formatted error message (and an 'error' record with --format ndjson/json)."""
     print(f"{Colors.FAIL}{Colors.BOLD}ERROR: {msg}{Colors.ENDC}")
+    OUTPUT.emit('error', message=msg)
 
 def print_warning(msg: str) -> None:
     """Prints a formatted warning message."""
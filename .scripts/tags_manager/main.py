@@ -4,10 +4,22 @@
 import os
 import sys
 import argparse
+from pathlib import Path
+
+# --- PATH PATCH ---
+# Ensures the shared 'blog_corpus' package (in .scripts/) is found regardless of execution context
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.append(str(SCRIPTS_DIR))
+# ------------------
 
 # In main.py
-from config import DOCS_DIR
-from core import list_tags, suggest_tags_for_file, process_files
+from blog_corpus import BlogCorpus
+from blog_corpus.git_changes import GitError
+from blog_corpus.record_output import OUTPUT, OUTPUT_FORMATS
+from blog_corpus.tag_mapping import TagMappingError, load_tag_mapping
+from config import COOCCURRENCE_MIN_COUNT, COOCCURRENCE_TOP, DOCS_DIR, FUZZY_MAX_DISTANCE
+from core import list_tags, suggest_tags_for_file, process_files, remap_tags
 from helpers import Colors, print_error, print_success
 
 def main() -> None:
@@ -18,11 +30,20 @@ def main() -> None:
         formatter_class=argparse.RawTextHelpFormatter
     )
 
+    # Git-aware incremental mode: only the posts touched by a change are processed
+    git_group = parser.add_mutually_exclusive_group()
+    git_group.add_argument('--since', metavar='REF',
+                           help="Only process the files changed since a git ref (e.g. 'origin/main').")
+    git_group.add_argument('--staged', action='store_true',
+                           help="Only process the files staged for the next commit (pre-commit hooks).")
+
     subparsers = parser.add_subparsers(dest="action", help="Available actions.")
 
     parser_list = subparsers.add_parser('list', help=f"List tags in '{DOCS_DIR}', sorted by frequency/name.")
     parser_list.add_argument('--sort', type=str, choices=['name', 'count'], default='count',
                              help="Sort method: 'count' (default) or 'name'.")
+    parser_list.add_argument('--fuzzy', type=int, nargs='?', const=FUZZY_MAX_DISTANCE, default=None, metavar='DISTANCE',
+                             help=f"Also report the tags up to DISTANCE edits apart (typos; default: {FUZZY_MAX_DISTANCE}).")
 
     parser_delete = subparsers.add_parser('delete', help=f"Delete a tag from all files in '{DOCS_DIR}'.")
     parser_delete.add_argument("tag", type=str, help="The tag to DELETE (e.g., 'draft').")
@@ -30,21 +51,64 @@ def main() -> None:
     parser_rename = subparsers.add_parser('rename', help=f"Rename a tag across all files in '{DOCS_DIR}'.")
     parser_rename.add_argument("tags", type=str, help="Format: 'old_tag,new_tag' (e.g., 'prog,programming').")
 
+    parser_remap = subparsers.add_parser('remap', help=f"Rename, merge and delete tags from a mapping file, in one pass over '{DOCS_DIR}'.")
+    parser_remap.add_argument("mapping", type=str, help="YAML file of 'old_tag: new_tag' entries (new_tag null to delete the tag).")
+
+    parser_cooccurrence = subparsers.add_parser('cooccurrence', help=f"List the tags used together in '{DOCS_DIR}' (related tags, requires NumPy and SciPy).")
+    parser_cooccurrence.add_argument('--top', type=int, default=COOCCURRENCE_TOP,
+                                     help=f"Related tags listed per tag (default: {COOCCURRENCE_TOP}).")
+    parser_cooccurrence.add_argument('--metric', type=str, choices=['jaccard', 'pmi'], default='jaccard',
+                                     help="Ranking of the related tags: 'jaccard' (default) or 'pmi' (favors rare tags).")
+    parser_cooccurrence.add_argument('--min-count', type=int, default=COOCCURRENCE_MIN_COUNT,
+                                     help=f"Posts two tags must share to be related (default: {COOCCURRENCE_MIN_COUNT}).")
+    parser_cooccurrence.add_argument('--output', type=str, metavar='FILE',
+                                     help="Also write the related tags of every tag to FILE as JSON.")
+
     parser_suggest = subparsers.add_parser('suggest', help="Use AI to suggest tags for a file.")
     parser_suggest.add_argument("file", type=str, help="Path to the .md file.")
 
+    # Machine-readable output: one JSON record per finding, then a summary record
+    for action_parser in subparsers.choices.values():
+        action_parser.add_argument('--format', choices=OUTPUT_FORMATS, default='text',
+                                   help="Output format: 'text' (default), 'ndjson' (streamed records) or 'json' (one document).")
+
     if len(sys.argv) == 1:
         parser.print_help()
         sys.exit(0)
 
     args = parser.parse_args()
 
+    with OUTPUT.session(getattr(args, 'format', 'text'), args.action):
+        run_main(args)
+
+def run_main(args: argparse.Namespace) -> None:
+    """Opens the corpus and runs the action (within the --format session)."""
+    # Posts and their parsed front matter, shared by every step of the run (persisted on exit)
+    corpus = BlogCorpus(DOCS_DIR)
+
+    changed_files: list[str] | None = None
+    if args.since or args.staged:
+        try:
+            changed_files = corpus.changed_since(since=args.since, staged=args.staged)
+        except GitError as e:
+            print_error(str(e))
+            sys.exit(1)
+
+    with corpus:
+        run_action(corpus, args, changed_files)
+
+def run_action(corpus: BlogCorpus, args: argparse.Namespace, changed_files: list[str] | None) -> None:
+    """Dispatches the parsed command line to the matching action."""
     if args.action == 'list':
-        list_tags(args.sort)
+        if args.fuzzy is not None and args.fuzzy < 1:
+            print_error("--fuzzy expects an edit distance of at least 1.")
+            sys.exit(1)
+        list_tags(corpus, args.sort, changed_files=changed_files, fuzzy_distance=args.fuzzy)
 
     elif args.action == 'suggest':
         print(f"{Colors.BOLD}Suggesting tags for: {Colors.OKBLUE}{args.file}{Colors.ENDC}")
-        suggestions = suggest_tags_for_file(args.file)
+        suggestions = suggest_tags_for_file(corpus, args.file)
+        OUTPUT.emit('suggestion', file=args.file, tags=suggestions)
         if suggestions:
             print_success(f"Suggested tags: {', '.join(suggestions)}")
         else:
@@ -68,7 +132,30 @@ def main() -> None:
                 print_error("Both tags must be specified. Expected format: 'OLD_TAG,NEW_TAG'.")
                 sys.exit(1)
 
-        process_files(action=args.action, old_tag=old_tag, new_tag=new_tag)
+        process_files(corpus, action=args.action, old_tag=old_tag, new_tag=new_tag, files=changed_files)
+
+    elif args.action == 'remap':
+        try:
+            mapping = load_tag_mapping(args.mapping)
+        except TagMappingError as e:
+            print_error(str(e))
+            sys.exit(1)
+
+        remap_tags(corpus, mapping, args.mapping, files=changed_files)
+
+    elif args.action == 'cooccurrence':
+        if args.top < 1 or args.min_count < 1:
+            print_error("--top and --min-count must be at least 1.")
+            sys.exit(1)
+
+        # Imported here: NumPy and SciPy take a while to load, and only this action needs them
+        from blog_corpus.tag_cooccurrence import cooccurrence_available
+        if not cooccurrence_available():
+            print_error("The 'cooccurrence' action requires NumPy and SciPy. Run: pip install numpy scipy")
+            sys.exit(1)
+        from core.cooccurrence import tag_cooccurrence
+
+        tag_cooccurrence(corpus, args.top, args.metric, args.min_count, changed_files=changed_files, output_path=args.output)
 
 if __name__ == "__main__":
     main()
@@ -6,12 +6,36 @@ front matter of Markdown files (e.g., used in static site generators like Jekyll
 Hugo, or Gatsby).
 
 Key features:
-1. Reorder keys based on a predefined standard (FRONTMATTER_KEY_ORDER).
+1. Reorder keys based on a predefined standard (FRONTMATTER_KEY_ORDER), or only
+   report the files out of order (check-order).
 2. Add, remove, or check for presence/absence of specific keys.
 3. Clean up conceptual duplicates and misspellings (e.g., 'canonicalURL' -> 'canonicalurl').
 4. List all unique keys and their values across the entire content base.
+   Select posts with a query expression (query), e.g. "tags contains docker and not image".
+   Export everything to SQLite for ad-hoc SQL (export --format sqlite).
 5. Check for SEO and content quality issues (check-seo).
 6. Check for general mandatory key presence (check-mandatory).
+7. Run every check above in a single pass over the files (check-all).
+8. Find posts sharing a slug, title, description or image, and near-duplicate
+   descriptions (check-unique, hash indexes and MinHash/LSH: no pairwise comparison).
+9. Insert or verify the 'date' key from the blog/YYYY/MM/DD/ path of each post
+   (sync-dates), editing only the header lines of the files that need it.
+10. Apply a YAML plan of add/default/rename/remove/lowercase operations in one pass
+   (apply-plan): each post is read once and written at most once.
+
+Read-only actions are served from a persistent front matter index (.cache/frontmatter-index)
+keyed on (path, mtime, size): only files changed since the previous run are parsed again.
+Use --no-cache to bypass it.
+
+Use --since REF or --staged to only process the posts touched by a change (git diff).
+
+Use the 'watch' action to re-validate each post as it is saved (inotify, or polling).
+
+Use --format ndjson (or json) on any action to get one JSON record per finding and a
+final summary record instead of the colored text (see blog_corpus/record_output.py).
+
+Per-file work (parsing, rewriting) is spread over a process pool; use --jobs N to
+control the number of worker processes (default: number of cores).
 
 Dependencies:
 - python-frontmatter: Used for reliable parsing and dumping of front matter.
@@ -19,12 +43,17 @@ Dependencies:
 """
 
 import argparse
-from typing import List, Dict, Any, Set, Tuple, Optional
+import datetime
+from typing import List, Dict, Any, Set, Tuple, Optional, Callable, Iterator, NamedTuple, NoReturn
 import os
-import glob
 from collections import OrderedDict
+from contextlib import nullcontext, redirect_stdout
 import sys
 import re
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 # --- Dependency Check and Import ---
 try:
@@ -36,6 +65,21 @@ except ImportError:
     print("Run: pip install python-frontmatter oyaml")
     sys.exit(1)
 
+# Shared helpers living next to this script (.scripts/blog_corpus)
+from blog_corpus import DEFAULT_INDEX_PATH, PostRecord, file_signature
+from blog_corpus.compact import PostTable
+from blog_corpus.corpus import BlogCorpus
+from blog_corpus.edit_plan import EditPlan, PlanError, header_edit, load_plan
+from blog_corpus.file_watcher import POLL_INTERVAL_SECONDS, create_watcher
+from blog_corpus.git_changes import GitError
+from blog_corpus.header_patch import FrontMatterPatch
+from blog_corpus.profiler import PROFILER
+from blog_corpus.query import ColumnarIndex, Node, QueryError, parse_query
+from blog_corpus.record_output import OUTPUT, OUTPUT_FORMATS
+from blog_corpus.sqlite_export import DEFAULT_DATABASE_PATH, apply_export, connect, plan_export
+from blog_corpus.uniqueness import Collision, NearDuplicateGroup, find_collisions, find_near_duplicates
+from blog_corpus.yaml_backend import DEFAULT_BACKEND
+
 
 # --- ANSI Color Codes ---
 class Colors:
@@ -56,12 +100,20 @@ class Colors:
 # The root directory containing Markdown files
 DOCS_DIR: str = 'blog'
 
-# Glob pattern to find all target files (recursive search in DOCS_DIR)
-# NOTE: The pattern '**/*.md*' includes files like .md, .mdx, etc.
-FILE_PATTERN_BASE: str = os.path.join(DOCS_DIR, '**', '*.md*')
+# The posts (.md/.mdx files) under DOCS_DIR are listed by blog_corpus/discovery.py
 
-# Regex to find the YAML boundary (e.g., '---')
-YAML_BOUNDARY: re.Pattern[str] = re.compile(r'^-{3,}\s*$', re.MULTILINE)
+# Location of the persistent front matter index (see blog_corpus/frontmatter_index.py)
+# Read-only actions only re-parse the files whose (mtime, size) changed since the last run.
+INDEX_PATH: str = DEFAULT_INDEX_PATH
+
+# Number of worker processes used for per-file work (overridden by --jobs)
+JOBS: int = os.cpu_count() or 1
+
+# Below this number of files, the process pool costs more than it saves
+PARALLEL_MIN_FILES: int = 32
+
+# Posts selected by --since REF / --staged (None: the whole DOCS_DIR is processed)
+CHANGED_FILES: Optional[List[str]] = None
 
 # Define the logical/standard order for front matter keys (Reordering rule)
 FRONTMATTER_KEY_ORDER: List[str] = [
@@ -100,6 +152,23 @@ SEO_LOWERCASE_KEYS: List[str] = [
     'tags', 'categories', 'mainTag'
 ]
 
+# Keys whose value must be unique across the whole blog (checked by 'watch').
+# Two posts with the same slug end up on the same URL.
+UNIQUE_KEYS: List[str] = ['slug']
+
+# Keys checked across the whole blog by 'check-unique' (values compared ignoring case and extra spaces).
+# Cover images are often shared on purpose (generic covers): their collisions are only warnings.
+UNIQUE_CHECK_KEYS: List[str] = ['slug', 'title', 'description', 'image']
+UNIQUE_WARNING_KEYS: List[str] = ['image']
+
+# Keys also checked by 'check-unique' for near-duplicates (e.g. a description copied then edited)
+NEAR_DUPLICATE_KEYS: List[str] = ['description']
+NEAR_DUPLICATE_THRESHOLD: float = 0.8
+
+# Posts live in DOCS_DIR/YYYY/MM/DD/<slug>/: 'sync-dates' reads the publication date from that path
+DATE_KEY: str = 'date'
+DATE_PATH_PATTERN: re.Pattern[str] = re.compile(r'^(\d{4})/(\d{2})/(\d{2})/')
+
 # Define groups of keys that should never coexist (misspellings, deprecated names, etc.)
 # Normalized Key (for group reference): [List of all conceptual variants]
 CONCEPTUAL_DUPLICATE_GROUPS: Dict[str, List[str]] = {
@@ -113,42 +182,18 @@ CONCEPTUAL_DUPLICATE_GROUPS: Dict[str, List[str]] = {
 # YAML Dumper Configuration & Custom Logic
 # ----------------------------------------------------------------------
 
-def custom_list_representer(dumper: yaml.SafeDumper, data: List[Any]) -> yaml.nodes.SequenceNode:
-    """Forces Python lists to be represented in YAML flow style: [item1, item2]."""
-    return dumper.represent_sequence('tag:yaml.org,2002:seq', data, flow_style=True)
-
-def custom_string_representer(dumper: yaml.SafeDumper, data: str) -> yaml.nodes.ScalarNode:
-    """Prevents PyYAML from folding long strings into multi-line blocks."""
-    if '\n' in data:
-        # Use block style (literal block) if the string explicitly contains newlines
-        return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='|')
-    # Use plain style for single-line strings, preventing folding
-    return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='')
-
-# Registering custom representers on the SafeDumper
-yaml.add_representer(list, custom_list_representer, Dumper=yaml.SafeDumper)
-yaml.add_representer(str, custom_string_representer, Dumper=yaml.SafeDumper)
-
+# The custom representers (flow-style lists, non-folded strings) are registered by
+# blog_corpus/yaml_backend.py on both the libyaml and the pure-Python dumpers.
+# DEFAULT_BACKEND uses libyaml when installed (override with BLOG_YAML_BACKEND=python).
 
 def custom_dumper_factory(metadata: Dict[str, Any], content: str) -> str:
     """
     Generates the final file content string (front matter + markdown content)
     using the customized YAML dumper for consistent formatting.
     """
-    import io
-    output: io.StringIO = io.StringIO()
-
-    # Dump the metadata to the StringIO object
-    yaml.dump(
-        metadata,
-        output,
-        Dumper=yaml.SafeDumper,
-        default_flow_style=False,
-        allow_unicode=True,
-        width=4096  # Prevent line folding
-    )
-
-    yaml_output: str = output.getvalue().rstrip() + '\n'
+    # Flow-style lists, non-folded strings and width=4096 (see blog_corpus/yaml_backend.py)
+    with PROFILER.phase('dump'):
+        yaml_output: str = DEFAULT_BACKEND.dump(metadata).rstrip() + '\n'
 
     # Ensure no leading newlines in content
     clean_content: str = content.lstrip('\n')
@@ -160,13 +205,115 @@ def custom_dumper_factory(metadata: Dict[str, Any], content: str) -> str:
 # Core Utility Functions
 # ----------------------------------------------------------------------
 
+# Posts of DOCS_DIR and their parsed front matter (persistent index), created lazily by _get_corpus()
+_CORPUS: Optional[BlogCorpus] = None
+
 def _get_files() -> List[str]:
-    """Helper to find all target files using recursive glob."""
+    """Helper to find all target posts (or the changed posts with --since/--staged)."""
     if not os.path.exists(DOCS_DIR):
         print(f"{Colors.FAIL}{Colors.BOLD}ERROR: Directory '{DOCS_DIR}' not found.{Colors.ENDC}")
+        OUTPUT.emit('error', message=f"Directory '{DOCS_DIR}' not found.")
         return []
-    # Use recursive=True (requires Python 3.5+)
-    return glob.glob(FILE_PATTERN_BASE, recursive=True)
+    if CHANGED_FILES is not None:
+        if not CHANGED_FILES:
+            print(f"{Colors.OKGREEN}No changed .md/.mdx file under '{DOCS_DIR}'. Nothing to do.{Colors.ENDC}")
+        return CHANGED_FILES
+    return _get_all_files()
+
+def _get_all_files() -> List[str]:
+    """All .md/.mdx posts of DOCS_DIR, ignoring --since/--staged (for actions that need the whole blog)."""
+    # Sorted so that reports are printed in a stable order, whatever the number of jobs
+    return _get_corpus().paths()
+
+def _get_corpus() -> BlogCorpus:
+    """Returns the blog corpus (and its front matter index) shared by all actions of this run."""
+    global _CORPUS
+    if _CORPUS is None:
+        _CORPUS = BlogCorpus(DOCS_DIR, INDEX_PATH)
+    return _CORPUS
+
+def _get_record(filepath: str) -> PostRecord:
+    """Returns the (possibly cached) parsed front matter record of a file."""
+    return _get_corpus().record(filepath)
+
+def _get_indexed_files(files: Optional[List[str]] = None) -> List[str]:
+    """
+    Same as _get_files(), but also makes sure every file is in the front matter index.
+    Files that changed since the last run are parsed up front, spread over JOBS processes.
+    """
+    if files is None:
+        files = _get_files()
+    return _get_corpus().load(files, _map_files)
+
+def _get_post_table(files: List[str]) -> PostTable:
+    """
+    Compact records (keys, tags and authors as interned ids) of the files, built from the
+    front matter index, for the actions that don't need the values of the keys.
+    """
+    table: PostTable = PostTable()
+    for filepath in files:
+        record: PostRecord = _get_record(filepath)
+        table.add(filepath, record.metadata, record.error)
+    return table
+
+def _load_metadata(filepath: str) -> Dict[str, Any]:
+    """
+    Read-only replacement for `frontmatter.load(filepath).metadata` served from the index.
+    Raises ValueError when the file could not be parsed, like frontmatter.load would.
+    """
+    record: PostRecord = _get_record(filepath)
+    if record.error is not None:
+        raise ValueError(record.error)
+    return record.metadata
+
+class FileResult(NamedTuple):
+    """Outcome of a per-file worker, sent back to the parent process for reporting."""
+    filepath: str
+    changed: bool = False
+    messages: Tuple[Tuple[str, str], ...] = ()  # (level, text) lines, printed in order
+    error: Optional[str] = None
+
+# Console color used for each FileResult message level
+MESSAGE_COLORS: Dict[str, str] = {
+    'success': Colors.OKGREEN,
+    'info': Colors.OKCYAN,
+    'removed': Colors.FAIL,
+}
+
+def _map_files(worker: Callable[[str], Any], files: List[str]) -> Iterator[Any]:
+    """
+    Runs `worker(filepath)` for every file, spread over JOBS processes.
+    Results are yielded in the same order as `files`, so reports stay deterministic.
+    The worker must be a module-level function (it is pickled to the child processes).
+    """
+    if JOBS <= 1 or len(files) < PARALLEL_MIN_FILES:
+        for filepath in files:
+            yield worker(filepath)
+        return
+
+    # Hand out several files per task to keep the inter-process overhead low
+    chunksize: int = max(1, len(files) // (JOBS * 4))
+    with ProcessPoolExecutor(max_workers=JOBS) as executor:
+        yield from executor.map(worker, files, chunksize=chunksize)
+
+def _print_file_result(result: FileResult) -> None:
+    """Prints the messages of a FileResult as the sequential loop used to (and its records)."""
+    for level, text in result.messages:
+        print(f"{MESSAGE_COLORS[level]}  {text}{Colors.ENDC}")
+    if result.changed:
+        OUTPUT.emit('change', file=result.filepath, messages=[text for _, text in result.messages])
+    if result.error is not None:
+        print(f"{Colors.FAIL}  ❌ ERROR processing {result.filepath}: {result.error}{Colors.ENDC}")
+        OUTPUT.emit('error', file=result.filepath, message=result.error)
+
+def _run_file_workers(worker: Callable[[str], FileResult], files: List[str]) -> int:
+    """Runs a per-file worker over all files, prints each result and returns the number of changed files."""
+    changes_made: int = 0
+    for result in _map_files(worker, files):
+        _print_file_result(result)
+        if result.changed:
+            changes_made += 1
+    return changes_made
 
 def _sort_frontmatter_keys(metadata: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -195,14 +342,77 @@ def _sort_frontmatter_keys(metadata: Dict[str, Any]) -> Dict[str, Any]:
 
     return sorted_metadata
 
+def _key_rank(key: str) -> Tuple[int, int, str]:
+    """Sort key matching _sort_frontmatter_keys: FRONTMATTER_KEY_ORDER first, then alphabetical."""
+    if key in FRONTMATTER_KEY_ORDER:
+        return 0, FRONTMATTER_KEY_ORDER.index(key), ''
+    return 1, 0, key
+
+def _read_text(filepath: str) -> str:
+    """Reads a file as-is (line endings included) so that untouched bytes can be written back unchanged."""
+    with PROFILER.phase('read', filepath):
+        with open(filepath, 'r', encoding='utf-8', newline='') as f:
+            return f.read()
+
+def _parse_text(filepath: str, text: str) -> frontmatter.Post:
+    """frontmatter.loads(), timed as the 'parse' phase of --profile."""
+    with PROFILER.phase('parse', filepath):
+        return frontmatter.loads(text)
+
+def _load_post(filepath: str) -> frontmatter.Post:
+    """Same as frontmatter.load(filepath), with the read and parse phases timed separately."""
+    with PROFILER.phase('read', filepath):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            text: str = f.read()
+    return _parse_text(filepath, text)
+
+def _write_text(filepath: str, full_content: str) -> None:
+    """Writes the content of a file atomically."""
+    # Write to a temporary file in the same directory, then swap it in place: a file
+    # is never left half-written, even when several worker processes write at once.
+    with PROFILER.phase('write', filepath):
+        directory: str = os.path.dirname(filepath) or '.'
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.yaml-manager-')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+                f.write(full_content)
+            os.chmod(tmp_path, os.stat(filepath).st_mode & 0o777)
+            os.replace(tmp_path, filepath)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
 def _write_file(filepath: str, metadata: Dict[str, Any], content: str) -> None:
     """Sorts keys (via _sort_frontmatter_keys) and writes the combined content back to the file."""
     # The sorting step is implicitly handled inside the write process for consistency
     sorted_metadata: Dict[str, Any] = _sort_frontmatter_keys(metadata)
-    full_content: str = custom_dumper_factory(sorted_metadata, content)
+    _write_text(filepath, custom_dumper_factory(sorted_metadata, content))
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(full_content)
+def _write_patched_file(filepath: str, text: str, post: frontmatter.Post, edit: Callable[[FrontMatterPatch], None]) -> None:
+    """
+    Applies a line-level edit to the front matter of a file instead of re-serializing it:
+    only the lines of the affected keys change, every other byte is written back untouched.
+
+    `post.metadata` must already hold the expected result of the edit. The patched header is
+    parsed again and compared to it; if they differ (unusual YAML the line patcher can't edit
+    safely), the file is rewritten in full with _write_file() instead.
+    Nothing is written when the patch leaves the file unchanged.
+    """
+    try:
+        with PROFILER.phase('patch', filepath):
+            patch: FrontMatterPatch = FrontMatterPatch(text)
+            edit(patch)
+            patched: bool = (DEFAULT_BACKEND.load(patch.header_yaml()) or {}) == post.metadata
+        if patched:
+            new_text: str = patch.render()
+            if new_text != text:
+                _write_text(filepath, new_text)
+            return
+    except ValueError:
+        pass  # No regular '---' block: fall back to the full rewrite
+
+    _write_file(filepath, post.metadata, post.content)
 
 def _parse_key_value_arg(key_value_arg: str) -> Tuple[str, str]:
     """Parses the 'key,value' argument for the add-key action."""
@@ -226,35 +436,17 @@ def _parse_key_value_arg(key_value_arg: str) -> Tuple[str, str]:
 
 def _normalize_key_data(filepath: str) -> Tuple[Set[str], List[str]]:
     """
-    Reads file using basic text parsing (not frontmatter library) to reliably
-    extract all front matter keys, including literal/case variants, for conflict checking.
+    Returns the front matter keys extracted using basic text parsing (not frontmatter
+    library), including literal/case variants, for conflict checking.
+    The raw keys are stored in the front matter index next to the parsed metadata.
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            raw_content: str = f.read()
-
-        # Find the YAML block boundaries
-        matches: List[re.Match[str]] = list(YAML_BOUNDARY.finditer(raw_content))
-        if len(matches) < 2:
-            return set(), [] # No valid front matter
-
-        yaml_block: str = raw_content[matches[0].end():matches[1].start()].strip()
-
-        original_keys: List[str] = []
-        # Simple line-by-line check: look for 'key:' at the start of a line
-        for line in yaml_block.splitlines():
-            line = line.strip()
-            # Basic filtering for top-level keys
-            # Checks: contains ':', not a comment, not indented (no space), not a list item ('-')
-            if ':' in line and not line.startswith('#') and not line.startswith(' ') and not line.startswith('-'):
-                key_part: str = line.split(':', 1)[0].strip()
-                original_keys.append(key_part)
-
+        original_keys: List[str] = _get_record(filepath).raw_keys
         normalized_keys: Set[str] = {key.lower() for key in original_keys}
         return normalized_keys, original_keys
 
     except Exception as e:
-        print(f"{Colors.FAIL}  ❌ ERROR reading or parsing {filepath}: {e}{Colors.ENDC}")
+        print(f"{Colors.FAIL}  ❌ ERROR reading or parsing {filepath}: {e}{Colors.ENDC}")
         return set(), []
 
 def _process_default_value(default_value: str) -> Any:
@@ -273,13 +465,149 @@ def _process_default_value(default_value: str) -> Any:
             pass
     return default_value
 
+# ----------------------------------------------------------------------
+# Per-File Checks (shared by the check-* actions and check-all)
+# ----------------------------------------------------------------------
+
+class RecordCheck(NamedTuple):
+    """A check run over one parsed record; returns the list of issues found."""
+    name: str
+    func: Callable[[PostRecord], List[str]]
+    needs_metadata: bool  # Skipped when the YAML block itself can't be parsed
+
+def _mandatory_key_issues(metadata: Dict[str, Any]) -> List[str]:
+    """Returns one issue per key of MANDATORY_KEYS missing from the metadata."""
+    return [
+        f"Missing mandatory key: '{key}'"
+        for key in MANDATORY_KEYS
+        if key not in metadata
+    ]
+
+def _seo_issues(metadata: Dict[str, Any]) -> List[str]:
+    """Returns the SEO and content quality issues found in the metadata."""
+    issues_found: List[str] = []
+
+    # ------------------------------------------------
+    # 1. Mandatory Key Presence Check
+    # ------------------------------------------------
+    for key in SEO_MANDATORY_KEYS:
+        if key not in metadata:
+            issues_found.append(f"Missing mandatory SEO key: '{key}'")
+
+    # ------------------------------------------------
+    # 2. Length and Format Checks
+    # ------------------------------------------------
+    for key, min_len in SEO_MIN_LENGTHS.items():
+        if key in metadata and isinstance(metadata[key], str):
+            content = metadata[key].strip()
+            if len(content) < min_len:
+                issues_found.append(f"Key '{key}' too short ({len(content)} chars). Min recommended: {min_len} chars.")
+
+    for key, max_len in SEO_MAX_LENGTHS.items():
+        if key in metadata and isinstance(metadata[key], str):
+            content = metadata[key].strip()
+            if len(content) > max_len:
+                issues_found.append(f"Key '{key}' too long ({len(content)} chars). Max recommended: {max_len} chars.")
+
+    # ------------------------------------------------
+    # 3. Normalization (Lowercase) Check
+    # ------------------------------------------------
+    for key in SEO_LOWERCASE_KEYS:
+        if key in metadata:
+            values_to_check: List[str] = []
+            if isinstance(metadata[key], str):
+                values_to_check = [metadata[key]]
+            elif isinstance(metadata[key], list):
+                values_to_check = [str(v) for v in metadata[key]]
+
+            for value in values_to_check:
+                if value and value != value.lower():
+                    issues_found.append(f"Key '{key}' value '{value}' is not normalized (must be lowercase).")
+                    # Flag the file, move to next key
+                    break
+
+    return issues_found
+
+def _literal_duplicate_issues(original_keys: List[str]) -> List[str]:
+    """Returns the case-insensitive literal key duplicates (e.g., 'date' and 'Date')."""
+    key_variants: Dict[str, List[str]] = {}
+
+    for key_part in original_keys:
+        normalized_key: str = key_part.lower()
+        key_variants.setdefault(normalized_key, []).append(key_part)
+
+    issues_found: List[str] = []
+    for normalized_key, originals in key_variants.items():
+        # Conflict if multiple *unique* original keys normalize to the same key.
+        unique_originals: List[str] = list(set(originals))
+        if len(unique_originals) > 1:
+            issues_found.append(f"Conflict Key '{normalized_key}': Variants found: {', '.join(unique_originals)}")
+
+    return issues_found
+
+def _conceptual_duplicate_issues(normalized_keys: Set[str]) -> List[str]:
+    """Returns the conceptual duplicate keys found, based on CONCEPTUAL_DUPLICATE_GROUPS."""
+    issues_found: List[str] = []
+
+    for normalized_group_key, valid_variants in CONCEPTUAL_DUPLICATE_GROUPS.items():
+        # Check if multiple normalized keys from the group exist in the file
+        present_variants: List[str] = [
+            variant for variant in valid_variants
+            if variant.lower() in normalized_keys
+        ]
+
+        # If two or more variants from the same conceptual group are present, it's a conflict
+        if len(present_variants) > 1:
+            issues_found.append(f"Conflict Group: {', '.join(valid_variants)}")
+            issues_found.append(f"Found Keys: {', '.join(present_variants)}")
+
+    return issues_found
+
+# Checks run by 'check-all', in reporting order. Register new per-file checks here.
+RECORD_CHECKS: List[RecordCheck] = [
+    RecordCheck('mandatory', lambda record: _mandatory_key_issues(record.metadata), True),
+    RecordCheck('seo', lambda record: _seo_issues(record.metadata), True),
+    RecordCheck('literal-duplicates', lambda record: _literal_duplicate_issues(record.raw_keys), False),
+    RecordCheck('conceptual-duplicates', lambda record: _conceptual_duplicate_issues({key.lower() for key in record.raw_keys}), False),
+]
+
+def _record_report(filepath: str) -> List[Tuple[str, str]]:
+    """Runs every check of RECORD_CHECKS on one file; returns (check name, issue) pairs."""
+    report: List[Tuple[str, str]] = []
+
+    try:
+        record: Optional[PostRecord] = _get_record(filepath)
+    except Exception as e:
+        record = None
+        report.append(('parse', f"Critical reading error: {e}"))
+
+    if record is not None:
+        if record.error is not None:
+            report.append(('parse', f"Critical parsing error: {record.error}"))
+
+        with PROFILER.phase('check', filepath):
+            for check in RECORD_CHECKS:
+                if check.needs_metadata and record.error is not None:
+                    continue
+                for issue in check.func(record):
+                    report.append((check.name, issue))
+
+    return report
+
+def _print_record_report(filepath: str, report: List[Tuple[str, str]]) -> None:
+    """Prints the issues of one file, grouped under its path (one 'issue' record each)."""
+    print(f"{Colors.FAIL}  ❌ Issues found in: {filepath}{Colors.ENDC}")
+    for check_name, issue in report:
+        print(f"      - {Colors.OKCYAN}[{check_name}]{Colors.ENDC} {Colors.WARNING}{issue}{Colors.ENDC}")
+        OUTPUT.emit('issue', file=filepath, check=check_name, message=issue)
+
 # ----------------------------------------------------------------------
 # Action Implementations
 # ----------------------------------------------------------------------
 
 def check_mandatory_keys() -> None:
     """Action: Ensures a predefined list of keys (MANDATORY_KEYS) is present in all files."""
-    files: List[str] = _get_files()
+    files: List[str] = _get_indexed_files()
     if not files: return
 
     print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.OKCYAN}Running Mandatory Key Presence Check on {len(files)} file(s).{Colors.ENDC}")
@@ -290,13 +618,11 @@ def check_mandatory_keys() -> None:
     for filepath in files:
         issues_found: List[str] = []
         try:
-            post = frontmatter.load(filepath)
-            metadata: Dict[str, Any] = post.metadata
+            metadata: Dict[str, Any] = _load_metadata(filepath)
 
             # Check if all mandatory keys are present
-            for key in MANDATORY_KEYS:
-                if key not in metadata:
-                    issues_found.append(f"Missing mandatory key: '{key}'")
+            with PROFILER.phase('check', filepath):
+                issues_found = _mandatory_key_issues(metadata)
 
         except Exception as e:
             issues_found.append(f"Critical parsing error: {e}")
@@ -306,8 +632,10 @@ def check_mandatory_keys() -> None:
             print(f"{Colors.FAIL}  ❌ Mandatory Keys missing in: {filepath}{Colors.ENDC}")
             for issue in issues_found:
                 print(f"      - {Colors.WARNING}{issue}{Colors.ENDC}")
+                OUTPUT.emit('issue', file=filepath, check='mandatory', message=issue)
             total_issues += 1
 
+    OUTPUT.summary(files=len(files), files_with_issues=total_issues)
     print("-" * 50)
     if total_issues == 0:
         print(f"{Colors.OKGREEN}{Colors.BOLD}Mandatory Key Check completed.{Colors.ENDC} All {len(files)} file(s) passed the check.")
@@ -316,7 +644,7 @@ def check_mandatory_keys() -> None:
 
 def check_seo() -> None:
     """Action: Performs a comprehensive check on essential SEO and quality front matter keys."""
-    files: List[str] = _get_files()
+    files: List[str] = _get_indexed_files()
     if not files: return
 
     print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.OKCYAN}Running SEO and Quality Check on {len(files)} file(s).{Colors.ENDC}")
@@ -326,47 +654,9 @@ def check_seo() -> None:
     for filepath in files:
         issues_found: List[str] = []
         try:
-            post = frontmatter.load(filepath)
-            metadata: Dict[str, Any] = post.metadata
-
-            # ------------------------------------------------
-            # 1. Mandatory Key Presence Check
-            # ------------------------------------------------
-            for key in SEO_MANDATORY_KEYS:
-                if key not in metadata:
-                    issues_found.append(f"Missing mandatory SEO key: '{key}'")
-
-            # ------------------------------------------------
-            # 2. Length and Format Checks
-            # ------------------------------------------------
-            for key, min_len in SEO_MIN_LENGTHS.items():
-                if key in metadata and isinstance(metadata[key], str):
-                    content = metadata[key].strip()
-                    if len(content) < min_len:
-                        issues_found.append(f"Key '{key}' too short ({len(content)} chars). Min recommended: {min_len} chars.")
-
-            for key, max_len in SEO_MAX_LENGTHS.items():
-                if key in metadata and isinstance(metadata[key], str):
-                    content = metadata[key].strip()
-                    if len(content) > max_len:
-                        issues_found.append(f"Key '{key}' too long ({len(content)} chars). Max recommended: {max_len} chars.")
-
-            # ------------------------------------------------
-            # 3. Normalization (Lowercase) Check
-            # ------------------------------------------------
-            for key in SEO_LOWERCASE_KEYS:
-                if key in metadata:
-                    values_to_check: List[str] = []
-                    if isinstance(metadata[key], str):
-                        values_to_check = [metadata[key]]
-                    elif isinstance(metadata[key], list):
-                        values_to_check = [str(v) for v in metadata[key]]
-
-                    for value in values_to_check:
-                        if value and value != value.lower():
-                            issues_found.append(f"Key '{key}' value '{value}' is not normalized (must be lowercase).")
-                            # Flag the file, move to next key
-                            break
+            metadata: Dict[str, Any] = _load_metadata(filepath)
+            with PROFILER.phase('check', filepath):
+                issues_found = _seo_issues(metadata)
 
         except Exception as e:
             issues_found.append(f"Critical parsing error: {e}")
@@ -376,68 +666,137 @@ def check_seo() -> None:
             print(f"{Colors.FAIL}  ❌ SEO Issues found in: {filepath}{Colors.ENDC}")
             for issue in issues_found:
                 print(f"      - {Colors.WARNING}{issue}{Colors.ENDC}")
+                OUTPUT.emit('issue', file=filepath, check='seo', message=issue)
             total_issues += 1
 
+    OUTPUT.summary(files=len(files), files_with_issues=total_issues)
     print("-" * 50)
     if total_issues == 0:
         print(f"{Colors.OKGREEN}{Colors.BOLD}SEO Check completed.{Colors.ENDC} All {len(files)} file(s) passed all checks.")
     else:
         print(f"{Colors.FAIL}{Colors.BOLD}SEO Check completed with errors.{Colors.ENDC} {total_issues} file(s) have SEO issues.")
 
-def reorder_keys() -> None:
-    """Action: Reorder keys in the front matter of all files based on FRONTMATTER_KEY_ORDER."""
-    files: List[str] = _get_files()
-    if not files: return
+def _key_order_issue(keys: List[str]) -> Optional[str]:
+    """Describes the first key out of the FRONTMATTER_KEY_ORDER order, or returns None when the keys are sorted."""
+    expected: List[str] = sorted(keys, key=_key_rank)
+    for found, wanted in zip(keys, expected):
+        if found != wanted:
+            return f"'{wanted}' should come before '{found}' (expected order: {', '.join(expected)})"
+    return None
 
-    print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.OKCYAN}Reordering front matter keys in {len(files)} file(s).{Colors.ENDC}")
+def check_order() -> int:
+    """
+    Action: Reports the files whose keys don't follow FRONTMATTER_KEY_ORDER, without writing anything.
+    Only the key sequence of each header is compared, served from the front matter index.
+    Returns the number of files out of order.
+    """
+    files: List[str] = _get_indexed_files()
+    if not files: return 0
 
-    changes_made: int = 0
+    print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.OKCYAN}Checking the key order of {len(files)} file(s).{Colors.ENDC}")
+
+    total_issues: int = 0
     for filepath in files:
-        try:
-            post = frontmatter.load(filepath)
-            original_keys: List[str] = list(post.metadata.keys())
+        record: PostRecord = _get_record(filepath)
+        if record.error is not None:
+            issue: Optional[str] = f"Critical parsing error: {record.error}"
+        else:
+            with PROFILER.phase('check', filepath):
+                issue = _key_order_issue(list(record.metadata))
+
+        # --- Reporting ---
+        if issue is not None:
+            print(f"{Colors.FAIL}  ❌ Keys out of order in: {filepath}{Colors.ENDC}")
+            print(f"      - {Colors.WARNING}{issue}{Colors.ENDC}")
+            OUTPUT.emit('issue', file=filepath, check='order', message=issue)
+            total_issues += 1
+
+    OUTPUT.summary(files=len(files), files_with_issues=total_issues)
+    print("-" * 50)
+    if total_issues == 0:
+        print(f"{Colors.OKGREEN}{Colors.BOLD}Key Order Check completed.{Colors.ENDC} All {len(files)} file(s) follow the standard order.")
+    else:
+        print(f"{Colors.FAIL}{Colors.BOLD}Key Order Check completed with errors.{Colors.ENDC} {total_issues} file(s) are out of order (run 'reorder' to fix them).")
+
+    return total_issues
 
-            # Get the metadata as it would be sorted and dumped
-            sorted_metadata: Dict[str, Any] = _sort_frontmatter_keys(post.metadata)
+def _reorder_file(filepath: str) -> FileResult:
+    """Worker: reorders the keys of one file (see reorder_keys)."""
+    try:
+        post = _load_post(filepath)
+        original_keys: List[str] = list(post.metadata.keys())
 
-            # Only write back if the order actually changed
-            if original_keys != list(sorted_metadata.keys()):
-                _write_file(filepath, sorted_metadata, post.content)
-                print(f"{Colors.OKGREEN}  ✓ Reordered keys in: {filepath}{Colors.ENDC}")
-                changes_made += 1
+        # Get the metadata as it would be sorted and dumped
+        sorted_metadata: Dict[str, Any] = _sort_frontmatter_keys(post.metadata)
 
-        except Exception as e:
-            print(f"{Colors.FAIL}  ❌ ERROR processing {filepath}: {e}{Colors.ENDC}")
+        # Only write back if the order actually changed
+        if original_keys != list(sorted_metadata.keys()):
+            _write_file(filepath, sorted_metadata, post.content)
+            return FileResult(filepath, True, (('success', f"✓ Reordered keys in: {filepath}"),))
+
+    except Exception as e:
+        return FileResult(filepath, error=str(e))
+
+    return FileResult(filepath)
+
+def reorder_keys() -> None:
+    """
+    Action: Reorder keys in the front matter of all files based on FRONTMATTER_KEY_ORDER.
+    The key order is checked on the front matter index first (as check-order does):
+    only the files out of order are read and rewritten.
+    """
+    files: List[str] = _get_indexed_files()
+    if not files: return
+
+    # Unreadable files are kept: the worker reports their error
+    out_of_order: List[str] = []
+    for filepath in files:
+        record: PostRecord = _get_record(filepath)
+        with PROFILER.phase('check', filepath):
+            if record.error is not None or _key_order_issue(list(record.metadata)) is not None:
+                out_of_order.append(filepath)
+
+    print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.OKCYAN}Reordering front matter keys in {len(files)} file(s) ({len(out_of_order)} out of order).{Colors.ENDC}")
+
+    changes_made: int = _run_file_workers(_reorder_file, out_of_order)
+    OUTPUT.summary(files=len(files), out_of_order=len(out_of_order), modified=changes_made)
 
     print("-" * 50)
     print(f"{Colors.BOLD}Operation completed.{Colors.ENDC} {changes_made} file(s) modified.")
 
 def list_keys() -> None:
     """Action: Collects and lists all unique front matter keys found, sorted alphabetically."""
-    files: List[str] = _get_files()
+    files: List[str] = _get_indexed_files()
     if not files: return
 
     print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.OKBLUE}Listing all unique YAML keys found in {len(files)} file(s).{Colors.ENDC}")
 
-    unique_keys: Set[str] = set()
-    key_counts: Dict[str, int] = {}
     files_with_frontmatter: int = 0
     files_without_frontmatter: int = 0
     files_with_no_keys: List[str] = []
 
-    for filepath in files:
-        try:
-            post = frontmatter.load(filepath)
-            if post.metadata:
-                files_with_frontmatter += 1
-                for key in post.metadata.keys():
-                    unique_keys.add(key)
-                    key_counts[key] = key_counts.get(key, 0) + 1
-            else:
-                files_without_frontmatter += 1
-                files_with_no_keys.append(filepath)
-        except Exception as e:
-            print(f"{Colors.FAIL}  ❌ ERROR processing {filepath}: {e}{Colors.ENDC}")
+    # Keys are counted as interned ids: no per-file set or dict of key strings
+    table: PostTable = _get_post_table(files)
+    for post in table.posts:
+        if post.error is not None:
+            print(f"{Colors.FAIL}  ❌ ERROR processing {post.path}: {post.error}{Colors.ENDC}")
+            OUTPUT.emit('error', file=post.path, message=post.error)
+        elif post.key_ids:
+            files_with_frontmatter += 1
+        else:
+            files_without_frontmatter += 1
+            files_with_no_keys.append(post.path)
+
+    key_id_counts: List[int] = table.key_counts()
+    key_counts: Dict[str, int] = {table.keys[key_id]: count for key_id, count in enumerate(key_id_counts) if count}
+    unique_keys: Set[str] = set(key_counts)
+
+    for filepath in files_with_no_keys:
+        OUTPUT.emit('no_front_matter', file=filepath)
+    OUTPUT.summary(
+        files=len(files), files_with_front_matter=files_with_frontmatter,
+        files_without_front_matter=files_without_frontmatter, keys=len(unique_keys)
+    )
 
     print("\n" + "=" * 50)
     print(f"{Colors.HEADER}{Colors.BOLD}Key Statistics (Total Files Scanned: {len(files)}):{Colors.ENDC}")
@@ -460,13 +819,14 @@ def list_keys() -> None:
     for key in sorted_keys:
         count: int = key_counts[key]
         print(f"  {Colors.OKGREEN}{key:<{max_key_len}}{Colors.ENDC} ({Colors.BOLD}{Colors.OKCYAN}{count}{Colors.ENDC} files)")
+        OUTPUT.emit('key', key=key, files=count)
 
     print("-" * 50)
 
 
 def list_unique_key_values(target_key: str) -> None:
     """Action: Collects and lists all unique values used by a specific key, sorted alphabetically."""
-    files: List[str] = _get_files()
+    files: List[str] = _get_indexed_files()
     if not files: return
 
     print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.OKBLUE}Listing unique values for key '{target_key}' across {len(files)} file(s).{Colors.ENDC}")
@@ -477,10 +837,10 @@ def list_unique_key_values(target_key: str) -> None:
 
     for filepath in files:
         try:
-            post = frontmatter.load(filepath)
-            if target_key in post.metadata:
+            metadata: Dict[str, Any] = _load_metadata(filepath)
+            if target_key in metadata:
                 found_count += 1
-                value = post.metadata[target_key]
+                value = metadata[target_key]
 
                 # Handle lists (e.g., 'tags') by iterating over items
                 if isinstance(value, list):
@@ -495,6 +855,9 @@ def list_unique_key_values(target_key: str) -> None:
                     value_counts[str_value] = value_counts.get(str_value, 0) + 1
         except Exception as e:
             print(f"{Colors.FAIL}  ❌ ERROR processing {filepath}: {e}{Colors.ENDC}")
+            OUTPUT.emit('error', file=filepath, message=str(e))
+
+    OUTPUT.summary(files=len(files), files_with_key=found_count, values=len(unique_values))
 
     print("\n" + "=" * 50)
     if not unique_values:
@@ -514,27 +877,30 @@ def list_unique_key_values(target_key: str) -> None:
             f" {Colors.OKGREEN}{value:<{max_val_len}}{Colors.ENDC}"
             f" ({Colors.BOLD}{Colors.OKCYAN}{count}{Colors.ENDC} files)"
         )
+        OUTPUT.emit('value', key=target_key, value=value, files=count)
 
     print("-" * 50)
 
 
 def find_key_present(target_key: str) -> None:
     """Action: Find posts that contain a specific key."""
-    files: List[str] = _get_files()
+    files: List[str] = _get_indexed_files()
     if not files: return
 
     print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.OKGREEN}Finding files WITH key '{target_key}' in {len(files)} file(s).{Colors.ENDC}")
 
     found_count: int = 0
-    for filepath in files:
-        try:
-            post = frontmatter.load(filepath)
-            if target_key in post.metadata:
-                print(f"{Colors.OKGREEN}  ✓ Found '{target_key}': {filepath}{Colors.ENDC}")
-                found_count += 1
-        except Exception as e:
-            print(f"{Colors.FAIL}  ❌ ERROR processing {filepath}: {e}{Colors.ENDC}")
-
+    table: PostTable = _get_post_table(files)
+    for post in table.posts:
+        if post.error is not None:
+            print(f"{Colors.FAIL}  ❌ ERROR processing {post.path}: {post.error}{Colors.ENDC}")
+            OUTPUT.emit('error', file=post.path, message=post.error)
+        elif table.has_key(post, target_key):
+            print(f"{Colors.OKGREEN}  ✓ Found '{target_key}': {post.path}{Colors.ENDC}")
+            OUTPUT.emit('match', file=post.path, key=target_key)
+            found_count += 1
+
+    OUTPUT.summary(files=len(files), key=target_key, found=found_count)
     print("-" * 50)
     if found_count == 0:
         print(f"{Colors.WARNING}The key '{target_key}' was NOT found in any file.{Colors.ENDC}")
@@ -544,26 +910,154 @@ def find_key_present(target_key: str) -> None:
 
 def find_missing_key(target_key: str) -> None:
     """Action: Find posts that are missing a specific key."""
-    files: List[str] = _get_files()
+    files: List[str] = _get_indexed_files()
     if not files: return
 
     print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.WARNING}Finding files WITHOUT key '{target_key}' in {len(files)} file(s).{Colors.ENDC}")
 
     missing_count: int = 0
+    table: PostTable = _get_post_table(files)
+    for post in table.posts:
+        if post.error is not None:
+            print(f"{Colors.FAIL}  ❌ ERROR processing {post.path}: {post.error}{Colors.ENDC}")
+            OUTPUT.emit('error', file=post.path, message=post.error)
+        elif not table.has_key(post, target_key):
+            print(f"{Colors.FAIL}  ❌ Missing '{target_key}': {post.path}{Colors.ENDC}")
+            OUTPUT.emit('missing', file=post.path, key=target_key)
+            missing_count += 1
+
+    OUTPUT.summary(files=len(files), key=target_key, missing=missing_count)
+    print("-" * 50)
+    if missing_count == 0:
+        print(f"{Colors.OKGREEN}All files contain the key '{target_key}'.{Colors.ENDC}")
+    else:
+        print(f"{Colors.BOLD}Search completed.{Colors.ENDC} {missing_count} file(s) are missing the key '{target_key}'.")
+
+def query_posts(expression: str, show_keys: List[str]) -> int:
+    """
+    Action: Lists the posts matching a query expression (see blog_corpus/query.py),
+    e.g. "tags contains docker and date >= 2025-01-01 and not image".
+    The corpus is loaded once into a columnar index; conditions use hash and
+    sorted indexes instead of scanning every file. Returns the number of matches.
+    Raises QueryError when the expression is invalid.
+    """
+    # Syntax errors are reported before any file is read
+    node: Node = parse_query(expression)
+
+    files: List[str] = _get_indexed_files()
+    if not files: return 0
+
+    print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.OKBLUE}Querying {len(files)} file(s): {expression}{Colors.ENDC}")
+
+    metadata_by_file: Dict[str, Dict[str, Any]] = {}
     for filepath in files:
         try:
-            post = frontmatter.load(filepath)
-            if target_key not in post.metadata:
-                print(f"{Colors.FAIL}  ❌ Missing '{target_key}': {filepath}{Colors.ENDC}")
-                missing_count += 1
+            metadata_by_file[filepath] = _load_metadata(filepath)
         except Exception as e:
-            print(f"{Colors.FAIL}  ❌ ERROR processing {filepath}: {e}{Colors.ENDC}")
+            print(f"{Colors.FAIL}  ❌ ERROR processing {filepath}: {e}{Colors.ENDC}")
+            OUTPUT.emit('error', file=filepath, message=str(e))
+
+    index: ColumnarIndex = ColumnarIndex(metadata_by_file.items())
+    matches: List[str] = index.select(node)
+
+    for filepath in matches:
+        details: str = ', '.join(
+            f"{key}={metadata_by_file[filepath].get(key)}" for key in show_keys
+        )
+        suffix: str = f" {Colors.OKCYAN}({details}){Colors.ENDC}" if details else ''
+        print(f"{Colors.OKGREEN}  ✓ {filepath}{Colors.ENDC}{suffix}")
+        OUTPUT.emit('match', file=filepath, values={key: metadata_by_file[filepath].get(key) for key in show_keys})
 
+    OUTPUT.summary(files=len(files), query=expression, matches=len(matches))
     print("-" * 50)
-    if missing_count == 0:
-        print(f"{Colors.OKGREEN}All files contain the key '{target_key}'.{Colors.ENDC}")
+    if not matches:
+        print(f"{Colors.WARNING}No file matches the query.{Colors.ENDC}")
     else:
-        print(f"{Colors.BOLD}Search completed.{Colors.ENDC} {missing_count} file(s) are missing the key '{target_key}'.")
+        print(f"{Colors.BOLD}Query completed.{Colors.ENDC} {len(matches)} file(s) match.")
+
+    return len(matches)
+
+def export_sqlite(database_path: str, rebuild: bool = False) -> None:
+    """
+    Action: Exports the front matter of the whole blog to a SQLite database
+    (see blog_corpus/sqlite_export.py for the schema and example queries).
+    The export is incremental: only new or changed files are upserted, rows of
+    deleted files are removed, all in a single transaction.
+    """
+    if not os.path.exists(DOCS_DIR):
+        print(f"{Colors.FAIL}{Colors.BOLD}ERROR: Directory '{DOCS_DIR}' not found.{Colors.ENDC}")
+        OUTPUT.emit('error', message=f"Directory '{DOCS_DIR}' not found.")
+        return
+
+    # The database mirrors the whole blog, whatever --since/--staged selected
+    files: List[str] = _get_all_files()
+    print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.OKBLUE}Exporting {len(files)} file(s) to '{database_path}'.{Colors.ENDC}")
+
+    connection = connect(database_path, rebuild=rebuild)
+    try:
+        signatures: Dict[str, Tuple[int, int]] = {filepath: file_signature(filepath) for filepath in files}
+        to_upsert, to_delete = plan_export(connection, signatures)
+
+        # Changed files are parsed through the front matter index (cached, spread over JOBS)
+        _get_indexed_files(to_upsert)
+        upserted, deleted = apply_export(
+            connection,
+            ((filepath, signatures[filepath], _get_record(filepath)) for filepath in to_upsert),
+            to_delete
+        )
+    finally:
+        connection.close()
+
+    OUTPUT.summary(files=len(files), database=database_path, upserted=upserted, deleted=deleted, unchanged=len(files) - upserted)
+    print("-" * 50)
+    print(
+        f"{Colors.BOLD}Export completed.{Colors.ENDC} "
+        f"{Colors.OKGREEN}{upserted} upserted{Colors.ENDC}, "
+        f"{Colors.FAIL}{deleted} deleted{Colors.ENDC}, "
+        f"{len(files) - upserted} unchanged."
+    )
+
+def export_records() -> None:
+    """
+    Action: Writes the front matter of the whole blog as records (export --format ndjson|json),
+    one {"type": "post", "file": ..., "metadata": {...}} per file, served from the front matter index.
+    """
+    if not os.path.exists(DOCS_DIR):
+        print(f"{Colors.FAIL}{Colors.BOLD}ERROR: Directory '{DOCS_DIR}' not found.{Colors.ENDC}")
+        OUTPUT.emit('error', message=f"Directory '{DOCS_DIR}' not found.")
+        return
+
+    # Like the SQLite export, the whole blog, whatever --since/--staged selected
+    files: List[str] = _get_indexed_files(_get_all_files())
+    print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.OKBLUE}Exporting {len(files)} file(s) as {OUTPUT.format}.{Colors.ENDC}")
+
+    exported: int = 0
+    for filepath in files:
+        record: PostRecord = _get_record(filepath)
+        if record.error is not None:
+            print(f"{Colors.FAIL}  ❌ ERROR processing {filepath}: {record.error}{Colors.ENDC}")
+            OUTPUT.emit('error', file=filepath, message=record.error)
+            continue
+        OUTPUT.emit('post', file=filepath, metadata=record.metadata)
+        exported += 1
+
+    OUTPUT.summary(files=len(files), exported=exported)
+    print("-" * 50)
+    print(f"{Colors.BOLD}Export completed.{Colors.ENDC} {exported} file(s) exported.")
+
+def _add_key_file(target_key: str, value: Any, filepath: str) -> FileResult:
+    """Worker: adds `target_key` to one file when it is missing (see add_missing_key)."""
+    try:
+        text: str = _read_text(filepath)
+        post = _parse_text(filepath, text)
+        if target_key not in post.metadata:
+            post.metadata[target_key] = value
+            _write_patched_file(filepath, text, post, lambda patch: patch.set(target_key, value, sort_key=_key_rank))
+            return FileResult(filepath, True, (('success', f"✓ Added '{target_key}' in: {filepath}"),))
+    except Exception as e:
+        return FileResult(filepath, error=str(e))
+
+    return FileResult(filepath)
 
 def add_missing_key(target_key: str, default_value_str: str) -> None:
     """Action: Add a key with a default value to files that are missing it."""
@@ -574,21 +1068,26 @@ def add_missing_key(target_key: str, default_value_str: str) -> None:
 
     print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.OKBLUE}Adding key '{target_key}' with value '{value}' to missing files ({len(files)} file(s)).{Colors.ENDC}")
 
-    changes_made: int = 0
-    for filepath in files:
-        try:
-            post = frontmatter.load(filepath)
-            if target_key not in post.metadata:
-                post.metadata[target_key] = value
-                _write_file(filepath, post.metadata, post.content)
-                print(f"{Colors.OKGREEN}  ✓ Added '{target_key}' in: {filepath}{Colors.ENDC}")
-                changes_made += 1
-        except Exception as e:
-            print(f"{Colors.FAIL}  ❌ ERROR processing {filepath}: {e}{Colors.ENDC}")
+    changes_made: int = _run_file_workers(partial(_add_key_file, target_key, value), files)
+    OUTPUT.summary(files=len(files), modified=changes_made)
 
     print("-" * 50)
     print(f"{Colors.BOLD}Operation completed.{Colors.ENDC} {changes_made} file(s) modified.")
 
+def _remove_key_file(target_key: str, filepath: str) -> FileResult:
+    """Worker: removes `target_key` from one file when present (see remove_key)."""
+    try:
+        text: str = _read_text(filepath)
+        post = _parse_text(filepath, text)
+        if target_key in post.metadata:
+            del post.metadata[target_key]
+            _write_patched_file(filepath, text, post, lambda patch: patch.remove(target_key))
+            return FileResult(filepath, True, (('success', f"✓ Removed '{target_key}' from: {filepath}"),))
+    except Exception as e:
+        return FileResult(filepath, error=str(e))
+
+    return FileResult(filepath)
+
 def remove_key(target_key: str) -> None:
     """Action: Remove a key from the front matter of all files that contain it."""
     files: List[str] = _get_files()
@@ -596,21 +1095,57 @@ def remove_key(target_key: str) -> None:
 
     print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.FAIL}Removing key '{target_key}' from front matter in {len(files)} file(s).{Colors.ENDC}")
 
-    changes_made: int = 0
-    for filepath in files:
-        try:
-            post = frontmatter.load(filepath)
-            if target_key in post.metadata:
-                del post.metadata[target_key]
-                _write_file(filepath, post.metadata, post.content)
-                print(f"{Colors.OKGREEN}  ✓ Removed '{target_key}' from: {filepath}{Colors.ENDC}")
-                changes_made += 1
-        except Exception as e:
-            print(f"{Colors.FAIL}  ❌ ERROR processing {filepath}: {e}{Colors.ENDC}")
+    changes_made: int = _run_file_workers(partial(_remove_key_file, target_key), files)
+    OUTPUT.summary(files=len(files), modified=changes_made)
 
     print("-" * 50)
     print(f"{Colors.BOLD}Operation completed.{Colors.ENDC} {changes_made} file(s) modified.")
 
+def _cleanup_variants_file(target_key: str, variants_to_remove: List[str], filepath: str) -> FileResult:
+    """Worker: folds the variants of `target_key` in one file (see cleanup_key_variants)."""
+    messages: List[Tuple[str, str]] = []
+    try:
+        text: str = _read_text(filepath)
+        post = _parse_text(filepath, text)
+        metadata: Dict[str, Any] = post.metadata
+        is_modified: bool = False
+        original_value: Optional[Any] = metadata.get(target_key)
+        final_value: Optional[Any] = original_value
+
+        for variant in variants_to_remove:
+            if variant in metadata:
+                variant_value: Any = metadata[variant]
+
+                # 1. If the target key has no value, take the variant's value
+                if final_value is None:
+                    final_value = variant_value
+                    messages.append(('info', f"→ Moved value from '{variant}' to '{target_key}' in: {filepath}"))
+
+                # 2. Delete the variant
+                del metadata[variant]
+                is_modified = True
+                messages.append(('removed', f"✗ Removed variant '{variant}' from: {filepath}"))
+
+        # 3. Apply the final, standardized value to the target key
+        if is_modified:
+            # Ensure the target key exists with the final value if we found one
+            if final_value is not None:
+                metadata[target_key] = final_value
+
+            def edit(patch: FrontMatterPatch) -> None:
+                for variant in variants_to_remove:
+                    patch.remove(variant)
+                # The target key line is only (re)written when it received a variant's value
+                if original_value is None and final_value is not None:
+                    patch.set(target_key, final_value, sort_key=_key_rank)
+
+            _write_patched_file(filepath, text, post, edit)
+
+        return FileResult(filepath, is_modified, tuple(messages))
+
+    except Exception as e:
+        return FileResult(filepath, False, tuple(messages), str(e))
+
 def cleanup_key_variants(target_key: str, variants_to_remove: List[str]) -> None:
     """Action: Standardize a key by deleting variants and moving their value to the target key."""
     files: List[str] = _get_files()
@@ -618,42 +1153,212 @@ def cleanup_key_variants(target_key: str, variants_to_remove: List[str]) -> None
 
     print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.WARNING}Cleanup and standardization of key '{target_key}' and variants in {len(files)} file(s).{Colors.ENDC}")
 
-    changes_made: int = 0
-    for filepath in files:
+    changes_made: int = _run_file_workers(partial(_cleanup_variants_file, target_key, variants_to_remove), files)
+    OUTPUT.summary(files=len(files), modified=changes_made)
+
+    print("-" * 50)
+    print(f"{Colors.BOLD}Operation completed.{Colors.ENDC} {changes_made} file(s) modified (variants cleaned).")
+
+def _path_date(filepath: str) -> Optional[datetime.date]:
+    """The date encoded in the DOCS_DIR/YYYY/MM/DD/ path of a post, None when there is none (or it is invalid)."""
+    relative_path: str = os.path.relpath(filepath, DOCS_DIR).replace(os.sep, '/')
+    match: Optional[re.Match[str]] = DATE_PATH_PATTERN.match(relative_path)
+    if match is None:
+        return None
+    try:
+        return datetime.date(*(int(part) for part in match.groups()))
+    except ValueError:
+        return None
+
+def _as_date(value: Any) -> Optional[datetime.date]:
+    """The calendar date of a front matter value (date, datetime or 'YYYY-MM-DD...' string), None if it isn't one."""
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    if isinstance(value, str):
         try:
-            post = frontmatter.load(filepath)
-            metadata: Dict[str, Any] = post.metadata
-            is_modified: bool = False
-            final_value: Optional[Any] = metadata.get(target_key)
-
-            for variant in variants_to_remove:
-                if variant in metadata:
-                    variant_value: Any = metadata[variant]
-
-                    # 1. If the target key has no value, take the variant's value
-                    if final_value is None:
-                        final_value = variant_value
-                        print(f"{Colors.OKCYAN}  → Moved value from '{variant}' to '{target_key}' in: {filepath}{Colors.ENDC}")
-
-                    # 2. Delete the variant
-                    del metadata[variant]
-                    is_modified = True
-                    print(f"{Colors.FAIL}  ✗ Removed variant '{variant}' from: {filepath}{Colors.ENDC}")
-
-            # 3. Apply the final, standardized value to the target key
-            if is_modified:
-                # Ensure the target key exists with the final value if we found one
-                if final_value is not None:
-                    metadata[target_key] = final_value
-
-                _write_file(filepath, metadata, post.content)
-                changes_made += 1
+            return datetime.date.fromisoformat(value.strip()[:10])
+        except ValueError:
+            return None
+    return None
 
-        except Exception as e:
-            print(f"{Colors.FAIL}  ❌ ERROR processing {filepath}: {e}{Colors.ENDC}")
+def _sync_date_file(overwrite: bool, filepath: str) -> FileResult:
+    """Worker: writes the path date in the 'date' key of one file, touching only that line (see sync_dates)."""
+    try:
+        expected: Optional[datetime.date] = _path_date(filepath)
+        text: str = _read_text(filepath)
+        post = _parse_text(filepath, text)
+        current: Any = post.metadata.get(DATE_KEY)
+        if expected is not None and (current is None or (overwrite and _as_date(current) != expected)):
+            post.metadata[DATE_KEY] = expected
+            _write_patched_file(filepath, text, post, lambda patch: patch.set(DATE_KEY, expected, sort_key=_key_rank))
+            if current is None:
+                message: str = f"✓ Added '{DATE_KEY}: {expected}' in: {filepath}"
+            else:
+                message = f"✓ Replaced '{DATE_KEY}: {current}' by {expected} in: {filepath}"
+            return FileResult(filepath, True, (('success', message),))
+    except Exception as e:
+        return FileResult(filepath, error=str(e))
+
+    return FileResult(filepath)
+
+def sync_dates(overwrite: bool = False, check_only: bool = False) -> int:
+    """
+    Action: Makes the 'date' key of each post match the YYYY/MM/DD folders of its path.
+    Missing dates are inserted; mismatching dates are reported, and only replaced with
+    `overwrite`. The dates are compared on the front matter index, so only the files
+    to update are read again and written (a single line is inserted or replaced).
+    With `check_only`, nothing is written.
+    Returns the number of missing or mismatching dates left in the files.
+    """
+    files: List[str] = _get_indexed_files()
+    if not files: return 0
+
+    mode: str = " (check only)" if check_only else ""
+    print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.OKCYAN}Syncing '{DATE_KEY}' with the YYYY/MM/DD path of {len(files)} file(s){mode}.{Colors.ENDC}")
+
+    to_write: List[str] = []
+    missing: int = 0
+    mismatches: int = 0
+    undated: int = 0
+    for filepath in files:
+        expected: Optional[datetime.date] = _path_date(filepath)
+        if expected is None:
+            undated += 1
+            continue
+
+        record: PostRecord = _get_record(filepath)
+        if record.error is not None:
+            print(f"{Colors.FAIL}  ❌ ERROR processing {filepath}: {record.error}{Colors.ENDC}")
+            OUTPUT.emit('error', file=filepath, message=record.error)
+            continue
+
+        current: Any = record.metadata.get(DATE_KEY)
+        if current is None:
+            missing += 1
+            to_write.append(filepath)
+            if check_only:
+                print(f"{Colors.WARNING}  ⚠️ Missing '{DATE_KEY}' (expected {expected}) in: {filepath}{Colors.ENDC}")
+                OUTPUT.emit('issue', file=filepath, check='date', message=f"Missing '{DATE_KEY}'", expected=expected)
+        elif _as_date(current) != expected:
+            mismatches += 1
+            print(f"{Colors.FAIL}  ❌ '{DATE_KEY}: {current}' doesn't match the path date {expected} in: {filepath}{Colors.ENDC}")
+            OUTPUT.emit(
+                'issue', file=filepath, check='date',
+                message=f"'{DATE_KEY}' doesn't match the path date", current=current, expected=expected
+            )
+            if overwrite:
+                to_write.append(filepath)
+
+    changes_made: int = 0
+    if not check_only:
+        changes_made = _run_file_workers(partial(_sync_date_file, overwrite), to_write)
+    OUTPUT.summary(files=len(files), missing=missing, mismatching=mismatches, undated=undated, modified=changes_made)
 
     print("-" * 50)
-    print(f"{Colors.BOLD}Operation completed.{Colors.ENDC} {changes_made} file(s) modified (variants cleaned).")
+    if undated:
+        print(f"{Colors.OKCYAN}{undated} file(s) skipped: no YYYY/MM/DD folders in their path.{Colors.ENDC}")
+    print(f"{Colors.BOLD}Date sync completed.{Colors.ENDC} {missing} missing, {mismatches} mismatching date(s); {changes_made} file(s) modified.")
+    if mismatches and not overwrite:
+        print(f"{Colors.WARNING}Use --overwrite to replace the mismatching dates by the path date.{Colors.ENDC}")
+
+    if check_only:
+        return missing + mismatches
+    return 0 if overwrite else mismatches
+
+def _apply_plan_file(plan: EditPlan, filepath: str) -> Tuple[FileResult, List[int]]:
+    """Worker: runs every operation of a plan on one file, with one read and at most one write (see apply_plan)."""
+    try:
+        text: str = _read_text(filepath)
+        post = _parse_text(filepath, text)
+        with PROFILER.phase('check', filepath):
+            metadata, applied = plan.transform(post.metadata)
+        if applied:
+            edit: Callable[[FrontMatterPatch], None] = header_edit(post.metadata, metadata, sort_key=_key_rank)
+            post.metadata = metadata
+            _write_patched_file(filepath, text, post, edit)
+            names: str = ', '.join(plan.operations[index].name for index in applied)
+            return FileResult(filepath, True, (('success', f"✓ Applied {names} in: {filepath}"),)), applied
+    except Exception as e:
+        return FileResult(filepath, error=str(e)), []
+
+    return FileResult(filepath), []
+
+def _plan_summary(plan: EditPlan, affected: List[int]) -> List[Dict[str, Any]]:
+    """The number of files affected by each operation of a plan, for the summary record."""
+    return [
+        {'operation': operation.describe(), 'files': count}
+        for operation, count in zip(plan.operations, affected)
+    ]
+
+def _print_plan_summary(plan: EditPlan, affected: List[int], verb: str) -> None:
+    """Prints the number of files affected by each operation of a plan."""
+    print(f"{Colors.HEADER}{Colors.BOLD}Files {verb} per operation:{Colors.ENDC}")
+    descriptions: List[str] = [operation.describe() for operation in plan.operations]
+    max_len: int = max(len(description) for description in descriptions)
+    for position, (description, count) in enumerate(zip(descriptions, affected), 1):
+        color: str = Colors.OKGREEN if count else Colors.OKCYAN
+        print(f"  {position:>2}. {description:<{max_len}} {color}{count}{Colors.ENDC} file(s)")
+
+def apply_plan(plan: EditPlan, dry_run: bool = False) -> None:
+    """
+    Action: Applies an edit plan (an ordered list of add/default/rename/remove/lowercase
+    operations) in a single pass: each post is read once and written at most once.
+    The plan is first evaluated on the front matter index, so only the posts it changes
+    are opened again; with dry_run, nothing is written and only the summary is printed.
+    """
+    files: List[str] = _get_indexed_files()
+    if not files: return
+
+    mode: str = " (dry run)" if dry_run else ""
+    print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.WARNING}Applying a plan of {len(plan.operations)} operation(s) to {len(files)} file(s){mode}.{Colors.ENDC}")
+
+    affected: List[int] = [0] * len(plan.operations)
+    candidates: List[str] = []
+    unreadable: List[str] = []
+    for filepath in files:
+        record: PostRecord = _get_record(filepath)
+        if record.error is not None:
+            unreadable.append(filepath)
+            continue
+        with PROFILER.phase('check', filepath):
+            _, applied = plan.transform(record.metadata)
+        if applied:
+            candidates.append(filepath)
+            for index in applied:
+                affected[index] += 1
+            if dry_run:
+                OUTPUT.emit('change', file=filepath, operations=[plan.operations[index].describe() for index in applied], dry_run=True)
+
+    if dry_run:
+        OUTPUT.summary(files=len(files), would_modify=len(candidates), operations=_plan_summary(plan, affected))
+        for filepath in unreadable:
+            error: Optional[str] = _get_record(filepath).error
+            print(f"{Colors.FAIL}  ❌ ERROR processing {filepath}: {error}{Colors.ENDC}")
+            OUTPUT.emit('error', file=filepath, message=error)
+        print("-" * 50)
+        _print_plan_summary(plan, affected, "that would change")
+        print("-" * 50)
+        print(f"{Colors.BOLD}Dry run completed.{Colors.ENDC} {len(candidates)} file(s) would be modified.")
+        return
+
+    # Counted again from the files themselves: they are what was actually written
+    affected = [0] * len(plan.operations)
+    changes_made: int = 0
+    # Unreadable files go through the worker too, which reports their error
+    for result, applied in _map_files(partial(_apply_plan_file, plan), sorted(candidates + unreadable)):
+        _print_file_result(result)
+        if result.changed:
+            changes_made += 1
+        for index in applied:
+            affected[index] += 1
+
+    OUTPUT.summary(files=len(files), modified=changes_made, operations=_plan_summary(plan, affected))
+    print("-" * 50)
+    _print_plan_summary(plan, affected, "changed")
+    print("-" * 50)
+    print(f"{Colors.BOLD}Operation completed.{Colors.ENDC} {changes_made} file(s) modified.")
 
 def _find_literal_duplicates(files: List[str]) -> Tuple[bool, int]:
     """Finds case-insensitive literal key duplicates in YAML block (e.g., 'date' and 'Date')."""
@@ -663,23 +1368,14 @@ def _find_literal_duplicates(files: List[str]) -> Tuple[bool, int]:
 
     for filepath in files:
         _, original_keys = _normalize_key_data(filepath)
-        key_variants: Dict[str, List[str]] = {}
-
-        for key_part in original_keys:
-            normalized_key: str = key_part.lower()
-            key_variants.setdefault(normalized_key, []).append(key_part)
-
-        conflicts: Dict[str, List[str]] = {}
-        for normalized_key, originals in key_variants.items():
-            # Conflict if multiple *unique* original keys normalize to the same key.
-            unique_originals: List[str] = list(set(originals))
-            if len(unique_originals) > 1:
-                conflicts[normalized_key] = unique_originals
+        with PROFILER.phase('check', filepath):
+            conflicts: List[str] = _literal_duplicate_issues(original_keys)
 
         if conflicts:
-            print(f"{Colors.FAIL}  ❌ Literal key duplicates found in: {filepath}{Colors.ENDC}")
-            for normalized, variants in conflicts.items():
-                print(f"      Conflict Key '{normalized}': Variants found: {', '.join(variants)}")
+            print(f"{Colors.FAIL}  ❌ Literal key duplicates found in: {filepath}{Colors.ENDC}")
+            for conflict in conflicts:
+                print(f"      {conflict}")
+                OUTPUT.emit('issue', file=filepath, check='literal-duplicates', message=conflict)
             total_duplicate_files += 1
             all_pass = False
 
@@ -696,27 +1392,16 @@ def _find_conceptual_duplicates(files: List[str]) -> Tuple[bool, int]:
 
     for filepath in files:
         normalized_keys, _ = _normalize_key_data(filepath)
-        conflicts_found: bool = False
-
-        for normalized_group_key, valid_variants in CONCEPTUAL_DUPLICATE_GROUPS.items():
-            # Check if multiple normalized keys from the group exist in the file
-            present_variants: List[str] = [
-                variant for variant in valid_variants
-                if variant.lower() in normalized_keys
-            ]
-
-            # If two or more variants from the same conceptual group are present, it's a conflict
-            if len(present_variants) > 1:
-                if not conflicts_found:
-                    print(f"{Colors.FAIL}  ❌ Conceptual duplicates found in: {filepath}{Colors.ENDC}")
-                    conflicts_found = True
-                    all_pass = False
-
-                print(f"      Conflict Group: {', '.join(valid_variants)}")
-                print(f"      Found Keys: {', '.join(present_variants)}")
-
-        if conflicts_found:
+        with PROFILER.phase('check', filepath):
+            conflicts: List[str] = _conceptual_duplicate_issues(normalized_keys)
+
+        if conflicts:
+            print(f"{Colors.FAIL}  ❌ Conceptual duplicates found in: {filepath}{Colors.ENDC}")
+            for conflict in conflicts:
+                print(f"      {conflict}")
+                OUTPUT.emit('issue', file=filepath, check='conceptual-duplicates', message=conflict)
             total_duplicate_files += 1
+            all_pass = False
 
     if all_pass:
         print(f"{Colors.OKGREEN}All files pass the conceptual duplicate check.{Colors.ENDC}")
@@ -724,7 +1409,7 @@ def _find_conceptual_duplicates(files: List[str]) -> Tuple[bool, int]:
 
 def check_duplicates() -> None:
     """Action: Checks for both literal (case-insensitive) and conceptual (misspelling) duplicates."""
-    files: List[str] = _get_files()
+    files: List[str] = _get_indexed_files()
     if not files: return
 
     print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.OKBLUE}Running comprehensive duplicate key check on {len(files)} file(s).{Colors.ENDC}")
@@ -736,10 +1421,278 @@ def check_duplicates() -> None:
     _, conceptual_files = _find_conceptual_duplicates(files)
 
     total_conflicts: int = literal_files + conceptual_files
+    OUTPUT.summary(files=len(files), literal_duplicates=literal_files, conceptual_duplicates=conceptual_files)
 
     print("-" * 50)
     print(f"{Colors.BOLD}Check completed.{Colors.ENDC} {total_conflicts} file(s) contain key conflicts (literal or conceptual).")
 
+def check_all() -> int:
+    """
+    Action: Runs every registered check (RECORD_CHECKS) in a single pass over the files.
+    Each file is read and parsed once; all checks share the same parsed record.
+    Returns the number of files with at least one issue.
+    """
+    files: List[str] = _get_indexed_files()
+    if not files: return 0
+
+    check_names: List[str] = [check.name for check in RECORD_CHECKS]
+    print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.OKCYAN}Running all checks ({', '.join(check_names)}) on {len(files)} file(s).{Colors.ENDC}")
+
+    files_per_check: Dict[str, int] = {name: 0 for name in ['parse'] + check_names}
+    total_issues: int = 0
+
+    for filepath in files:
+        report: List[Tuple[str, str]] = _record_report(filepath)
+
+        # --- Reporting ---
+        if report:
+            _print_record_report(filepath, report)
+            for check_name in {check_name for check_name, _ in report}:
+                files_per_check[check_name] += 1
+            total_issues += 1
+
+    OUTPUT.summary(files=len(files), files_with_issues=total_issues, files_per_check=files_per_check)
+    print("-" * 50)
+    print(f"{Colors.HEADER}{Colors.BOLD}Summary per check:{Colors.ENDC}")
+    max_name_len: int = max(len(name) for name in files_per_check)
+    for name, count in files_per_check.items():
+        color: str = Colors.OKGREEN if count == 0 else Colors.FAIL
+        print(f"  {name:<{max_name_len}} {color}{count}{Colors.ENDC} file(s)")
+
+    print("-" * 50)
+    if total_issues == 0:
+        print(f"{Colors.OKGREEN}{Colors.BOLD}All checks completed.{Colors.ENDC} All {len(files)} file(s) passed all checks.")
+    else:
+        print(f"{Colors.FAIL}{Colors.BOLD}All checks completed with errors.{Colors.ENDC} {total_issues} file(s) have issues.")
+
+    return total_issues
+
+def _print_unique_group(message: str, files: List[str], is_warning: bool) -> None:
+    """Prints one group of posts sharing a (near-)identical value."""
+    if is_warning:
+        # Shared on purpose most of the time: one line is enough
+        print(f"{Colors.WARNING}  ⚠️ {message} in {len(files)} file(s).{Colors.ENDC}")
+        return
+    print(f"{Colors.FAIL}  ❌ {message} in {len(files)} file(s):{Colors.ENDC}")
+    for filepath in files:
+        print(f"      - {filepath}")
+
+def check_unique(threshold: float = NEAR_DUPLICATE_THRESHOLD) -> int:
+    """
+    Action: Reports the posts sharing a value of UNIQUE_CHECK_KEYS, and the near-duplicate
+    values of NEAR_DUPLICATE_KEYS (similarity >= threshold, 0 to skip).
+    One hash index per key and MinHash/LSH buckets: no pair of posts is compared blindly.
+    With --since/--staged, the changed posts are compared to the whole blog.
+    Returns the number of groups found (warnings excluded).
+    """
+    if CHANGED_FILES is not None and not _get_files():
+        return 0
+    files: List[str] = _get_indexed_files(_get_all_files())
+    if not files: return 0
+
+    print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.OKCYAN}Checking unique values ({', '.join(UNIQUE_CHECK_KEYS)}) across {len(files)} file(s).{Colors.ENDC}")
+
+    records: List[Tuple[str, Dict[str, Any]]] = []
+    for filepath in files:
+        record: PostRecord = _get_record(filepath)
+        if record.error is None:
+            records.append((filepath, record.metadata))
+
+    with PROFILER.phase('check'):
+        collisions: List[Collision] = find_collisions(records, UNIQUE_CHECK_KEYS)
+        near_groups: List[NearDuplicateGroup] = []
+        if threshold > 0:
+            for key in NEAR_DUPLICATE_KEYS:
+                near_groups += find_near_duplicates(
+                    ((filepath, metadata.get(key)) for filepath, metadata in records), key, threshold
+                )
+
+    # Incremental mode: only the groups involving a changed post
+    if CHANGED_FILES is not None:
+        changed: Set[str] = set(CHANGED_FILES)
+        collisions = [group for group in collisions if changed.intersection(group.files)]
+        near_groups = [group for group in near_groups if changed.intersection(group.files)]
+
+    groups_per_key: Dict[str, int] = {key: 0 for key in UNIQUE_CHECK_KEYS}
+    total_groups: int = 0
+
+    for collision in collisions:
+        is_warning: bool = collision.key in UNIQUE_WARNING_KEYS
+        _print_unique_group(f"Key '{collision.key}' value '{collision.value}' shared", collision.files, is_warning)
+        OUTPUT.emit(
+            'duplicate', key=collision.key, value=collision.value, files=collision.files,
+            severity='warning' if is_warning else 'error'
+        )
+        groups_per_key[collision.key] += 1
+        total_groups += 0 if is_warning else 1
+
+    if threshold > 0:
+        print(f"\nSub-Operation: Checking for near-duplicates ({', '.join(NEAR_DUPLICATE_KEYS)}, similarity >= {threshold:.0%}).")
+        for group in near_groups:
+            _print_unique_group(f"Near-duplicate '{group.key}' ({group.similarity:.0%} similar)", group.files, False)
+            OUTPUT.emit('near_duplicate', key=group.key, similarity=round(group.similarity, 4), files=group.files, severity='error')
+            groups_per_key[f"{group.key} (near)"] = groups_per_key.get(f"{group.key} (near)", 0) + 1
+            total_groups += 1
+        for key in NEAR_DUPLICATE_KEYS:
+            groups_per_key.setdefault(f"{key} (near)", 0)
+
+    OUTPUT.summary(files=len(files), groups=total_groups, groups_per_key=groups_per_key)
+    print("-" * 50)
+    print(f"{Colors.HEADER}{Colors.BOLD}Summary per key:{Colors.ENDC}")
+    max_name_len: int = max(len(name) for name in groups_per_key)
+    for name, count in groups_per_key.items():
+        color: str = Colors.OKGREEN if count == 0 else (Colors.WARNING if name in UNIQUE_WARNING_KEYS else Colors.FAIL)
+        print(f"  {name:<{max_name_len}} {color}{count}{Colors.ENDC} group(s)")
+
+    print("-" * 50)
+    if total_groups == 0:
+        print(f"{Colors.OKGREEN}{Colors.BOLD}Uniqueness Check completed.{Colors.ENDC} No duplicated value found.")
+    else:
+        print(f"{Colors.FAIL}{Colors.BOLD}Uniqueness Check completed with errors.{Colors.ENDC} {total_groups} group(s) of posts share a value.")
+
+    return total_groups
+
+# ----------------------------------------------------------------------
+# Watch Mode
+# ----------------------------------------------------------------------
+
+class WatchState:
+    """
+    In-memory view of the corpus kept up to date by the 'watch' action.
+    Parsed records live in the front matter index; this class only tracks the
+    values of UNIQUE_KEYS so cross-file checks never need a rescan.
+    """
+
+    def __init__(self) -> None:
+        # filepath -> its (key, value) pairs for UNIQUE_KEYS
+        self.unique_values: Dict[str, List[Tuple[str, str]]] = {}
+        # (key, value) -> files using it
+        self.owners: Dict[Tuple[str, str], Set[str]] = {}
+
+    def _values_of(self, filepath: str) -> List[Tuple[str, str]]:
+        """Returns the (key, value) pairs of UNIQUE_KEYS found in a file (none if unreadable)."""
+        try:
+            metadata: Dict[str, Any] = _load_metadata(filepath)
+        except Exception:
+            return []
+        return [
+            (key, str(metadata[key])) for key in UNIQUE_KEYS
+            if metadata.get(key) not in (None, '')
+        ]
+
+    def update(self, filepath: str) -> Set[str]:
+        """
+        Re-reads one file (or forgets it when deleted).
+        Returns the file itself plus the files sharing a unique value with it,
+        before or after the change: their cross-file results may have changed too.
+        """
+        affected: Set[str] = {filepath}
+
+        for value in self.unique_values.pop(filepath, []):
+            owners: Set[str] = self.owners.get(value, set())
+            owners.discard(filepath)
+            affected |= owners
+            if not owners:
+                self.owners.pop(value, None)
+
+        if not os.path.isfile(filepath):
+            _get_corpus().discard(filepath)
+            return affected
+
+        values: List[Tuple[str, str]] = self._values_of(filepath)
+        self.unique_values[filepath] = values
+        for value in values:
+            owners = self.owners.setdefault(value, set())
+            affected |= owners
+            owners.add(filepath)
+
+        return affected
+
+    def apply(self, changed_paths: Set[str]) -> List[str]:
+        """Applies a batch of changes from the watcher; returns the sorted files to report."""
+        affected: Set[str] = set()
+
+        for path in changed_paths:
+            if os.path.isfile(path):
+                affected |= self.update(path)
+                continue
+            # Deleted file, or a folder moved away/deleted: forget what was below it
+            prefix: str = path.rstrip(os.sep) + os.sep
+            for filepath in [f for f in self.unique_values if f == path or f.startswith(prefix)]:
+                affected |= self.update(filepath)
+
+        return sorted(affected)
+
+    def unique_issues(self, filepath: str) -> List[str]:
+        """Cross-file check: values of UNIQUE_KEYS also used by other files."""
+        issues_found: List[str] = []
+        for key, value in self.unique_values.get(filepath, []):
+            others: List[str] = sorted(self.owners[(key, value)] - {filepath})
+            if others:
+                issues_found.append(f"Key '{key}' value '{value}' is also used by: {', '.join(others)}")
+        return issues_found
+
+def _report_watched_file(state: WatchState, filepath: str) -> bool:
+    """Prints the up-to-date check results of one file; returns True when it has issues."""
+    if not os.path.isfile(filepath):
+        print(f"{Colors.OKCYAN}  🗑️  Removed: {filepath}{Colors.ENDC}")
+        OUTPUT.emit('removed', file=filepath)
+        return False
+
+    report: List[Tuple[str, str]] = _record_report(filepath)
+    report += [('unique', issue) for issue in state.unique_issues(filepath)]
+
+    if report:
+        _print_record_report(filepath, report)
+    else:
+        print(f"{Colors.OKGREEN}  ✅ {filepath}: all checks passed.{Colors.ENDC}")
+        OUTPUT.emit('passed', file=filepath)
+    return bool(report)
+
+def watch(interval: float = POLL_INTERVAL_SECONDS, polling: bool = False) -> None:
+    """
+    Action: Keeps the corpus in memory and re-validates the files as they are saved.
+    Only the changed files (and the files sharing a unique value with them) are
+    checked again, so feedback is immediate instead of a full rescan.
+    """
+    if not os.path.exists(DOCS_DIR):
+        print(f"{Colors.FAIL}{Colors.BOLD}ERROR: Directory '{DOCS_DIR}' not found.{Colors.ENDC}")
+        OUTPUT.emit('error', message=f"Directory '{DOCS_DIR}' not found.")
+        return
+
+    # The whole blog is watched, whatever --since/--staged selected
+    files: List[str] = _get_indexed_files(_get_all_files())
+
+    state: WatchState = WatchState()
+    for filepath in files:
+        state.update(filepath)
+
+    issues: int = sum(
+        1 for filepath in files
+        if _record_report(filepath) or state.unique_issues(filepath)
+    )
+    # Persist the warm index now: the watcher only stops on Ctrl+C
+    _get_corpus().save()
+
+    watcher = create_watcher(DOCS_DIR, interval=interval, polling=polling)
+    print(f"{Colors.BOLD}Operation:{Colors.ENDC} {Colors.OKCYAN}Watching {len(files)} file(s) in '{DOCS_DIR}/' ({watcher.name}).{Colors.ENDC}")
+    OUTPUT.summary(files=len(files), files_with_issues_at_start=issues)
+    color: str = Colors.OKGREEN if issues == 0 else Colors.WARNING
+    print(f"{color}{issues} file(s) currently have issues (run 'check-all' for details). Press Ctrl+C to stop.{Colors.ENDC}")
+
+    try:
+        for changed_paths in watcher.batches():
+            start: float = time.perf_counter()
+            for filepath in state.apply(changed_paths):
+                _report_watched_file(state, filepath)
+            elapsed_ms: float = (time.perf_counter() - start) * 1000
+            print(f"{Colors.OKBLUE}  ({len(changed_paths)} change(s) checked in {elapsed_ms:.1f} ms){Colors.ENDC}")
+            OUTPUT.emit('batch', changes=len(changed_paths), elapsed_ms=round(elapsed_ms, 1))
+    except KeyboardInterrupt:
+        print(f"\n{Colors.OKCYAN}Watch stopped.{Colors.ENDC}")
+    finally:
+        watcher.close()
+
 # ----------------------------------------------------------------------
 # Argparse Configuration and Main Execution
 # ----------------------------------------------------------------------
@@ -758,12 +1711,55 @@ class SortedHelpFormatter(argparse.RawTextHelpFormatter):
 
 def main() -> None:
     """Main execution function for the script."""
+
     parser = argparse.ArgumentParser(
         description=f"{Colors.BOLD}{Colors.OKCYAN}YAML Manager Tool{Colors.ENDC} for Front Matter key management (path: {DOCS_DIR}).",
         epilog="Use 'python yaml_manager.py <action> -h' for action-specific help.",
         formatter_class=SortedHelpFormatter
     )
 
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=JOBS,
+        metavar="N",
+        help=f"Number of worker processes for per-file work (default: {JOBS}, the number of cores)."
+    )
+    selection = parser.add_mutually_exclusive_group()
+    selection.add_argument(
+        "--since",
+        metavar="REF",
+        help="Only process the .md/.mdx files changed between git REF and the working tree (e.g. origin/main)."
+    )
+    selection.add_argument(
+        "--staged",
+        action="store_true",
+        help="Only process the .md/.mdx files staged for the next commit (pre-commit hook)."
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Ignore the persistent front matter index ({INDEX_PATH}) and parse every file."
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print the time spent per phase (discover, read, parse, check, dump, write...) and the slowest files.\n"
+             "Per-file work then runs in a single process so that every phase is measured."
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=10,
+        metavar="N",
+        help="Number of slowest files listed by --profile (default: 10)."
+    )
+    parser.add_argument(
+        "--profile-dump",
+        metavar="FILE",
+        help="Also run cProfile and save its statistics to FILE (implies --profile; open with 'python -m pstats FILE')."
+    )
+
     # Define subparsers and actions
     subparsers = parser.add_subparsers(dest="action", help="Available actions.")
 
@@ -780,18 +1776,63 @@ def main() -> None:
              "Omit the value to create an empty key (e.g., 'blueskyRecordKey')."
     )
 
+    # APPLY-PLAN action
+    parser_plan = subparsers.add_parser(
+        'apply-plan',
+        help="Apply an ordered list of key edits (add, default, rename, remove, lowercase) from a YAML plan,\n"
+             "with one read and at most one write per file."
+    )
+    parser_plan.add_argument(
+        "plan",
+        type=str,
+        metavar="<PLAN.yaml>",
+        help="The plan file: a list of operations, e.g. '- rename: {from: Series, to: series}'."
+    )
+    parser_plan.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only print how many files each operation would change; nothing is written."
+    )
+
+    # CHECK-ALL action
+    subparsers.add_parser(
+        'check-all',
+        help="Run every check (mandatory, SEO, duplicates) in one pass; exits with 1 on issues."
+    )
+
     # CHECK-DUPLICATES action
     subparsers.add_parser(
         'check-duplicates',
         help="Find files with literal (case-insensitive) or conceptual key duplicates."
     )
 
+    # CHECK-UNIQUE action
+    parser_unique = subparsers.add_parser(
+        'check-unique',
+        help=f"Find posts sharing a value ({', '.join(UNIQUE_CHECK_KEYS)}) or a near-duplicate {', '.join(NEAR_DUPLICATE_KEYS)};\n"
+             "exits with 1 on issues."
+    )
+    parser_unique.add_argument(
+        "--threshold",
+        type=float,
+        default=NEAR_DUPLICATE_THRESHOLD,
+        metavar="RATIO",
+        help=f"Minimum similarity (0-1, Jaccard index of word shingles) of near-duplicates (default: {NEAR_DUPLICATE_THRESHOLD}).\n"
+             "Use 0 to only report identical values."
+    )
+
     # NEW: CHECK-MANDATORY action
     subparsers.add_parser(
         'check-mandatory',
         help=f"Verify that all files contain the required keys: {', '.join(MANDATORY_KEYS)}."
     )
 
+    # CHECK-ORDER action
+    subparsers.add_parser(
+        'check-order',
+        help="Report the files whose keys don't follow the standard order, without writing; exits with 1 on issues."
+    )
+
     # CHECK-SEO action (Added to CLI flags)
     subparsers.add_parser(
         'check-seo',
@@ -816,6 +1857,31 @@ def main() -> None:
         help="Comma-separated list of variant keys to remove (e.g., 'Series,serie')."
     )
 
+    # EXPORT action
+    parser_export = subparsers.add_parser(
+        'export',
+        help="Export the front matter of all files to a SQLite database (incremental)."
+    )
+    parser_export.add_argument(
+        "--format",
+        dest="export_format",
+        choices=['sqlite', 'ndjson', 'json'],
+        default='sqlite',
+        help="Output format (default: sqlite). ndjson/json write one record per post on stdout instead of a database."
+    )
+    parser_export.add_argument(
+        "--output", "-o",
+        type=str,
+        default=DEFAULT_DATABASE_PATH,
+        metavar="PATH",
+        help=f"Database file (default: {DEFAULT_DATABASE_PATH})."
+    )
+    parser_export.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Drop the existing tables and export every file again."
+    )
+
     # FIND-MISSING action
     parser_find_missing = subparsers.add_parser(
         'find-missing',
@@ -855,6 +1921,26 @@ def main() -> None:
         metavar="<KEY_TO_CHECK>"
     )
 
+    # QUERY action
+    parser_query = subparsers.add_parser(
+        'query',
+        help="List the posts matching an expression, e.g. 'tags contains docker and date >= 2025-01-01 and not image'."
+    )
+    parser_query.add_argument(
+        "expression",
+        type=str,
+        metavar="<EXPRESSION>",
+        help="Conditions on keys combined with and/or/not and parentheses.\n"
+             "Operators: =, !=, <, <=, >, >=, contains; a key alone tests its presence."
+    )
+    parser_query.add_argument(
+        "--show",
+        type=str,
+        default="",
+        metavar="KEY[,KEY...]",
+        help="Comma-separated keys whose values are printed next to each file (e.g., 'date,tags')."
+    )
+
     # REMOVE-KEY action
     parser_remove = subparsers.add_parser(
         'remove-key',
@@ -872,6 +1958,53 @@ def main() -> None:
         help="Reorder all front matter keys according to the predefined standard."
     )
 
+    # SYNC-DATES action
+    parser_sync_dates = subparsers.add_parser(
+        'sync-dates',
+        help="Insert the missing 'date' keys from the blog/YYYY/MM/DD/ path of each post and report mismatching dates;\n"
+             "exits with 1 when dates are left inconsistent."
+    )
+    parser_sync_dates.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Also replace the dates that don't match the path."
+    )
+    parser_sync_dates.add_argument(
+        "--check",
+        action="store_true",
+        help="Only report the missing and mismatching dates; nothing is written."
+    )
+
+    # WATCH action
+    parser_watch = subparsers.add_parser(
+        'watch',
+        help="Watch the posts and re-run every check on each saved file (Ctrl+C to stop)."
+    )
+    parser_watch.add_argument(
+        "--polling",
+        action="store_true",
+        help="Poll the files instead of using inotify (e.g. for Docker-mounted folders)."
+    )
+    parser_watch.add_argument(
+        "--interval",
+        type=float,
+        default=POLL_INTERVAL_SECONDS,
+        metavar="SECONDS",
+        help=f"Polling interval, when polling (default: {POLL_INTERVAL_SECONDS})."
+    )
+
+    # Machine-readable output for every action (export has its own --format: sqlite, ndjson or json)
+    for name, action_parser in subparsers.choices.items():
+        if name != 'export':
+            action_parser.add_argument(
+                "--format",
+                dest="output_format",
+                choices=OUTPUT_FORMATS,
+                default='text',
+                help="Output format (default: text). ndjson streams one JSON record per finding, then a summary record;\n"
+                     "json writes a single document at the end."
+            )
+
     # Display full help page if no arguments are provided
     if len(sys.argv) == 1:
         parser.print_help()
@@ -880,6 +2013,66 @@ def main() -> None:
     # Parse arguments
     args = parser.parse_args()
 
+    output_format: str = getattr(args, 'output_format', 'text')
+    if args.action == 'export' and args.export_format != 'sqlite':
+        output_format = args.export_format
+
+    with OUTPUT.session(output_format, args.action):
+        _run_main(parser, args)
+
+def _run_main(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Opens the corpus, runs the action and persists the index (within the --format session)."""
+    global _CORPUS, JOBS, CHANGED_FILES
+
+    profile: bool = args.profile or bool(args.profile_dump)
+    if profile:
+        PROFILER.start(cprofile=bool(args.profile_dump))
+
+    with PROFILER.phase('index'):
+        _CORPUS = BlogCorpus(DOCS_DIR, INDEX_PATH, use_cache=not args.no_cache)
+        _CORPUS.load_index()
+    # Worker processes have their own profiler: keep everything in this one when profiling
+    JOBS = 1 if profile else max(1, args.jobs)
+
+    if args.since or args.staged:
+        try:
+            CHANGED_FILES = _CORPUS.changed_since(since=args.since, staged=args.staged)
+        except GitError as e:
+            _exit_with_error(str(e))
+
+    try:
+        _run_action(parser, args)
+    finally:
+        # Persist whatever was (re)parsed during this run
+        with PROFILER.phase('index'):
+            _CORPUS.save()
+        if profile:
+            _print_profile(args.profile_top, args.profile_dump)
+
+def _exit_with_error(message: str) -> NoReturn:
+    """Prints an error (and its 'error' record with --format ndjson/json), then exits with 1."""
+    print(f"{Colors.FAIL}Error: {message}{Colors.ENDC}")
+    OUTPUT.emit('error', message=message)
+    sys.exit(1)
+
+def _print_profile(top: int, dump_path: Optional[str]) -> None:
+    """
+    Prints the --profile report and saves the cProfile statistics when asked.
+    With --format ndjson/json, the report goes to stderr: stdout only holds records.
+    """
+    PROFILER.stop()
+    lines: List[str] = PROFILER.summary_lines(top)
+    with redirect_stdout(sys.stderr) if OUTPUT.enabled else nullcontext():
+        print(f"\n{Colors.HEADER}{Colors.BOLD}--- Profile ---{Colors.ENDC}")
+        print(f"{Colors.BOLD}{lines[0]}{Colors.ENDC}")
+        for line in lines[1:]:
+            print(line)
+        if dump_path:
+            PROFILER.dump_stats(dump_path)
+            print(f"{Colors.OKCYAN}cProfile statistics written to {dump_path}{Colors.ENDC}")
+
+def _run_action(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Dispatches the parsed command line to the matching action."""
     # --- Execute Actions ---
     if args.action == 'reorder':
         reorder_keys()
@@ -912,6 +2105,8 @@ def main() -> None:
                     f"{Colors.WARNING}⚠️ Warning: The default value for '{key}' is an empty string ('').\n"
                     f"Are you sure you want to create an empty key? ({Colors.BOLD}yes/no{Colors.ENDC}{Colors.WARNING}){Colors.ENDC} "
                 )
+                if OUTPUT.enabled:
+                    _exit_with_error(f"an empty default value for '{key}' must be confirmed: run add-key without --format.")
                 user_input: str = input(confirmation_prompt).strip().lower()
                 if user_input not in ('yes', 'y'):
                     print(f"{Colors.OKCYAN}Operation 'add-key' cancelled by user.{Colors.ENDC}")
@@ -920,8 +2115,7 @@ def main() -> None:
             add_missing_key(key, default_value_str)
 
         except (ValueError, EOFError) as e:
-            print(f"{Colors.FAIL}Error: {e}{Colors.ENDC}")
-            sys.exit(1)
+            _exit_with_error(str(e))
 
     elif args.action == 'remove-key':
         remove_key(args.key)
@@ -931,8 +2125,7 @@ def main() -> None:
         variants_to_remove: List[str] = [v.strip() for v in args.variants.split(',')]
 
         if not target_key or not variants_to_remove:
-            print(f"{Colors.FAIL}Error: Both target_key and variants_to_remove must be specified.{Colors.ENDC}")
-            sys.exit(1)
+            _exit_with_error("Both target_key and variants_to_remove must be specified.")
 
         # Ensure the target key isn't included in the list of keys to remove
         variants_to_remove = [v for v in variants_to_remove if v != target_key]
@@ -943,9 +2136,50 @@ def main() -> None:
 
         cleanup_key_variants(target_key, variants_to_remove)
 
+    elif args.action == 'apply-plan':
+        try:
+            plan: EditPlan = load_plan(args.plan)
+        except PlanError as e:
+            _exit_with_error(f"invalid plan: {e}")
+        apply_plan(plan, args.dry_run)
+
     elif args.action == 'check-duplicates':
         check_duplicates()
 
+    elif args.action == 'check-all':
+        if check_all() > 0:
+            sys.exit(1)
+
+    elif args.action == 'check-unique':
+        if not 0 <= args.threshold <= 1:
+            _exit_with_error("--threshold must be between 0 and 1.")
+        if check_unique(args.threshold) > 0:
+            sys.exit(1)
+
+    elif args.action == 'check-order':
+        if check_order() > 0:
+            sys.exit(1)
+
+    elif args.action == 'export':
+        if args.export_format == 'sqlite':
+            export_sqlite(args.output, rebuild=args.rebuild)
+        else:
+            export_records()
+
+    elif args.action == 'query':
+        show_keys: List[str] = [k.strip() for k in args.show.split(',') if k.strip()]
+        try:
+            query_posts(args.expression, show_keys)
+        except QueryError as e:
+            _exit_with_error(f"invalid query: {e}")
+
+    elif args.action == 'sync-dates':
+        if sync_dates(overwrite=args.overwrite, check_only=args.check) > 0:
+            sys.exit(1)
+
+    elif args.action == 'watch':
+        watch(args.interval, args.polling)
+
     else:
         # Fallback in case a subparser was defined but not handled in the if/elif block
         parser.print_help()